@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Brazilian Soccer Knowledge Graph - Optional Cython Build
+
+This script compiles the hot pure-Python modules to C extensions in place:
+1. src/models.py (Pydantic models built for every tool response)
+2. src/tools/*.py (query and response building for each MCP tool)
+
+Context:
+- No source changes are needed; the compiled modules shadow the .py files
+  because Python prefers an extension module over source in the same package
+- Annotations are left as Python objects (annotation_typing off) so Pydantic
+  still sees the declared field types, and functions stay introspectable
+  (binding on) for signature-based tool validation
+- Delete the generated .so/.c files to go back to pure Python
+
+Usage:
+    pip install cython
+    python scripts/build_extensions.py
+
+    # Verify
+    python -c "import src.models; print(src.models.__file__.endswith('.so'))"
+
+Author: Hive Mind Collective Intelligence System
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "src/models.py",
+    "src/tools/*.py",
+]
+
+EXCLUDE = [
+    "src/tools/__init__.py",
+]
+
+
+def main():
+    os.chdir(PROJECT_ROOT)
+    setup(
+        name="brazilian-soccer-mcp-extensions",
+        ext_modules=cythonize(
+            MODULES,
+            exclude=EXCLUDE,
+            compiler_directives={
+                "language_level": 3,
+                "annotation_typing": False,
+                "binding": True,
+            },
+        ),
+        script_args=["build_ext", "--inplace"] + sys.argv[1:],
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
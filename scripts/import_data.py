@@ -7,32 +7,185 @@ This script initializes the Neo4j database with:
 2. Sample data from docs/sample-data.json
 
 Context:
-- Connects to Neo4j at bolt://localhost:7687
-- Database: brazil-kg
-- Credentials: neo4j/password
+- Connects through src.database.Neo4jConnection using src.config settings
+  (defaults: bolt://localhost:7687, database brazil-kg, neo4j/password)
 - Creates complete graph structure for testing
+- Independent batches are submitted concurrently on the async driver
+- With ijson installed, record arrays are streamed from the file batch by
+  batch instead of parsing the whole document up front
 
 Author: Hive Mind Collective Intelligence System
 """
 
+import asyncio
 import json
+import mmap
 import sys
+from itertools import islice
 from pathlib import Path
-from neo4j import GraphDatabase
 from datetime import datetime
 
-# Neo4j connection configuration
-NEO4J_URI = "bolt://localhost:7687"
-NEO4J_USER = "neo4j"
-NEO4J_PASSWORD = "password"
-NEO4J_DATABASE = "brazil-kg"
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: falls back to parsing the whole file
+    ijson = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_DATA_FILE = PROJECT_ROOT / "docs" / "sample-data.json"
+
+# Make the src package importable when run as `python scripts/import_data.py`
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from neo4j import Query
+from neo4j.exceptions import ClientError
+
+from src.config import settings
+from src.database import Neo4jConnection
+
+# Schema, keyed by label. Each property gets its own constraint or index.
+UNIQUE_KEYS = {
+    "Player": ["player_id"],
+    "Team": ["team_id"],
+    "Match": ["match_id"],
+    "Competition": ["competition_id"],
+    "Stadium": ["stadium_id"],
+    "Coach": ["coach_id"],
+}
+
+REQUIRED_PROPERTIES = {
+    "Player": ["name"],
+    "Team": ["name"],
+    "Match": ["date"],
+}
+
+INDEXED_PROPERTIES = {
+    "Player": ["name", "position"],
+    "Team": ["name", "city"],
+    "Match": ["date", "round", "home_team_id", "away_team_id"],
+    "Competition": ["season"],
+    "Stadium": ["name"],
+    "Coach": ["name"],
+}
+
+# Composite indexes, for lookups that always supply all of the properties
+COMPOSITE_INDEXES = {
+    "Match": [("home_team_id", "away_team_id")],
+}
+
+# Text indexes back CONTAINS searches on these properties
+TEXT_INDEXED_PROPERTIES = {
+    "Player": ["name"],
+    "Team": ["name"],
+    "Competition": ["name"],
+}
+
+# Import statements are fixed strings so the server compiles each plan once
+# and reuses it for every batch. Nodes MERGE on the unique key enforced in
+# initialize_schema and relationships on their endpoints plus identifying
+# properties, so re-running the import updates the graph instead of
+# duplicating it.
+STADIUM_UNWIND = """
+UNWIND $rows AS row
+MERGE (n:Stadium {stadium_id: row.stadium_id})
+SET n += {name: row.name, city: row.city, state: row.state,
+          capacity: row.capacity, opened_year: row.opened_year}
+"""
+
+TEAM_UNWIND = """
+UNWIND $rows AS row
+MERGE (n:Team {team_id: row.team_id})
+SET n += {name: row.name, short_name: row.short_name, city: row.city,
+          state: row.state, founded_year: row.founded_year,
+          stadium_name: row.stadium_name, colors: row.colors}
+"""
+
+COMPETITION_UNWIND = """
+UNWIND $rows AS row
+MERGE (n:Competition {competition_id: row.competition_id})
+SET n += {name: row.name, season: row.season, type: row.type, tier: row.tier}
+"""
+
+PLAYER_UNWIND = """
+UNWIND $rows AS row
+MERGE (n:Player {player_id: row.player_id})
+SET n += {name: row.name, birth_date: row.birth_date, nationality: row.nationality,
+          position: row.position, jersey_number: row.jersey_number}
+"""
+
+MATCH_UNWIND = """
+UNWIND $rows AS row
+MERGE (n:Match {match_id: row.match_id})
+SET n += {date: row.date, home_score: row.home_score, away_score: row.away_score,
+          attendance: row.attendance, match_status: row.match_status}
+"""
+
+# A stint is identified by its start date; rows without one update the
+# player's stint at that team
+PLAYS_FOR_UNWIND = """
+UNWIND $rows AS row
+MATCH (p:Player {player_id: row.player_id})
+MATCH (t:Team {team_id: row.team_id})
+FOREACH (_ IN CASE WHEN row.from_date IS NOT NULL THEN [1] ELSE [] END |
+    MERGE (p)-[r:PLAYS_FOR {from_date: row.from_date}]->(t)
+    SET r.to_date = row.to_date, r.jersey_number = row.jersey_number
+)
+FOREACH (_ IN CASE WHEN row.from_date IS NULL THEN [1] ELSE [] END |
+    MERGE (p)-[r:PLAYS_FOR]->(t)
+    SET r.to_date = row.to_date, r.jersey_number = row.jersey_number
+)
+"""
+
+COMPETED_IN_UNWIND = """
+UNWIND $rows AS row
+MATCH (t:Team {team_id: row.team_id})
+MATCH (m:Match {match_id: row.match_id})
+MERGE (t)-[r:COMPETED_IN]->(m)
+SET r.side = row.side
+"""
+
+PART_OF_UNWIND = """
+UNWIND $rows AS row
+MATCH (m:Match {match_id: row.match_id})
+MATCH (c:Competition {competition_id: row.competition_id})
+MERGE (m)-[:PART_OF]->(c)
+"""
+
+PLAYED_AT_UNWIND = """
+UNWIND $rows AS row
+MATCH (m:Match {match_id: row.match_id})
+MATCH (s:Stadium {stadium_id: row.stadium_id})
+MERGE (m)-[:PLAYED_AT]->(s)
+"""
+
+# A goal is identified by its scorer, match and minute; the player's goal
+# total only counts goals created by this run
+SCORED_IN_UNWIND = """
+UNWIND $rows AS row
+MATCH (p:Player {player_id: row.player_id})
+MATCH (m:Match {match_id: row.match_id})
+MERGE (p)-[s:SCORED_IN {minute: row.minute}]->(m)
+ON CREATE SET s.goal_type = row.goal_type,
+              p.total_goals = coalesce(p.total_goals, 0) + 1
+ON MATCH SET s.goal_type = row.goal_type
+"""
+
+
+def batched(iterable, n):
+    """Yield successive lists of at most n items from iterable"""
+    it = iter(iterable)
+    while chunk := list(islice(it, n)):
+        yield chunk
+
 
 class DataImporter:
     def __init__(self):
-        self.driver = GraphDatabase.driver(
-            NEO4J_URI,
-            auth=(NEO4J_USER, NEO4J_PASSWORD)
-        )
+        self.db = Neo4jConnection()
+        self._data = None
         self.stats = {
             "constraints": 0,
             "indexes": 0,
@@ -41,279 +194,255 @@ class DataImporter:
             "errors": []
         }
 
-    def close(self):
-        self.driver.close()
+    async def close(self):
+        await self.db.close()
 
-    def execute_query(self, query, params=None):
+    async def execute_query(self, query, params=None):
         """Execute a single query"""
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            try:
-                result = session.run(query, params or {})
-                return result
-            except Exception as e:
-                error_msg = f"Query failed: {str(e)[:100]}"
-                self.stats["errors"].append(error_msg)
-                print(f"  ⚠️  {error_msg}")
-                return None
-
-    def initialize_schema(self):
+        try:
+            return await self.db.execute_query(query, params)
+        except Exception as e:
+            error_msg = f"Query failed: {str(e)[:100]}"
+            self.stats["errors"].append(error_msg)
+            print(f"  ⚠️  {error_msg}")
+            return None
+
+    async def execute_write(self, query, params=None):
+        """Execute a write query as one explicit transaction"""
+        try:
+            return await self.db.execute_write(query, params)
+        except Exception as e:
+            error_msg = f"Write failed: {str(e)[:100]}"
+            self.stats["errors"].append(error_msg)
+            print(f"  ⚠️  {error_msg}")
+            return None
+
+    async def assert_schema_with_apoc(self):
+        """
+        Create unique constraints and indexes with one apoc.schema.assert call.
+
+        Existing schema is kept (dropExisting is false). Returns False when
+        the call fails, e.g. APOC is not installed, so the caller can fall
+        back to plain DDL statements.
+        """
+        try:
+            async with self.db.session() as session:
+                result = await session.run(
+                    "CALL apoc.schema.assert($indexes, $constraints, false)",
+                    {"indexes": INDEXED_PROPERTIES, "constraints": UNIQUE_KEYS}
+                )
+                rows = await result.data()
+        except ClientError as e:
+            print(f"  ℹ️  apoc.schema.assert unavailable, using DDL statements ({e.code})")
+            return False
+
+        for row in rows:
+            self.stats["constraints" if row["unique"] else "indexes"] += 1
+        print(f"  ✓ {len(rows)} unique constraints and indexes asserted via APOC")
+        return True
+
+    async def initialize_schema(self):
         """Create constraints and indexes"""
         print("\n📐 Initializing Schema...")
         print("=" * 60)
 
-        # Constraints
+        # APOC cannot express property existence constraints, so those are
+        # always issued as DDL
         constraints = [
-            "CREATE CONSTRAINT player_id_unique IF NOT EXISTS FOR (p:Player) REQUIRE p.player_id IS UNIQUE",
-            "CREATE CONSTRAINT player_name_required IF NOT EXISTS FOR (p:Player) REQUIRE p.name IS NOT NULL",
-            "CREATE CONSTRAINT team_id_unique IF NOT EXISTS FOR (t:Team) REQUIRE t.team_id IS UNIQUE",
-            "CREATE CONSTRAINT team_name_required IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS NOT NULL",
-            "CREATE CONSTRAINT match_id_unique IF NOT EXISTS FOR (m:Match) REQUIRE m.match_id IS UNIQUE",
-            "CREATE CONSTRAINT match_date_required IF NOT EXISTS FOR (m:Match) REQUIRE m.date IS NOT NULL",
-            "CREATE CONSTRAINT competition_id_unique IF NOT EXISTS FOR (c:Competition) REQUIRE c.competition_id IS UNIQUE",
-            "CREATE CONSTRAINT stadium_id_unique IF NOT EXISTS FOR (s:Stadium) REQUIRE s.stadium_id IS UNIQUE",
-            "CREATE CONSTRAINT coach_id_unique IF NOT EXISTS FOR (co:Coach) REQUIRE co.coach_id IS UNIQUE",
+            f"CREATE CONSTRAINT {label.lower()}_{prop}_required IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.{prop} IS NOT NULL"
+            for label, props in REQUIRED_PROPERTIES.items() for prop in props
         ]
-
-        print(f"\nCreating {len(constraints)} constraints...")
-        for constraint in constraints:
-            result = self.execute_query(constraint)
-            if result is not None:
-                self.stats["constraints"] += 1
-                print("  ✓ Constraint created")
-
-        # Indexes
+        # apoc.schema.assert only creates single-property range indexes, so
+        # composite and text indexes are always issued as DDL as well
         indexes = [
-            "CREATE INDEX player_name_index IF NOT EXISTS FOR (p:Player) ON (p.name)",
-            "CREATE INDEX player_position_index IF NOT EXISTS FOR (p:Player) ON (p.position)",
-            "CREATE INDEX team_name_index IF NOT EXISTS FOR (t:Team) ON (t.name)",
-            "CREATE INDEX team_city_index IF NOT EXISTS FOR (t:Team) ON (t.city)",
-            "CREATE INDEX match_date_index IF NOT EXISTS FOR (m:Match) ON (m.date)",
-            "CREATE INDEX competition_season_index IF NOT EXISTS FOR (c:Competition) ON (c.season)",
-            "CREATE INDEX stadium_name_index IF NOT EXISTS FOR (s:Stadium) ON (s.name)",
-            "CREATE INDEX coach_name_index IF NOT EXISTS FOR (co:Coach) ON (co.name)",
+            f"CREATE INDEX {label.lower()}_{'_'.join(props)}_index IF NOT EXISTS "
+            f"FOR (n:{label}) ON ({', '.join(f'n.{prop}' for prop in props)})"
+            for label, groups in COMPOSITE_INDEXES.items() for props in groups
+        ] + [
+            f"CREATE TEXT INDEX {label.lower()}_{prop}_text_index IF NOT EXISTS "
+            f"FOR (n:{label}) ON (n.{prop})"
+            for label, props in TEXT_INDEXED_PROPERTIES.items() for prop in props
         ]
 
-        print(f"\nCreating {len(indexes)} indexes...")
-        for index in indexes:
-            result = self.execute_query(index)
-            if result is not None:
-                self.stats["indexes"] += 1
-                print("  ✓ Index created")
+        if not await self.assert_schema_with_apoc():
+            constraints += [
+                f"CREATE CONSTRAINT {prop}_unique IF NOT EXISTS "
+                f"FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+                for label, props in UNIQUE_KEYS.items() for prop in props
+            ]
+            indexes += [
+                f"CREATE INDEX {label.lower()}_{prop}_index IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.{prop})"
+                for label, props in INDEXED_PROPERTIES.items() for prop in props
+            ]
+
+        # Constraints first (they create backing indexes), each group in parallel
+        print(f"\nCreating {len(constraints)} constraints...")
+        results = await asyncio.gather(*(self.execute_write(q) for q in constraints))
+        created = sum(result is not None for result in results)
+        self.stats["constraints"] += created
+        print(f"  ✓ {created} constraints created")
+
+        if indexes:
+            print(f"\nCreating {len(indexes)} indexes...")
+            results = await asyncio.gather(*(self.execute_write(q) for q in indexes))
+            created = sum(result is not None for result in results)
+            self.stats["indexes"] += created
+            print(f"  ✓ {created} indexes created")
 
         print(f"\n✅ Schema initialized: {self.stats['constraints']} constraints, {self.stats['indexes']} indexes")
 
-    def import_sample_data(self):
-        """Import sample data from JSON file"""
-        print("\n📦 Importing Sample Data...")
-        print("=" * 60)
-
-        data_file = Path("/workspaces/brazil-bench-hive/docs/sample-data.json")
+    async def bulk_create(self, label, cypher, rows):
+        """
+        Upsert all nodes of one label with one of the *_UNWIND statements.
+
+        Rows are sent in import_batch_size chunks, one transaction each, to
+        keep transaction state bounded. One Query object is shared by all
+        chunks of the label.
+        """
+        query = Query(cypher, timeout=settings.query_timeout)
+        total = created = 0
+        for chunk in batched(rows, settings.import_batch_size):
+            total += len(chunk)
+            counts = await self.execute_write(query, {"rows": chunk})
+            if counts:
+                created += counts["nodes_created"]
+        if not total:
+            return None
+        self.stats["nodes"] += created
+        print(f"  ✓ {created} {label} nodes created ({total} rows)")
+        return created
+
+    def load_data(self):
+        """Read and parse the sample data file once for the whole import"""
+        data_file = SAMPLE_DATA_FILE
         if not data_file.exists():
             print("❌ Sample data file not found!")
+            raise FileNotFoundError(data_file)
+
+        if ijson:
+            # Records are streamed per array by records(); nothing to parse yet
+            return
+
+        # Parse straight from the mapped pages; orjson takes the buffer
+        # without copying, the stdlib parser needs a bytes object
+        with open(data_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson:
+                with memoryview(mm) as view:
+                    self._data = orjson.loads(view)
+            else:
+                self._data = json.loads(mm[:])
+
+    def records(self, path):
+        """
+        Iterate the items of one array in the sample data, e.g. "stadiums"
+        or "relationships.goals". With ijson the array is streamed from the
+        file, so memory use is bounded by the batch size.
+        """
+        if self._data is None:
+            with open(SAMPLE_DATA_FILE, 'rb') as f:
+                yield from ijson.items(f, f"{path}.item", use_float=True)
             return
 
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Import stadiums
-        print(f"\nImporting {len(data.get('stadiums', []))} stadiums...")
-        for stadium in data.get('stadiums', []):
-            query = """
-            CREATE (s:Stadium {
-                stadium_id: $stadium_id,
-                name: $name,
-                city: $city,
-                state: $state,
-                capacity: $capacity,
-                opened_year: $opened_year
-            })
-            """
-            self.execute_query(query, stadium)
-            self.stats["nodes"] += 1
-            print(f"  ✓ {stadium['name']}")
-
-        # Import teams
-        print(f"\nImporting {len(data.get('teams', []))} teams...")
-        for team in data.get('teams', []):
-            query = """
-            CREATE (t:Team {
-                team_id: $team_id,
-                name: $name,
-                short_name: $short_name,
-                city: $city,
-                state: $state,
-                founded_year: $founded_year,
-                stadium_name: $stadium_name,
-                colors: $colors
-            })
-            """
-            self.execute_query(query, team)
-            self.stats["nodes"] += 1
-            print(f"  ✓ {team['name']}")
-
-        # Import competitions
-        print(f"\nImporting {len(data.get('competitions', []))} competitions...")
-        for comp in data.get('competitions', []):
-            query = """
-            CREATE (c:Competition {
-                competition_id: $competition_id,
-                name: $name,
-                season: $season,
-                type: $type,
-                tier: $tier
-            })
-            """
-            self.execute_query(query, comp)
-            self.stats["nodes"] += 1
-            print(f"  ✓ {comp['name']} {comp['season']}")
-
-        # Import players
-        print(f"\nImporting {len(data.get('players', []))} players...")
-        for player in data.get('players', []):
-            query = """
-            CREATE (p:Player {
-                player_id: $player_id,
-                name: $name,
-                birth_date: $birth_date,
-                nationality: $nationality,
-                position: $position,
-                jersey_number: $jersey_number
-            })
-            """
-            self.execute_query(query, player)
-            self.stats["nodes"] += 1
-            print(f"  ✓ {player['name']}")
-
-        # Import matches
-        print(f"\nImporting {len(data.get('matches', []))} matches...")
-        for match in data.get('matches', []):
-            query = """
-            CREATE (m:Match {
-                match_id: $match_id,
-                date: $date,
-                home_score: $home_score,
-                away_score: $away_score,
-                attendance: $attendance,
-                match_status: $match_status
-            })
-            """
-            self.execute_query(query, match)
-            self.stats["nodes"] += 1
-            print(f"  ✓ Match {match['match_id']}")
+        node = self._data
+        for key in path.split('.'):
+            node = node.get(key) or {}
+        yield from node or []
+
+    async def import_sample_data(self):
+        """Import sample data from the data file"""
+        print("\n📦 Importing Sample Data...")
+        print("=" * 60)
+
+        print("\nImporting stadiums, teams, competitions, players, matches...")
+
+        # Node labels do not depend on each other, so submit them concurrently
+        await asyncio.gather(
+            self.bulk_create("Stadium", STADIUM_UNWIND, self.records('stadiums')),
+            self.bulk_create("Team", TEAM_UNWIND, self.records('teams')),
+            self.bulk_create("Competition", COMPETITION_UNWIND, self.records('competitions')),
+            self.bulk_create("Player", PLAYER_UNWIND, self.records('players')),
+            self.bulk_create("Match", MATCH_UNWIND, self.records('matches')),
+        )
 
         print(f"\n✅ Imported {self.stats['nodes']} nodes")
 
-    def create_relationships(self):
+    async def bulk_rel(self, rel_type, rel_cypher, rows):
+        """Upsert all relationships of one type in chunked UNWIND queries"""
+        query = Query(rel_cypher, timeout=settings.query_timeout)
+        total = created = 0
+        for chunk in batched(rows, settings.import_batch_size):
+            total += len(chunk)
+            counts = await self.execute_write(query, {"rows": chunk})
+            if counts:
+                created += counts["relationships_created"]
+        if not total:
+            return None
+        self.stats["relationships"] += created
+        print(f"  ✓ {created} {rel_type} relationships created ({total} rows)")
+        return created
+
+    async def create_relationships(self):
         """Create relationships between entities"""
         print("\n🔗 Creating Relationships...")
         print("=" * 60)
 
-        data_file = Path("/workspaces/brazil-bench-hive/docs/sample-data.json")
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # PLAYS_FOR relationships
-        print("\nCreating PLAYS_FOR relationships...")
-        for rel in data.get('relationships', {}).get('plays_for', []):
-            query = """
-            MATCH (p:Player {player_id: $player_id})
-            MATCH (t:Team {team_id: $team_id})
-            CREATE (p)-[:PLAYS_FOR {
-                from_date: $from_date,
-                to_date: $to_date,
-                jersey_number: $jersey_number
-            }]->(t)
-            """
-            self.execute_query(query, rel)
-            self.stats["relationships"] += 1
-            print(f"  ✓ Player → Team")
-
-        # COMPETED_IN relationships for matches
-        print("\nCreating COMPETED_IN relationships...")
-        for rel in data.get('relationships', {}).get('match_teams', []):
-            query = """
-            MATCH (t:Team {team_id: $team_id})
-            MATCH (m:Match {match_id: $match_id})
-            CREATE (t)-[:COMPETED_IN {
-                side: $side
-            }]->(m)
-            """
-            self.execute_query(query, rel)
-            self.stats["relationships"] += 1
-            print(f"  ✓ Team → Match ({rel['side']})")
-
-        # PART_OF relationships (match → competition)
-        print("\nCreating PART_OF relationships...")
-        for rel in data.get('relationships', {}).get('match_competitions', []):
-            query = """
-            MATCH (m:Match {match_id: $match_id})
-            MATCH (c:Competition {competition_id: $competition_id})
-            CREATE (m)-[:PART_OF]->(c)
-            """
-            self.execute_query(query, rel)
-            self.stats["relationships"] += 1
-            print(f"  ✓ Match → Competition")
-
-        # PLAYED_AT relationships
-        print("\nCreating PLAYED_AT relationships...")
-        for rel in data.get('relationships', {}).get('match_stadiums', []):
-            query = """
-            MATCH (m:Match {match_id: $match_id})
-            MATCH (s:Stadium {stadium_id: $stadium_id})
-            CREATE (m)-[:PLAYED_AT]->(s)
-            """
-            self.execute_query(query, rel)
-            self.stats["relationships"] += 1
-            print(f"  ✓ Match → Stadium")
-
-        # SCORED_IN relationships
-        print("\nCreating SCORED_IN relationships...")
-        for rel in data.get('relationships', {}).get('goals', []):
-            query = """
-            MATCH (p:Player {player_id: $player_id})
-            MATCH (m:Match {match_id: $match_id})
-            CREATE (p)-[:SCORED_IN {
-                minute: $minute,
-                goal_type: $goal_type
-            }]->(m)
-            """
-            self.execute_query(query, rel)
-            self.stats["relationships"] += 1
-            print(f"  ✓ Player → Match (goal)")
+        plays_for = self.records('relationships.plays_for')
+        match_teams = self.records('relationships.match_teams')
+        match_competitions = self.records('relationships.match_competitions')
+        match_stadiums = self.records('relationships.match_stadiums')
+        goals = self.records('relationships.goals')
+
+        print("\nCreating PLAYS_FOR, COMPETED_IN, PART_OF, PLAYED_AT, "
+              "SCORED_IN relationships...")
+
+        # All endpoint nodes exist by now; relationship types are independent
+        await asyncio.gather(
+            self.bulk_rel("PLAYS_FOR", PLAYS_FOR_UNWIND, plays_for),
+            self.bulk_rel("COMPETED_IN", COMPETED_IN_UNWIND, match_teams),
+            self.bulk_rel("PART_OF", PART_OF_UNWIND, match_competitions),
+            self.bulk_rel("PLAYED_AT", PLAYED_AT_UNWIND, match_stadiums),
+            self.bulk_rel("SCORED_IN", SCORED_IN_UNWIND, goals),
+        )
 
         print(f"\n✅ Created {self.stats['relationships']} relationships")
 
-    def verify_import(self):
+    async def verify_import(self):
         """Verify the import was successful"""
         print("\n🔍 Verifying Import...")
         print("=" * 60)
 
-        queries = {
-            "Players": "MATCH (p:Player) RETURN count(p) as count",
-            "Teams": "MATCH (t:Team) RETURN count(t) as count",
-            "Matches": "MATCH (m:Match) RETURN count(m) as count",
-            "Competitions": "MATCH (c:Competition) RETURN count(c) as count",
-            "Stadiums": "MATCH (s:Stadium) RETURN count(s) as count",
-            "Relationships": "MATCH ()-[r]->() RETURN count(r) as count",
-        }
-
-        for label, query in queries.items():
-            result = self.execute_query(query)
-            if result:
-                count = result.single()["count"]
+        # All counts in one round-trip; each subquery is a count-store lookup
+        query = """
+        CALL { MATCH (p:Player) RETURN count(p) AS Players }
+        CALL { MATCH (t:Team) RETURN count(t) AS Teams }
+        CALL { MATCH (m:Match) RETURN count(m) AS Matches }
+        CALL { MATCH (c:Competition) RETURN count(c) AS Competitions }
+        CALL { MATCH (s:Stadium) RETURN count(s) AS Stadiums }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS Relationships }
+        RETURN Players, Teams, Matches, Competitions, Stadiums, Relationships
+        """
+
+        result = await self.execute_query(query)
+        if result:
+            for label, count in result[0].items():
                 print(f"  ✓ {label}: {count}")
 
-    def run(self):
+    async def run(self):
         """Execute full import process"""
         print("\n" + "=" * 60)
         print("🇧🇷 Brazilian Soccer Knowledge Graph - Data Import")
         print("=" * 60)
 
         try:
-            self.initialize_schema()
-            self.import_sample_data()
-            self.create_relationships()
-            self.verify_import()
+            self.load_data()
+            await self.db.connect()
+            await self.initialize_schema()
+            await self.import_sample_data()
+            await self.create_relationships()
+            await self.verify_import()
 
             print("\n" + "=" * 60)
             print("✅ IMPORT COMPLETED SUCCESSFULLY!")
@@ -333,8 +462,9 @@ class DataImporter:
             print(f"\n❌ Import failed: {e}")
             return 1
         finally:
-            self.close()
+            await self.close()
 
 if __name__ == "__main__":
+    settings.configure_logging()
     importer = DataImporter()
-    sys.exit(importer.run())
+    sys.exit(asyncio.run(importer.run()))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Brazilian Soccer Knowledge Graph - Statistics Snapshot Refresh
+
+This script rebuilds the pre-aggregated statistics nodes read by the
+player and team stats and competition standings tools:
+1. (:PlayerStatsSnapshot) per player and season
+2. (:TeamStatsSnapshot) per team and season
+3. (:StandingsSnapshot) per competition, season and team
+4. Player.total_goals, the denormalized goal count
+
+Context:
+- Intended to run on a schedule (e.g. nightly cron) after data changes
+- Must also run after any write outside scripts/import_data.py (direct
+  Cypher, test fixtures, older imports): only the importer keeps
+  Player.total_goals current, and there is no trigger to update it
+- Connects through src.database.Neo4jConnection using src.config settings
+- Tools fall back to live aggregation until the first refresh has run
+
+Usage:
+    python scripts/refresh_stats.py
+
+Author: Hive Mind Collective Intelligence System
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Make the src package importable when run as `python scripts/refresh_stats.py`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import settings
+from src.database import Neo4jConnection
+from src.snapshots import refresh_stats_snapshots
+
+
+async def run():
+    """Refresh all statistics snapshots"""
+    print("\n📊 Refreshing statistics snapshots...")
+    print("=" * 60)
+
+    db = Neo4jConnection()
+    try:
+        await db.connect()
+        counts = await refresh_stats_snapshots(db)
+        print(f"  ✓ Player snapshots: {counts['players']['nodes_created']} created, "
+              f"{counts['players']['properties_set']} properties set")
+        print(f"  ✓ Team snapshots: {counts['teams']['nodes_created']} created, "
+              f"{counts['teams']['properties_set']} properties set")
+        print(f"  ✓ Standings snapshots: {counts['standings']['nodes_created']} created, "
+              f"{counts['standings']['properties_set']} properties set")
+        print("\n✅ Snapshots refreshed")
+        return 0
+
+    except Exception as e:
+        print(f"\n❌ Snapshot refresh failed: {e}")
+        return 1
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    settings.configure_logging()
+    sys.exit(asyncio.run(run()))
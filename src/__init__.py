@@ -24,13 +24,21 @@ __version__ = "1.0.0"
 __author__ = "Brazilian Soccer MCP Team"
 __license__ = "MIT"
 
-from src.config import settings
+from src.config import get_settings
 from src.database import get_db, Neo4jConnection
 from src import models
 
 __all__ = [
     "settings",
+    "get_settings",
     "get_db",
     "Neo4jConnection",
     "models",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve `settings` lazily, like src.config does."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
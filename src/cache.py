@@ -0,0 +1,147 @@
+"""
+Brazilian Soccer MCP Server - Result Caching
+
+CONTEXT:
+This module provides an in-process cache for read-mostly tool queries.
+Soccer data barely changes within a season, and clients (autocomplete UIs,
+agents re-asking the same question) repeat the same arguments, so tool
+results are kept in memory. Cached entries expire after a TTL and the least
+recently used entries are evicted beyond maxsize.
+
+Concurrent calls with the same arguments are coalesced (single-flight):
+the first caller runs the query and the others await the same result, so
+a burst of identical requests costs one database round-trip.
+
+Every caller gets its own deep copy of the cached result, so a caller
+that modifies the dicts or lists it receives cannot change what later
+callers see.
+
+Caching is controlled by settings.enable_cache and settings.cache_ttl
+(NEO4J_ENABLE_CACHE / NEO4J_CACHE_TTL).
+
+DEPENDENCIES:
+- src.config: Cache settings
+
+USAGE:
+    from src.cache import async_ttl_cache
+
+    @async_ttl_cache(maxsize=2048)
+    async def search_player(name, team=None, position=None, limit=10):
+        ...
+
+    # Drop cached results after a data refresh
+    search_player.cache_clear()     # one function
+    clear_caches()                  # every cached function
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# cache_clear of every cached function, for clear_caches()
+_cache_clears: List[Callable[[], None]] = []
+
+
+def _freeze(value: Any) -> Any:
+    """Make an argument usable in a cache key (dicts/lists by JSON value)."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def async_ttl_cache(
+    maxsize: int = 1024,
+    ttl: Optional[int] = None,
+    key: Optional[Callable[..., Hashable]] = None
+) -> Callable:
+    """
+    Cache the results of an async function by its bound arguments.
+
+    Positional and keyword calls with the same values share one entry,
+    since arguments are normalized against the function signature
+    (defaults applied) before building the key. Calls that fail are not
+    cached, and callers receive copies of the cached result.
+
+    Args:
+        maxsize: Maximum number of cached results (LRU eviction beyond it)
+        ttl: Entry lifetime in seconds (default: settings.cache_ttl)
+        key: Optional function taking the bound arguments (as keywords) and
+            returning the cache key, for arguments where different values
+            mean the same query
+
+    Returns:
+        Decorator adding the cache; the wrapper exposes cache_clear()
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        in_flight: Dict[Any, asyncio.Task] = {}
+        # Bumped by cache_clear(); results of calls started before the
+        # latest clear are returned to their callers but never stored
+        generation = 0
+
+        def store(cache_key: Any, started: int, task: asyncio.Task) -> None:
+            if in_flight.get(cache_key) is task:
+                del in_flight[cache_key]
+            if started != generation or task.cancelled() or task.exception() is not None:
+                return
+            entries[cache_key] = (time.monotonic() + (ttl or get_settings().cache_ttl), task.result())
+            entries.move_to_end(cache_key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not get_settings().enable_cache:
+                return await fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if key is not None:
+                cache_key = key(**bound.arguments)
+            else:
+                cache_key = tuple((name, _freeze(value)) for name, value in bound.arguments.items())
+
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                entries.move_to_end(cache_key)
+                logger.debug("Cache hit: %s", fn.__qualname__)
+                return copy.deepcopy(entry[1])
+            logger.debug("Cache miss: %s", fn.__qualname__)
+
+            task = in_flight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                in_flight[cache_key] = task
+                task.add_done_callback(functools.partial(store, cache_key, generation))
+
+            # Shielded so one caller cancelling does not cancel the others
+            return copy.deepcopy(await asyncio.shield(task))
+
+        def cache_clear() -> None:
+            nonlocal generation
+            generation += 1
+            entries.clear()
+            in_flight.clear()
+
+        wrapper.cache_clear = cache_clear
+        _cache_clears.append(cache_clear)
+        return wrapper
+
+    return decorator
+
+
+def clear_caches() -> None:
+    """Drop the cached results of every async_ttl_cache function."""
+    for cache_clear in _cache_clears:
+        cache_clear()
@@ -16,19 +16,29 @@ DEPENDENCIES:
 - pydantic-settings: Environment variable loading
 - python-dotenv: .env file support
 
+Settings are built lazily on first access and cached, and logging is only
+configured by entry points (server main, import script), so importing this
+module stays cheap.
+
 USAGE:
     from src.config import settings
 
     # Access configuration
     print(settings.neo4j_uri)
     print(settings.neo4j_database)
+
+    # Entry points configure logging once at startup
+    settings.configure_logging()
 """
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import List, Optional
+from functools import lru_cache
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 class Settings(BaseSettings):
     """
@@ -56,6 +66,30 @@ class Settings(BaseSettings):
         description="Neo4j database name (knowledge graph)"
     )
 
+    # Connection Pool Configuration
+    max_connection_pool_size: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum pooled connections shared by concurrent tool calls"
+    )
+    min_connection_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Pooled connections opened at connect time (0: open on demand)"
+    )
+    connection_acquisition_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for a free pooled connection"
+    )
+    max_connection_lifetime: int = Field(
+        default=300,
+        description="Seconds before a pooled connection is retired"
+    )
+    keep_alive: bool = Field(
+        default=True,
+        description="Enable TCP keep-alive on pooled connections"
+    )
+
     # Server Configuration
     server_name: str = Field(
         default="brazilian-soccer-mcp",
@@ -75,16 +109,29 @@ class Settings(BaseSettings):
         default=30,
         description="Query timeout in seconds"
     )
+    import_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Rows per UNWIND transaction when importing data"
+    )
 
-    # Cache Configuration (for future enhancement)
+    # Cache Configuration
     enable_cache: bool = Field(
-        default=False,
-        description="Enable result caching"
+        default=True,
+        description="Enable in-process caching of read-mostly tool results"
     )
     cache_ttl: int = Field(
         default=300,
         description="Cache time-to-live in seconds"
     )
+    prewarm_competitions: List[str] = Field(
+        default_factory=list,
+        description="Competition IDs whose standings and top scorers are cached at startup"
+    )
+    prewarm_season: Optional[str] = Field(
+        default=None,
+        description="Season to pre-warm (default: current year)"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -101,14 +148,23 @@ class Settings(BaseSettings):
         )
 
 
-# Global settings instance
-settings = Settings()
-
-# Configure logging on module import
-settings.configure_logging()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the global settings instance, loading it on first call.
 
-# Create logger for this module
-logger = logging.getLogger(__name__)
-logger.info(f"Configuration loaded: {settings.server_name}")
-logger.debug(f"Neo4j URI: {settings.neo4j_uri}")
-logger.debug(f"Neo4j Database: {settings.neo4j_database}")
+    Returns:
+        Settings: Cached application settings
+    """
+    settings = Settings()
+    logger.info("Configuration loaded: %s", settings.server_name)
+    logger.debug("Neo4j URI: %s", settings.neo4j_uri)
+    logger.debug("Neo4j Database: %s", settings.neo4j_database)
+    return settings
+
+
+def __getattr__(name: str):
+    """Resolve the module-level `settings` lazily (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
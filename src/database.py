@@ -4,7 +4,9 @@ Brazilian Soccer MCP Server - Database Connection Manager
 CONTEXT:
 This module manages the Neo4j database connection lifecycle and provides
 session management for executing Cypher queries. It implements:
-- Connection pooling with automatic retry
+- Connection pooling with automatic retry (pool size, acquisition
+  timeout, lifetime and keep-alive from settings; the pool is pre-filled
+  to min_connection_pool_size on connect)
 - Transaction management
 - Query execution with error handling
 - Context managers for safe resource cleanup
@@ -12,7 +14,9 @@ session management for executing Cypher queries. It implements:
 
 DESIGN PATTERNS:
 - Singleton pattern for database driver
-- Context manager for session lifecycle
+- Driver-managed execute_query for single statements (pooled sessions,
+  READ/WRITE routing, automatic retries)
+- Context manager for multi-statement session work
 - Async/await for non-blocking operations
 
 DEPENDENCIES:
@@ -33,13 +37,14 @@ USAGE:
     await db.close()
 """
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncResult, AsyncSession, Query, RoutingControl
 from neo4j.exceptions import ServiceUnavailable, AuthError
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from src.config import settings
+from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -54,14 +59,22 @@ class Neo4jConnection:
 
     def __init__(self):
         """Initialize Neo4j connection manager."""
+        settings = get_settings()
         self._driver: Optional[AsyncDriver] = None
         self._connected: bool = False
         self._uri = settings.neo4j_uri
         self._user = settings.neo4j_user
         self._password = settings.neo4j_password
         self._database = settings.neo4j_database
+        self._pool_options = {
+            "max_connection_pool_size": settings.max_connection_pool_size,
+            "connection_acquisition_timeout": settings.connection_acquisition_timeout,
+            "max_connection_lifetime": settings.max_connection_lifetime,
+            "keep_alive": settings.keep_alive,
+        }
+        self._min_pool_size = min(settings.min_connection_pool_size, settings.max_connection_pool_size)
 
-        logger.info(f"Initializing Neo4j connection to {self._uri}")
+        logger.info("Initializing Neo4j connection to %s", self._uri)
 
     async def connect(self) -> None:
         """
@@ -76,16 +89,18 @@ class Neo4jConnection:
             return
 
         try:
-            logger.info(f"Connecting to Neo4j at {self._uri}")
+            logger.info("Connecting to Neo4j at %s", self._uri)
             self._driver = AsyncGraphDatabase.driver(
                 self._uri,
-                auth=(self._user, self._password)
+                auth=(self._user, self._password),
+                **self._pool_options
             )
 
             # Verify connectivity
             await self._driver.verify_connectivity()
+            await self._fill_pool()
             self._connected = True
-            logger.info(f"Successfully connected to Neo4j database: {self._database}")
+            logger.info("Successfully connected to Neo4j database: %s", self._database)
 
         except AuthError as e:
             logger.error(f"Authentication failed: {e}")
@@ -97,6 +112,29 @@ class Neo4jConnection:
             logger.error(f"Failed to connect to Neo4j: {e}")
             raise
 
+    async def _fill_pool(self) -> None:
+        """
+        Open min_connection_pool_size connections up front.
+
+        The driver only opens connections on demand, so without this the
+        first burst of concurrent tool calls pays one handshake each.
+        Concurrent queries each hold their own connection, which returns to
+        the pool afterwards.
+        """
+        if self._min_pool_size <= 1:
+            return
+
+        await asyncio.gather(*(
+            self._driver.execute_query(
+                "RETURN 1",
+                database_=self._database,
+                routing_=RoutingControl.READ,
+                result_transformer_=AsyncResult.consume
+            )
+            for _ in range(self._min_pool_size)
+        ))
+        logger.info("Opened %s pooled connections", self._min_pool_size)
+
     async def close(self) -> None:
         """Close database connection and cleanup resources."""
         if self._driver and self._connected:
@@ -111,6 +149,9 @@ class Neo4jConnection:
         """
         Context manager for Neo4j session.
 
+        Single statements should go through execute_query/execute_write;
+        use a session for multi-statement transactions.
+
         Yields:
             AsyncSession: Neo4j session for executing queries
 
@@ -156,21 +197,22 @@ class Neo4jConnection:
         db_name = database or self._database
         params = parameters or {}
 
-        logger.debug(f"Executing query: {query[:100]}...")
-        logger.debug(f"Parameters: {params}")
+        logger.debug("Executing query: %s...", query[:100])
+        logger.debug("Parameters: %s", params)
 
         try:
-            async with self.session() as session:
-                result = await session.run(query, params)
-                records = await result.values()
-
-                # Convert records to list of dictionaries
-                results = []
-                async for record in result:
-                    results.append(dict(record))
+            # Records are turned into dicts as they stream in, rather than
+            # buffering every Record first and copying them afterwards
+            results = await self._driver.execute_query(
+                query,
+                params,
+                database_=db_name,
+                routing_=RoutingControl.READ,
+                result_transformer_=AsyncResult.data
+            )
 
-                logger.debug(f"Query returned {len(results)} results")
-                return results
+            logger.debug("Query returned %s results", len(results))
+            return results
 
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
@@ -180,14 +222,14 @@ class Neo4jConnection:
 
     async def execute_write(
         self,
-        query: str,
+        query: Union[str, Query],
         parameters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Execute a write query (CREATE, UPDATE, DELETE) in a transaction.
 
         Args:
-            query: Cypher write query
+            query: Cypher write query, or a reusable Query carrying a timeout
             parameters: Query parameters (optional)
 
         Returns:
@@ -197,20 +239,28 @@ class Neo4jConnection:
             raise RuntimeError("Database not connected. Call connect() first.")
 
         params = parameters or {}
-        logger.debug(f"Executing write query: {query[:100]}...")
+        text = query.text if isinstance(query, Query) else query
+        logger.debug("Executing write query: %s...", text[:100])
 
         try:
-            async with self.session() as session:
-                result = await session.run(query, params)
-                summary = await result.consume()
-
-                return {
-                    "nodes_created": summary.counters.nodes_created,
-                    "nodes_deleted": summary.counters.nodes_deleted,
-                    "relationships_created": summary.counters.relationships_created,
-                    "relationships_deleted": summary.counters.relationships_deleted,
-                    "properties_set": summary.counters.properties_set
-                }
+            # Managed transaction: retried by the driver on transient
+            # errors such as deadlocks between concurrent writers. Only the
+            # summary is kept, so no records are built for write results.
+            summary = await self._driver.execute_query(
+                query,
+                params,
+                database_=self._database,
+                routing_=RoutingControl.WRITE,
+                result_transformer_=AsyncResult.consume
+            )
+
+            return {
+                "nodes_created": summary.counters.nodes_created,
+                "nodes_deleted": summary.counters.nodes_deleted,
+                "relationships_created": summary.counters.relationships_created,
+                "relationships_deleted": summary.counters.relationships_deleted,
+                "properties_set": summary.counters.properties_set
+            }
 
         except Exception as e:
             logger.error(f"Write query execution failed: {e}")
@@ -0,0 +1,104 @@
+"""
+Brazilian Soccer MCP Server - Request-Coalescing Loaders
+
+CONTEXT:
+Concurrent tool calls often look up the same kind of node by id (a player
+for stats and career, a team for roster and stats). A loader collects all
+load(key) calls made within one event-loop tick and resolves them with a
+single `WHERE n.<id> IN $ids` query, so N concurrent lookups cost one
+round-trip instead of N.
+
+DESIGN PATTERNS:
+- DataLoader: batch + dedupe keys per tick, up to max_batch_size per query
+- Module-level loader instances shared by all tools
+
+DEPENDENCIES:
+- src.database: Database connection management
+
+USAGE:
+    from src.dataloader import player_loader
+
+    player = await player_loader.load("P12345")   # dict of properties or None
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.database import get_db
+
+
+class DataLoader(ABC):
+    """
+    Coalesce load(key) calls made in the same event-loop tick into batches.
+
+    Subclasses implement batch_load(keys), returning one value per key in
+    the same order.
+    """
+
+    max_batch_size = 100
+
+    def __init__(self):
+        self._queue: List[Tuple[Any, asyncio.Future]] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    @abstractmethod
+    async def batch_load(self, keys: List[Any]) -> List[Any]:
+        """Resolve a batch of distinct keys, one value per key in order."""
+
+    def load(self, key: Any) -> "asyncio.Future":
+        """Schedule a lookup of key; resolved together with this tick's batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(self._run_batch(queue[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        try:
+            results = await self.batch_load(keys)
+            if len(results) != len(keys):
+                raise ValueError(
+                    f"{type(self).__name__}.batch_load returned {len(results)} values for {len(keys)} keys"
+                )
+            values = dict(zip(keys, results))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values[key])
+
+
+class NodeLoader(DataLoader):
+    """Load node properties by a unique id property, e.g. Player.player_id."""
+
+    def __init__(self, label: str, id_property: str):
+        super().__init__()
+        self._query = f"""
+        MATCH (n:{label})
+        WHERE n.{id_property} IN $ids
+        RETURN n.{id_property} AS id, n {{.*}} AS node
+        """
+
+    async def batch_load(self, keys: List[Any]) -> List[Optional[Dict[str, Any]]]:
+        db = get_db()
+        results = await db.execute_query(self._query, {"ids": keys})
+        nodes = {row["id"]: row["node"] for row in results}
+        return [nodes.get(key) for key in keys]
+
+
+player_loader = NodeLoader("Player", "player_id")
+team_loader = NodeLoader("Team", "team_id")
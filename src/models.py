@@ -12,6 +12,10 @@ These models provide type safety, validation, and serialization for:
 - Coaches (manager information)
 - Relationships (transfers, goals, cards)
 
+Match, Stadium, ScoredIn and CardReceived come in two variants: the
+*Ingest models carry bounds checks (scores, minutes, capacity) for the
+write path, while the plain models describe rows read back from Neo4j.
+
 SCHEMA DESIGN:
 Based on Neo4j graph database with nodes and relationships:
 - Nodes: Player, Team, Match, Competition, Stadium, Coach
@@ -31,13 +35,19 @@ USAGE:
         birth_date="1992-02-05",
         position="Forward"
     )
+
+    # Rows read back from Neo4j are trusted and skip validation
+    player = Player.from_row(record)
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, ClassVar, get_args
 from datetime import datetime, date
 from enum import Enum
 
+# Alias for fields named "date", which shadow the type inside a class body
+Date = date
+
 
 class Position(str, Enum):
     """Player positions in Brazilian soccer."""
@@ -69,11 +79,68 @@ class GoalType(str, Enum):
     OWN_GOAL = "Own Goal"
 
 
+def _enum_values(annotation: Any) -> Optional[Dict[str, Enum]]:
+    """Map raw values to members for an Enum (or Optional[Enum]) annotation."""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, Enum):
+            return {member.value: member for member in candidate}
+    return None
+
+
+# ============================================================================
+# BASE MODEL
+# ============================================================================
+
+class GraphModel(BaseModel):
+    """
+    Base class for all graph models.
+
+    Neo4j rows were validated on import, so building a model from one goes
+    through from_row(), which skips validation. Untrusted input (MCP tool
+    arguments) should still use the normal constructor / model_validate.
+
+    Instances are immutable and reject unknown fields. Pydantic v2 models
+    keep a per-instance __dict__, so there is no slots option to set here.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=False
+    )
+
+    # Enum-typed fields -> {raw value: member}, built once per subclass
+    _enum_fields: ClassVar[Dict[str, Dict[str, Enum]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._enum_fields = {
+            name: values
+            for name, field in cls.model_fields.items()
+            if (values := _enum_values(field.annotation)) is not None
+        }
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]):
+        """Build an instance from a trusted Neo4j row without validation."""
+        # trusted: from Neo4j. Enum strings are swapped for their (singleton)
+        # members, so repeated labels like "Midfielder" share one object.
+        if cls._enum_fields:
+            row = dict(row)
+            for name, values in cls._enum_fields.items():
+                value = row.get(name)
+                if value is not None:
+                    row[name] = values.get(value, value)
+        return cls.model_construct(**row)
+
+
 # ============================================================================
 # CORE ENTITY MODELS
 # ============================================================================
 
-class Player(BaseModel):
+class Player(GraphModel):
     """
     Player entity model representing a soccer player.
 
@@ -88,18 +155,18 @@ class Player(BaseModel):
         weight: Weight in kg (optional)
         current_team_id: ID of current team (optional)
     """
-    player_id: str = Field(..., description="Unique player identifier")
-    name: str = Field(..., description="Full player name")
-    birth_date: Optional[date] = Field(None, description="Date of birth")
-    nationality: str = Field(default="Brazilian", description="Player nationality")
-    position: Optional[Position] = Field(None, description="Primary position")
-    jersey_number: Optional[int] = Field(None, ge=1, le=99, description="Jersey number")
-    height: Optional[int] = Field(None, description="Height in centimeters")
-    weight: Optional[int] = Field(None, description="Weight in kilograms")
-    current_team_id: Optional[str] = Field(None, description="Current team ID")
-
-
-class Team(BaseModel):
+    player_id: str
+    name: str
+    birth_date: Optional[date] = None
+    nationality: str = "Brazilian"
+    position: Optional[Position] = None
+    jersey_number: Optional[int] = None
+    height: Optional[int] = None
+    weight: Optional[int] = None
+    current_team_id: Optional[str] = None
+
+
+class Team(GraphModel):
     """
     Team entity model representing a soccer club.
 
@@ -112,18 +179,18 @@ class Team(BaseModel):
         colors: Team colors (comma-separated)
         nickname: Team nickname (optional)
     """
-    team_id: str = Field(..., description="Unique team identifier")
-    name: str = Field(..., description="Official team name")
-    city: str = Field(..., description="City location")
-    stadium: Optional[str] = Field(None, description="Home stadium name")
-    founded_year: Optional[int] = Field(None, description="Year founded")
-    colors: Optional[str] = Field(None, description="Team colors")
-    nickname: Optional[str] = Field(None, description="Team nickname")
+    team_id: str
+    name: str
+    city: str
+    stadium: Optional[str] = None
+    founded_year: Optional[int] = None
+    colors: Optional[str] = None
+    nickname: Optional[str] = None
 
 
-class Match(BaseModel):
+class MatchIngest(GraphModel):
     """
-    Match entity model representing a soccer game.
+    Match entity model for the write path (import/ETL), with bounds checks.
 
     Attributes:
         match_id: Unique identifier for the match
@@ -138,7 +205,7 @@ class Match(BaseModel):
         referee: Name of referee (optional)
     """
     match_id: str = Field(..., description="Unique match identifier")
-    date: date = Field(..., description="Match date")
+    date: Date = Field(..., description="Match date")
     home_team_id: str = Field(..., description="Home team ID")
     away_team_id: str = Field(..., description="Away team ID")
     home_score: int = Field(..., ge=0, description="Home team score")
@@ -149,7 +216,26 @@ class Match(BaseModel):
     referee: Optional[str] = Field(None, description="Referee name")
 
 
-class Competition(BaseModel):
+class Match(GraphModel):
+    """
+    Match entity model representing a soccer game, as read from Neo4j.
+
+    Same fields as MatchIngest without the bounds checks: stored matches
+    were validated on import.
+    """
+    match_id: str
+    date: Date
+    home_team_id: str
+    away_team_id: str
+    home_score: int
+    away_score: int
+    competition_id: str
+    stadium_id: Optional[str] = None
+    attendance: Optional[int] = None
+    referee: Optional[str] = None
+
+
+class Competition(GraphModel):
     """
     Competition entity model representing a tournament or league.
 
@@ -161,17 +247,17 @@ class Competition(BaseModel):
         tier: Competition tier/division
         country: Country where competition is held
     """
-    competition_id: str = Field(..., description="Unique competition identifier")
-    name: str = Field(..., description="Competition name")
-    season: str = Field(..., description="Season identifier")
-    type: CompetitionType = Field(..., description="Competition type")
-    tier: Optional[int] = Field(None, description="Competition tier")
-    country: str = Field(default="Brazil", description="Country")
+    competition_id: str
+    name: str
+    season: str
+    type: CompetitionType
+    tier: Optional[int] = None
+    country: str = "Brazil"
 
 
-class Stadium(BaseModel):
+class StadiumIngest(GraphModel):
     """
-    Stadium entity model representing a soccer venue.
+    Stadium entity model for the write path (import/ETL), with bounds checks.
 
     Attributes:
         stadium_id: Unique identifier for the stadium
@@ -189,7 +275,17 @@ class Stadium(BaseModel):
     surface: Optional[str] = Field(None, description="Field surface type")
 
 
-class Coach(BaseModel):
+class Stadium(GraphModel):
+    """Stadium entity model representing a soccer venue, as read from Neo4j."""
+    stadium_id: str
+    name: str
+    city: str
+    capacity: Optional[int] = None
+    opened_year: Optional[int] = None
+    surface: Optional[str] = None
+
+
+class Coach(GraphModel):
     """
     Coach entity model representing a team manager.
 
@@ -200,18 +296,18 @@ class Coach(BaseModel):
         birth_date: Date of birth (optional)
         current_team_id: ID of current team (optional)
     """
-    coach_id: str = Field(..., description="Unique coach identifier")
-    name: str = Field(..., description="Full coach name")
-    nationality: str = Field(default="Brazilian", description="Coach nationality")
-    birth_date: Optional[date] = Field(None, description="Date of birth")
-    current_team_id: Optional[str] = Field(None, description="Current team ID")
+    coach_id: str
+    name: str
+    nationality: str = "Brazilian"
+    birth_date: Optional[date] = None
+    current_team_id: Optional[str] = None
 
 
 # ============================================================================
 # RELATIONSHIP MODELS
 # ============================================================================
 
-class PlaysFor(BaseModel):
+class PlaysFor(GraphModel):
     """Relationship: Player plays for Team."""
     player_id: str
     team_id: str
@@ -220,8 +316,8 @@ class PlaysFor(BaseModel):
     jersey_number: Optional[int] = None
 
 
-class ScoredIn(BaseModel):
-    """Relationship: Player scored in Match."""
+class ScoredInIngest(GraphModel):
+    """Relationship: Player scored in Match (write path, with bounds checks)."""
     player_id: str
     match_id: str
     minute: int = Field(..., ge=0, le=120)
@@ -229,26 +325,35 @@ class ScoredIn(BaseModel):
     team_id: str
 
 
-class AssistedIn(BaseModel):
+class ScoredIn(GraphModel):
+    """Relationship: Player scored in Match."""
+    player_id: str
+    match_id: str
+    minute: int
+    goal_type: Optional[GoalType] = None
+    team_id: str
+
+
+class AssistedIn(GraphModel):
     """Relationship: Player assisted in Match."""
     player_id: str
     match_id: str
-    minute: int = Field(..., ge=0, le=120)
+    minute: int
     team_id: str
 
 
-class Transfer(BaseModel):
+class Transfer(GraphModel):
     """Relationship: Player transferred between teams."""
     player_id: str
     from_team_id: str
     to_team_id: str
     transfer_date: date
-    fee: Optional[float] = Field(None, description="Transfer fee in currency")
-    loan: bool = Field(default=False, description="Is this a loan transfer")
+    fee: Optional[float] = None  # transfer fee in currency
+    loan: bool = False  # loan rather than permanent transfer
 
 
-class CardReceived(BaseModel):
-    """Relationship: Player received card in Match."""
+class CardReceivedIngest(GraphModel):
+    """Relationship: Player received card in Match (write path, with bounds checks)."""
     player_id: str
     match_id: str
     card_type: CardType
@@ -256,7 +361,16 @@ class CardReceived(BaseModel):
     reason: Optional[str] = None
 
 
-class Manages(BaseModel):
+class CardReceived(GraphModel):
+    """Relationship: Player received card in Match."""
+    player_id: str
+    match_id: str
+    card_type: CardType
+    minute: int
+    reason: Optional[str] = None
+
+
+class Manages(GraphModel):
     """Relationship: Coach manages Team."""
     coach_id: str
     team_id: str
@@ -268,7 +382,7 @@ class Manages(BaseModel):
 # RESPONSE MODELS (for API results)
 # ============================================================================
 
-class PlayerStats(BaseModel):
+class PlayerStats(GraphModel):
     """Aggregated statistics for a player."""
     player_id: str
     player_name: str
@@ -280,7 +394,7 @@ class PlayerStats(BaseModel):
     teams_played_for: List[str] = []
 
 
-class TeamStats(BaseModel):
+class TeamStats(GraphModel):
     """Aggregated statistics for a team."""
     team_id: str
     team_name: str
@@ -292,7 +406,7 @@ class TeamStats(BaseModel):
     total_matches: int = 0
 
 
-class MatchDetails(BaseModel):
+class MatchDetails(GraphModel):
     """Detailed information about a match."""
     match: Match
     home_team: Team
@@ -302,7 +416,7 @@ class MatchDetails(BaseModel):
     stadium: Optional[Stadium] = None
 
 
-class PlayerCareer(BaseModel):
+class PlayerCareer(GraphModel):
     """Complete career information for a player."""
     player: Player
     teams: List[PlaysFor] = []
@@ -310,7 +424,7 @@ class PlayerCareer(BaseModel):
     stats: PlayerStats
 
 
-class SearchResult(BaseModel):
+class SearchResult(GraphModel):
     """Generic search result wrapper."""
     total_results: int
     results: List[dict]
@@ -17,7 +17,12 @@ ARCHITECTURE:
 - FastMCP server framework for MCP protocol implementation
 - Async/await pattern for non-blocking operations
 - Neo4j database backend for graph queries
-- Structured error handling and logging
+- Structured error handling and logging, centralized in the call_tool dispatcher
+- Tool registry with per-tool argument models built once at import, behind
+  a single call_tool dispatcher
+- Server lifespan hook connects to Neo4j once per run and closes on exit
+- Every tool takes format="text" (default) or format="json"; JSON returns
+  the raw tool result for programmatic clients
 
 DEPENDENCIES:
 - mcp: MCP protocol implementation
@@ -35,69 +40,310 @@ USAGE:
 """
 
 import asyncio
+import inspect
+import json
 import logging
-from typing import Optional, List, Dict, Any
+import sys
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Annotated, Optional, List, Dict, Any, AsyncIterator, Callable, Iterator, Literal, Set, Tuple, Type
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+from pydantic import BaseModel, Field, create_model
 
 # FastMCP imports
 from mcp.server import Server
+from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
+from neo4j.exceptions import Neo4jError
 
 # Database and config
 from src.database import get_db, Neo4jConnection
 from src.config import settings
+from src.models import CardType
 
 # Tool imports
 from src.tools import player_tools, team_tools, match_tools, competition_tools, analysis_tools
 
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-server = Server(settings.server_name)
+# Tool registry: name -> (text handler, data source, argument model built
+# once at import)
+TOOLS: Dict[str, Tuple[Callable, Callable, Type[BaseModel]]] = {}
+TOOL_DEFINITIONS: List[Tool] = []
+
+# Output formats accepted by every tool via its `format` argument
+OutputFormat = Literal["text", "json"]
+
+# Responses for failed tool calls (details go to the log, not the client)
+DATABASE_ERROR_TEXT = "Database error, please retry."
+INTERNAL_ERROR_TEXT = "Internal error."
+
+# Fixed-shape response templates, filled with str.format_map(stats)
+PLAYER_STATS_TEMPLATE = (
+    "Statistics for {player_name}{season_text}:\n\n"
+    "⚽ Goals: {total_goals}\n"
+    "🎯 Assists: {total_assists}\n"
+    "🏟️  Matches: {total_matches}\n"
+    "🟨 Yellow Cards: {yellow_cards}\n"
+    "🟥 Red Cards: {red_cards}\n"
+)
+
+TEAM_STATS_TEMPLATE = (
+    "Statistics for {team_name}{season_text}:\n\n"
+    "Matches: {total_matches}\n"
+    "Record: {wins}W - {draws}D - {losses}L\n"
+    "Win Rate: {win_rate}%\n"
+    "Points: {points}\n\n"
+    "Goals Scored: {goals_scored}\n"
+    "Goals Conceded: {goals_conceded}\n"
+    "Goal Difference: {goal_difference:+d}\n\n"
+    "Home Record: {home_record[wins]}W / {home_record[matches]}M\n"
+    "Away Record: {away_record[wins]}W / {away_record[matches]}M\n"
+)
+
+# Table and list rows, with format specs parsed once here instead of per row
+STANDINGS_HEADER = "{:<4} {:<25} {:<4} {:<4} {:<4} {:<4} {:<4} {:<4} {:<5} {:<4}\n".format(
+    "Pos", "Team", "P", "W", "D", "L", "GF", "GA", "GD", "Pts"
+)
+STANDINGS_SEPARATOR = "-" * 80 + "\n"
+STANDINGS_ROW_TEMPLATE = "{:<4} {:<25} {:<4} {:<4} {:<4} {:<4} {:<4} {:<4} {:>4} {:<4}\n"
+
+MATCH_ROW_TEMPLATE = "{date}: {home_team} {home_score} - {away_score} {away_team}\n"
+
+# Long match lists are split into several content blocks of this many rows
+MATCH_PAGE_SIZE = 200
+
+# Card markers by card_type (CardType is a str enum, so raw values match);
+# unknown types show as red
+CARD_EMOJI = {CardType.YELLOW: "🟨", CardType.RED: "🟥"}
+
+
+def tool(source: Callable) -> Callable:
+    """
+    Register an async function as an MCP tool backed by a src.tools function.
+
+    The argument model is derived from the function signature once, here,
+    and reused to validate every call. Every tool also accepts
+    format="json", which returns the source function's result serialized
+    as JSON instead of the human-readable text built by the function. The
+    function itself is returned unchanged, so internal callers can invoke
+    it directly without validation.
+
+    Args:
+        source: Data function returning the tool's raw result; it takes the
+            same arguments as the decorated function
+    """
+    def decorator(fn: Callable) -> Callable:
+        fields = {
+            param.name: (
+                param.annotation,
+                ... if param.default is inspect.Parameter.empty else param.default
+            )
+            for param in inspect.signature(fn).parameters.values()
+        }
+        fields["format"] = (OutputFormat, "text")
+        arguments_model = create_model(f"{fn.__name__}_arguments", **fields)
+
+        TOOLS[fn.__name__] = (fn, source, arguments_model)
+        TOOL_DEFINITIONS.append(Tool(
+            name=fn.__name__,
+            description=inspect.getdoc(fn).split("\n\n")[0],
+            inputSchema=arguments_model.model_json_schema()
+        ))
+        return fn
+
+    return decorator
+
+
+def render_match_pages(matches: Dict[str, Any]) -> Iterator[str]:
+    """
+    Render a competition's match list as text pages of MATCH_PAGE_SIZE rows.
+
+    The header goes on the first page and the "more matches" footer, with
+    the offset of the next page, on the last, so short lists come out as a
+    single page.
+    """
+    comp = matches["competition"]
+    rows = matches["matches"]
+    match_row = MATCH_ROW_TEMPLATE.format_map
+
+    for start in range(0, max(len(rows), 1), MATCH_PAGE_SIZE):
+        parts = []
+        if start == 0:
+            parts.append(f"{comp['name']} {comp['season']} - Matches ({matches['total_matches']} total)\n\n")
+        parts.extend(match_row(match) for match in rows[start:start + MATCH_PAGE_SIZE])
+        if start + MATCH_PAGE_SIZE >= len(rows):
+            next_offset = matches["offset"] + len(rows)
+            remaining = matches["total_matches"] - next_offset
+            if remaining > 0:
+                parts.append(f"\n... and {remaining} more matches (next offset: {next_offset})")
+        yield "".join(parts)
+
+
+def format_match_details(details: Dict[str, Any]) -> str:
+    """
+    Render a get_match_details result as text.
 
-# Global database connection
-db: Optional[Neo4jConnection] = None
+    Sections are blank-line separated and only rendered when they have
+    content; summary results render the header with goal and card totals.
+    """
+    match = details["match"]
+    header = [
+        f"{match['home_team_name']} {match['home_score']} - {match['away_score']} {match['away_team_name']}\n",
+        f"Date: {match['date']}\n"
+    ]
+    if match.get('competition_name'):
+        header.append(f"Competition: {match['competition_name']} ({match['season']})\n")
+    if match.get('stadium_name'):
+        header.append(f"Stadium: {match['stadium_name']}, {match.get('stadium_city', '')}\n")
+    if match.get('attendance'):
+        header.append(f"Attendance: {match['attendance']:,}\n")
+    if "scorers" not in details:
+        header.append(f"Goals: {details['total_goals']}, Cards: {details['total_cards']}\n")
+        return "".join(header)
+    sections = ["".join(header)]
+
+    # Scorers
+    if details["scorers"]:
+        sections.append("Goal Scorers:\n" + "".join(
+            f"• {scorer['minute']}' {scorer['player_name']} ({scorer['team_name']})\n"
+            for scorer in details["scorers"]
+        ))
+
+    # Cards
+    if details["cards"]:
+        sections.append("Cards:\n" + "".join(
+            f"• {CARD_EMOJI.get(card['card_type'], CARD_EMOJI[CardType.RED])} {card['minute']}' {card['player_name']} ({card['team_name']})\n"
+            for card in details["cards"]
+        ))
+
+    return "\n".join(sections)
+
+
+def dumps_json(result: Any) -> str:
+    """Serialize a tool result; Neo4j temporal values fall back to str()."""
+    if orjson is not None:
+        return orjson.dumps(result, default=str).decode("utf-8")
+    return json.dumps(result, default=str, ensure_ascii=False)
 
 
 # ============================================================================
 # LIFECYCLE HOOKS
 # ============================================================================
 
-@server.call_tool()
-async def startup():
-    """Initialize database connection on server startup."""
-    global db
+# Maximum concurrent pre-warm queries, to leave the pool to real requests
+PREWARM_CONCURRENCY = 4
+
+# Strong references to background tasks so they are not garbage collected
+background_tasks: Set[asyncio.Task] = set()
+
+
+async def prewarm() -> None:
+    """
+    Seed the result cache with standings and top scorers for the configured
+    competitions, so the first requests after startup are cache hits.
+
+    Failures are logged and otherwise ignored; the cache then simply fills
+    on first request.
+    """
+    season = settings.prewarm_season or str(date.today().year)
+    semaphore = asyncio.Semaphore(PREWARM_CONCURRENCY)
+
+    async def warm(fn: Callable, competition_id: str) -> None:
+        async with semaphore:
+            try:
+                await fn(competition_id, season)
+            except Exception as e:
+                logger.warning("Pre-warm of %s(%s, %s) failed: %s",
+                               fn.__name__, competition_id, season, e)
+
+    await asyncio.gather(*(
+        warm(fn, competition_id)
+        for competition_id in settings.prewarm_competitions
+        for fn in (competition_tools.get_competition_standings,
+                   competition_tools.get_competition_top_scorers)
+    ))
+    logger.info("Pre-warmed cache for %s competitions", len(settings.prewarm_competitions))
+
+async def startup() -> Neo4jConnection:
+    """
+    Initialize the database connection on server startup.
+
+    Safe to call more than once: an already connected database is returned
+    as is.
+    """
+    db = get_db()
+    if db.is_connected:
+        return db
+
     logger.info("Starting Brazilian Soccer MCP Server...")
 
     try:
-        db = get_db()
         await db.connect()
         logger.info("Database connection established")
 
         # Perform health check
         health = await db.health_check()
-        logger.info(f"Database health: {health['status']}")
-        logger.info(f"Total nodes in database: {health.get('total_nodes', 0)}")
+        logger.info("Database health: %s", health["status"],
+                    extra={"status": health["status"]})
+        logger.info("Total nodes in database: %s", health.get("total_nodes", 0),
+                    extra={"total_nodes": health.get("total_nodes", 0)})
+
+        if settings.enable_cache and settings.prewarm_competitions:
+            task = asyncio.create_task(prewarm())
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+
+        return db
 
     except Exception as e:
-        logger.error(f"Failed to connect to database: {e}")
+        logger.error("Failed to connect to database: %s", e)
         raise
 
 
-async def shutdown():
+async def shutdown() -> None:
     """Cleanup database connection on server shutdown."""
-    global db
+    db = get_db()
     logger.info("Shutting down Brazilian Soccer MCP Server...")
 
-    if db:
+    for task in background_tasks:
+        task.cancel()
+
+    if db.is_connected:
         await db.close()
         logger.info("Database connection closed")
 
 
+@asynccontextmanager
+async def lifespan(_server: Server) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Connect once when the server starts and close on exit.
+
+    The connection is exposed to handlers as
+    server.request_context.lifespan_context["db"].
+    """
+    db = await startup()
+    try:
+        yield {"db": db}
+    finally:
+        await shutdown()
+
+
+# Initialize MCP server
+server = Server(settings.server_name, lifespan=lifespan)
+
+
 # ============================================================================
 # PLAYER TOOLS
 # ============================================================================
 
-@server.call_tool()
+@tool(player_tools.search_player)
 async def search_player(
     name: str,
     team: Optional[str] = None,
@@ -116,34 +362,29 @@ async def search_player(
     Returns:
         List of players matching search criteria
     """
-    try:
-        results = await player_tools.search_player(name, team, position, limit)
-
-        if not results:
-            return [TextContent(
-                type="text",
-                text=f"No players found matching: {name}"
-            )]
-
-        # Format results
-        response = f"Found {len(results)} player(s):\n\n"
-        for player in results:
-            response += f"• {player['name']} ({player.get('position', 'N/A')})\n"
-            response += f"  ID: {player['player_id']}\n"
-            if player.get('nationality'):
-                response += f"  Nationality: {player['nationality']}\n"
-            if player.get('jersey_number'):
-                response += f"  Number: {player['jersey_number']}\n"
-            response += "\n"
-
-        return [TextContent(type="text", text=response)]
+    results = await player_tools.search_player(name, team, position, limit)
 
-    except Exception as e:
-        logger.error(f"Error in search_player: {e}")
-        return [TextContent(type="text", text=f"Error searching for players: {str(e)}")]
+    if not results:
+        return [TextContent(
+            type="text",
+            text=f"No players found matching: {name}"
+        )]
 
+    # Format results
+    parts = [f"Found {len(results)} player(s):\n\n"]
+    for player in results:
+        parts.append(f"• {player['name']} ({player.get('position', 'N/A')})\n")
+        parts.append(f"  ID: {player['player_id']}\n")
+        if player.get('nationality'):
+            parts.append(f"  Nationality: {player['nationality']}\n")
+        if player.get('jersey_number'):
+            parts.append(f"  Number: {player['jersey_number']}\n")
+        parts.append("\n")
 
-@server.call_tool()
+    return [TextContent(type="text", text="".join(parts))]
+
+
+@tool(player_tools.get_player_stats)
 async def get_player_stats(
     player_id: str,
     season: Optional[str] = None
@@ -158,32 +399,22 @@ async def get_player_stats(
     Returns:
         Player statistics including goals, assists, matches, and cards
     """
-    try:
-        stats = await player_tools.get_player_stats(player_id, season)
-
-        if "error" in stats:
-            return [TextContent(type="text", text=stats["error"])]
+    stats = await player_tools.get_player_stats(player_id, season)
 
-        # Format statistics
-        season_text = f" ({stats['season']})" if stats.get('season') else " (All-Time)"
-        response = f"Statistics for {stats['player_name']}{season_text}:\n\n"
-        response += f"⚽ Goals: {stats['total_goals']}\n"
-        response += f"🎯 Assists: {stats['total_assists']}\n"
-        response += f"🏟️  Matches: {stats['total_matches']}\n"
-        response += f"🟨 Yellow Cards: {stats['yellow_cards']}\n"
-        response += f"🟥 Red Cards: {stats['red_cards']}\n"
+    if "error" in stats:
+        return [TextContent(type="text", text=stats["error"])]
 
-        if stats.get('teams'):
-            response += f"\nTeams: {', '.join(stats['teams'])}\n"
+    # Format statistics
+    season_text = f" ({stats['season']})" if stats.get('season') else " (All-Time)"
+    parts = [PLAYER_STATS_TEMPLATE.format_map({**stats, "season_text": season_text})]
 
-        return [TextContent(type="text", text=response)]
+    if stats.get('teams'):
+        parts.append(f"\nTeams: {', '.join(stats['teams'])}\n")
 
-    except Exception as e:
-        logger.error(f"Error in get_player_stats: {e}")
-        return [TextContent(type="text", text=f"Error getting player stats: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
-@server.call_tool()
+@tool(player_tools.get_player_career)
 async def get_player_career(player_id: str) -> List[TextContent]:
     """
     Get complete career history for a player.
@@ -194,52 +425,46 @@ async def get_player_career(player_id: str) -> List[TextContent]:
     Returns:
         Complete career information including teams, transfers, and statistics
     """
-    try:
-        career = await player_tools.get_player_career(player_id)
-
-        if "error" in career:
-            return [TextContent(type="text", text=career["error"])]
-
-        # Format career information
-        player = career["player"]
-        response = f"Career of {player.get('name', 'Unknown')}:\n\n"
-
-        # Teams
-        if career["teams"]:
-            response += "Teams:\n"
-            for team in career["teams"]:
-                response += f"• {team['team_name']}"
-                if team.get('from_date') or team.get('to_date'):
-                    dates = f" ({team.get('from_date', '?')} - {team.get('to_date', 'Present')})"
-                    response += dates
-                if team.get('jersey_number'):
-                    response += f" #{team['jersey_number']}"
-                response += "\n"
-            response += "\n"
-
-        # Transfers
-        if career["transfers"]:
-            response += f"Transfers ({len(career['transfers'])}):\n"
-            for transfer in career["transfers"][:5]:  # Show first 5
-                response += f"• {transfer['from_team']} → {transfer['to_team']} ({transfer['transfer_date']})\n"
-            response += "\n"
-
-        # Career stats
-        if career.get("career_stats"):
-            stats = career["career_stats"]
-            response += "Career Statistics:\n"
-            response += f"⚽ Goals: {stats.get('total_goals', 0)}\n"
-            response += f"🎯 Assists: {stats.get('total_assists', 0)}\n"
-            response += f"🏟️  Matches: {stats.get('total_matches', 0)}\n"
-
-        return [TextContent(type="text", text=response)]
-
-    except Exception as e:
-        logger.error(f"Error in get_player_career: {e}")
-        return [TextContent(type="text", text=f"Error getting player career: {str(e)}")]
-
-
-@server.call_tool()
+    career = await player_tools.get_player_career(player_id)
+
+    if "error" in career:
+        return [TextContent(type="text", text=career["error"])]
+
+    # Format career information
+    player = career["player"]
+    parts = [f"Career of {player.get('name', 'Unknown')}:\n\n"]
+
+    # Teams
+    if career["teams"]:
+        parts.append("Teams:\n")
+        for team in career["teams"]:
+            parts.append(f"• {team['team_name']}")
+            if team.get('from_date') or team.get('to_date'):
+                parts.append(f" ({team.get('from_date', '?')} - {team.get('to_date', 'Present')})")
+            if team.get('jersey_number'):
+                parts.append(f" #{team['jersey_number']}")
+            parts.append("\n")
+        parts.append("\n")
+
+    # Transfers
+    if career["transfers"]:
+        parts.append(f"Transfers ({len(career['transfers'])}):\n")
+        for transfer in career["transfers"][:5]:  # Show first 5
+            parts.append(f"• {transfer['from_team']} → {transfer['to_team']} ({transfer['transfer_date']})\n")
+        parts.append("\n")
+
+    # Career stats
+    if career.get("career_stats"):
+        stats = career["career_stats"]
+        parts.append("Career Statistics:\n")
+        parts.append(f"⚽ Goals: {stats.get('total_goals', 0)}\n")
+        parts.append(f"🎯 Assists: {stats.get('total_assists', 0)}\n")
+        parts.append(f"🏟️  Matches: {stats.get('total_matches', 0)}\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+@tool(player_tools.get_player_transfers)
 async def get_player_transfers(
     player_id: str,
     year: Optional[int] = None
@@ -254,38 +479,33 @@ async def get_player_transfers(
     Returns:
         List of transfers with dates, fees, and teams
     """
-    try:
-        transfers = await player_tools.get_player_transfers(player_id, year)
-
-        if not transfers:
-            year_text = f" in {year}" if year else ""
-            return [TextContent(type="text", text=f"No transfers found{year_text}")]
+    transfers = await player_tools.get_player_transfers(player_id, year)
 
-        # Format transfers
+    if not transfers:
         year_text = f" in {year}" if year else ""
-        response = f"Transfers{year_text}:\n\n"
+        return [TextContent(type="text", text=f"No transfers found{year_text}")]
 
-        for transfer in transfers:
-            response += f"• {transfer['from_team']} → {transfer['to_team']}\n"
-            response += f"  Date: {transfer['transfer_date']}\n"
-            if transfer.get('fee'):
-                response += f"  Fee: {transfer['fee']}\n"
-            if transfer.get('loan'):
-                response += f"  Type: Loan\n"
-            response += "\n"
+    # Format transfers
+    year_text = f" in {year}" if year else ""
+    parts = [f"Transfers{year_text}:\n\n"]
 
-        return [TextContent(type="text", text=response)]
+    for transfer in transfers:
+        parts.append(f"• {transfer['from_team']} → {transfer['to_team']}\n")
+        parts.append(f"  Date: {transfer['transfer_date']}\n")
+        if transfer.get('fee'):
+            parts.append(f"  Fee: {transfer['fee']}\n")
+        if transfer.get('loan'):
+            parts.append(f"  Type: Loan\n")
+        parts.append("\n")
 
-    except Exception as e:
-        logger.error(f"Error in get_player_transfers: {e}")
-        return [TextContent(type="text", text=f"Error getting player transfers: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
 # ============================================================================
 # TEAM TOOLS
 # ============================================================================
 
-@server.call_tool()
+@tool(team_tools.search_team)
 async def search_team(
     name: str,
     city: Optional[str] = None,
@@ -302,33 +522,28 @@ async def search_team(
     Returns:
         List of teams matching search criteria
     """
-    try:
-        results = await team_tools.search_team(name, city, limit)
-
-        if not results:
-            return [TextContent(type="text", text=f"No teams found matching: {name}")]
-
-        # Format results
-        response = f"Found {len(results)} team(s):\n\n"
-        for team in results:
-            response += f"• {team['name']}\n"
-            response += f"  ID: {team['team_id']}\n"
-            if team.get('city'):
-                response += f"  City: {team['city']}\n"
-            if team.get('stadium'):
-                response += f"  Stadium: {team['stadium']}\n"
-            if team.get('founded_year'):
-                response += f"  Founded: {team['founded_year']}\n"
-            response += "\n"
-
-        return [TextContent(type="text", text=response)]
+    results = await team_tools.search_team(name, city, limit)
 
-    except Exception as e:
-        logger.error(f"Error in search_team: {e}")
-        return [TextContent(type="text", text=f"Error searching for teams: {str(e)}")]
+    if not results:
+        return [TextContent(type="text", text=f"No teams found matching: {name}")]
 
+    # Format results
+    parts = [f"Found {len(results)} team(s):\n\n"]
+    for team in results:
+        parts.append(f"• {team['name']}\n")
+        parts.append(f"  ID: {team['team_id']}\n")
+        if team.get('city'):
+            parts.append(f"  City: {team['city']}\n")
+        if team.get('stadium'):
+            parts.append(f"  Stadium: {team['stadium']}\n")
+        if team.get('founded_year'):
+            parts.append(f"  Founded: {team['founded_year']}\n")
+        parts.append("\n")
 
-@server.call_tool()
+    return [TextContent(type="text", text="".join(parts))]
+
+
+@tool(team_tools.get_team_roster)
 async def get_team_roster(
     team_id: str,
     season: Optional[str] = None
@@ -343,40 +558,30 @@ async def get_team_roster(
     Returns:
         Team roster with player details
     """
-    try:
-        roster = await team_tools.get_team_roster(team_id, season)
-
-        if "error" in roster:
-            return [TextContent(type="text", text=roster["error"])]
+    roster = await team_tools.get_team_roster(team_id, season)
 
-        # Format roster
-        team_name = roster["team"]["name"]
-        season_text = f" ({roster['season']})" if roster.get('season') else ""
-        response = f"{team_name} Roster{season_text}:\n\n"
-        response += f"Total Players: {roster['total_players']}\n\n"
+    if "error" in roster:
+        return [TextContent(type="text", text=roster["error"])]
 
-        # Group by position
-        positions = {}
-        for player in roster["players"]:
-            pos = player.get('position', 'Unknown')
-            if pos not in positions:
-                positions[pos] = []
-            positions[pos].append(player)
+    # Format roster
+    team_name = roster["team"]["name"]
+    season_text = f" ({roster['season']})" if roster.get('season') else ""
+    parts = [
+        f"{team_name} Roster{season_text}:\n\n",
+        f"Total Players: {roster['total_players']}\n\n"
+    ]
 
-        for position, players in sorted(positions.items()):
-            response += f"{position}:\n"
-            for player in players:
-                response += f"  • #{player.get('jersey_number', '?')} {player['name']}\n"
-            response += "\n"
+    # Players arrive grouped by position and sorted from the query
+    for group in roster["positions"]:
+        parts.append(f"{group['position']}:\n")
+        for player in group["players"]:
+            parts.append(f"  • #{player.get('jersey_number', '?')} {player['name']}\n")
+        parts.append("\n")
 
-        return [TextContent(type="text", text=response)]
-
-    except Exception as e:
-        logger.error(f"Error in get_team_roster: {e}")
-        return [TextContent(type="text", text=f"Error getting team roster: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
-@server.call_tool()
+@tool(team_tools.get_team_stats)
 async def get_team_stats(
     team_id: str,
     season: Optional[str] = None
@@ -391,33 +596,19 @@ async def get_team_stats(
     Returns:
         Team statistics including wins, draws, losses, and goals
     """
-    try:
-        stats = await team_tools.get_team_stats(team_id, season)
-
-        if "error" in stats:
-            return [TextContent(type="text", text=stats["error"])]
-
-        # Format statistics
-        season_text = f" ({stats['season']})" if stats.get('season') else " (All-Time)"
-        response = f"Statistics for {stats['team_name']}{season_text}:\n\n"
-        response += f"Matches: {stats['total_matches']}\n"
-        response += f"Record: {stats['wins']}W - {stats['draws']}D - {stats['losses']}L\n"
-        response += f"Win Rate: {stats['win_rate']}%\n"
-        response += f"Points: {stats['points']}\n\n"
-        response += f"Goals Scored: {stats['goals_scored']}\n"
-        response += f"Goals Conceded: {stats['goals_conceded']}\n"
-        response += f"Goal Difference: {stats['goal_difference']:+d}\n\n"
-        response += f"Home Record: {stats['home_record']['wins']}W / {stats['home_record']['matches']}M\n"
-        response += f"Away Record: {stats['away_record']['wins']}W / {stats['away_record']['matches']}M\n"
-
-        return [TextContent(type="text", text=response)]
+    stats = await team_tools.get_team_stats(team_id, season)
 
-    except Exception as e:
-        logger.error(f"Error in get_team_stats: {e}")
-        return [TextContent(type="text", text=f"Error getting team stats: {str(e)}")]
+    if "error" in stats:
+        return [TextContent(type="text", text=stats["error"])]
 
+    # Format statistics
+    season_text = f" ({stats['season']})" if stats.get('season') else " (All-Time)"
+    response = TEAM_STATS_TEMPLATE.format_map({**stats, "season_text": season_text})
 
-@server.call_tool()
+    return [TextContent(type="text", text=response)]
+
+
+@tool(team_tools.get_team_history)
 async def get_team_history(
     team_id: str,
     include_championships: bool = True
@@ -432,101 +623,102 @@ async def get_team_history(
     Returns:
         Complete team history including competitions and achievements
     """
-    try:
-        history = await team_tools.get_team_history(team_id, include_championships)
-
-        if "error" in history:
-            return [TextContent(type="text", text=history["error"])]
-
-        # Format history
-        team = history["team"]
-        response = f"History of {team['name']}:\n\n"
-
-        if team.get('founded_year'):
-            response += f"Founded: {team['founded_year']}\n"
-        if team.get('city'):
-            response += f"City: {team['city']}\n"
-        if team.get('stadium_name'):
-            response += f"Stadium: {team['stadium_name']}"
-            if team.get('stadium_capacity'):
-                response += f" (Capacity: {team['stadium_capacity']:,})"
-            response += "\n"
-        response += "\n"
-
-        # Championships
-        if include_championships and history.get("championships"):
-            response += f"Championships ({history['total_championships']}):\n"
-            for champ in history["championships"][:10]:  # Show first 10
-                response += f"• {champ['competition_name']} {champ['season']}\n"
-            response += "\n"
-
-        # Competitions participated
-        response += f"Competitions Participated ({history['total_competitions']} total):\n"
-        recent_comps = list({c['competition_name']: c for c in history['competitions_participated']}.values())[:5]
-        for comp in recent_comps:
-            response += f"• {comp['competition_name']}\n"
-
-        return [TextContent(type="text", text=response)]
-
-    except Exception as e:
-        logger.error(f"Error in get_team_history: {e}")
-        return [TextContent(type="text", text=f"Error getting team history: {str(e)}")]
+    history = await team_tools.get_team_history(team_id, include_championships)
+
+    if "error" in history:
+        return [TextContent(type="text", text=history["error"])]
+
+    # Format history
+    team = history["team"]
+    parts = [f"History of {team['name']}:\n\n"]
+
+    if team.get('founded_year'):
+        parts.append(f"Founded: {team['founded_year']}\n")
+    if team.get('city'):
+        parts.append(f"City: {team['city']}\n")
+    if team.get('stadium_name'):
+        parts.append(f"Stadium: {team['stadium_name']}")
+        if team.get('stadium_capacity'):
+            parts.append(f" (Capacity: {team['stadium_capacity']:,})")
+        parts.append("\n")
+    parts.append("\n")
+
+    # Championships
+    if include_championships and history.get("championships"):
+        parts.append(f"Championships ({history['total_championships']}):\n")
+        for champ in history["championships"][:10]:  # Show first 10
+            parts.append(f"• {champ['competition_name']} {champ['season']}\n")
+        parts.append("\n")
+
+    # Competitions participated
+    parts.append(f"Competitions Participated ({history['total_competitions']} total):\n")
+    # Five most recent distinct names; stop as soon as they are found
+    seen = set()
+    for comp in history["competitions_participated"]:
+        comp_name = comp["competition_name"]
+        if comp_name in seen:
+            continue
+        seen.add(comp_name)
+        parts.append(f"• {comp_name}\n")
+        if len(seen) == 5:
+            break
+
+    return [TextContent(type="text", text="".join(parts))]
 
 
 # ============================================================================
 # MATCH TOOLS
 # ============================================================================
 
-@server.call_tool()
-async def get_match_details(match_id: str) -> List[TextContent]:
+@tool(match_tools.get_match_details)
+async def get_match_details(
+    match_id: str,
+    detail_level: match_tools.DetailLevel = "full"
+) -> List[TextContent]:
     """
     Get detailed information about a specific match.
 
     Args:
         match_id: Unique match identifier
+        detail_level: "full" for scorers and cards, "summary" for their
+            counts only (default: "full")
 
     Returns:
         Detailed match information including scorers and cards
     """
-    try:
-        details = await match_tools.get_match_details(match_id)
-
-        if "error" in details:
-            return [TextContent(type="text", text=details["error"])]
-
-        # Format match details
-        match = details["match"]
-        response = f"{match['home_team_name']} {match['home_score']} - {match['away_score']} {match['away_team_name']}\n"
-        response += f"Date: {match['date']}\n"
-        response += f"Competition: {match['competition_name']} ({match['season']})\n"
-        if match.get('stadium_name'):
-            response += f"Stadium: {match['stadium_name']}, {match.get('stadium_city', '')}\n"
-        if match.get('attendance'):
-            response += f"Attendance: {match['attendance']:,}\n"
-        response += "\n"
-
-        # Scorers
-        if details["scorers"]:
-            response += "Goal Scorers:\n"
-            for scorer in details["scorers"]:
-                response += f"• {scorer['minute']}' {scorer['player_name']} ({scorer['team_name']})\n"
-            response += "\n"
-
-        # Cards
-        if details["cards"]:
-            response += "Cards:\n"
-            for card in details["cards"]:
-                card_emoji = "🟨" if card['card_type'] == 'Yellow' else "🟥"
-                response += f"• {card_emoji} {card['minute']}' {card['player_name']} ({card['team_name']})\n"
-
-        return [TextContent(type="text", text=response)]
+    details = await match_tools.get_match_details(match_id, detail_level)
 
-    except Exception as e:
-        logger.error(f"Error in get_match_details: {e}")
-        return [TextContent(type="text", text=f"Error getting match details: {str(e)}")]
+    if "error" in details:
+        return [TextContent(type="text", text=details["error"])]
 
+    return [TextContent(type="text", text=format_match_details(details))]
 
-@server.call_tool()
+
+@tool(match_tools.get_matches_bulk)
+async def get_matches_bulk(match_ids: List[str]) -> List[TextContent]:
+    """
+    Get detailed information about several matches in one request.
+
+    Args:
+        match_ids: Unique match identifiers
+
+    Returns:
+        Detailed information for each match found, one content block per match
+    """
+    bulk = await match_tools.get_matches_bulk(match_ids)
+
+    # One block per match, in the requested order
+    content = [
+        TextContent(type="text", text=format_match_details(bulk["matches"][match_id]))
+        for match_id in dict.fromkeys(match_ids) if match_id in bulk["matches"]
+    ]
+    if bulk["not_found"]:
+        content.append(TextContent(type="text", text=f"Matches not found: {', '.join(bulk['not_found'])}"))
+
+    return content
+
+
+@tool(match_tools.search_matches)
 async def search_matches(
     team: Optional[str] = None,
     date_from: Optional[str] = None,
@@ -547,32 +739,28 @@ async def search_matches(
     Returns:
         List of matches matching search criteria
     """
-    try:
-        results = await match_tools.search_matches(team, date_from, date_to, competition, limit)
+    results = await match_tools.search_matches(team, date_from, date_to, competition, limit)
 
-        if not results:
-            return [TextContent(type="text", text="No matches found matching criteria")]
+    if not results:
+        return [TextContent(type="text", text="No matches found matching criteria")]
 
-        # Format results
-        response = f"Found {len(results)} match(es):\n\n"
-        for match in results:
-            response += f"{match['date']}: {match['home_team']} {match['home_score']} - {match['away_score']} {match['away_team']}\n"
-            if match.get('competition_name'):
-                response += f"  Competition: {match['competition_name']}\n"
-            response += "\n"
+    # Format results
+    parts = [f"Found {len(results)} match(es):\n\n"]
+    match_row = MATCH_ROW_TEMPLATE.format_map
+    for match in results:
+        parts.append(match_row(match))
+        if match.get('competition_name'):
+            parts.append(f"  Competition: {match['competition_name']}\n")
+        parts.append("\n")
 
-        return [TextContent(type="text", text=response)]
+    return [TextContent(type="text", text="".join(parts))]
 
-    except Exception as e:
-        logger.error(f"Error in search_matches: {e}")
-        return [TextContent(type="text", text=f"Error searching matches: {str(e)}")]
 
-
-@server.call_tool()
+@tool(match_tools.get_head_to_head)
 async def get_head_to_head(
     team1_id: str,
     team2_id: str,
-    limit: Optional[int] = None
+    limit: Optional[int] = 5
 ) -> List[TextContent]:
     """
     Get head-to-head statistics between two teams.
@@ -580,39 +768,37 @@ async def get_head_to_head(
     Args:
         team1_id: First team identifier
         team2_id: Second team identifier
-        limit: Limit number of recent matches (optional)
+        limit: Number of recent matches to return (default: 5, None for all)
 
     Returns:
         Head-to-head statistics and recent matches
     """
-    try:
-        h2h = await match_tools.get_head_to_head(team1_id, team2_id, limit)
-
-        if "error" in h2h:
-            return [TextContent(type="text", text=h2h["error"])]
+    h2h = await match_tools.get_head_to_head(team1_id, team2_id, limit)
 
-        # Format head-to-head
-        response = f"Head-to-Head: {h2h['team1']['name']} vs {h2h['team2']['name']}\n\n"
-        response += f"Total Matches: {h2h['total_matches']}\n"
-        response += f"{h2h['team1']['name']} Wins: {h2h['team1']['wins']}\n"
-        response += f"{h2h['team2']['name']} Wins: {h2h['team2']['wins']}\n"
-        response += f"Draws: {h2h['draws']}\n"
-        response += f"Goals: {h2h['team1']['goals']} - {h2h['team2']['goals']}\n\n"
+    if "error" in h2h:
+        return [TextContent(type="text", text=h2h["error"])]
 
-        # Recent matches
-        if h2h["recent_matches"]:
-            response += "Recent Matches:\n"
-            for match in h2h["recent_matches"][:5]:
-                response += f"• {match['date']}: {match['home_team']} {match['home_score']} - {match['away_score']} {match['away_team']}\n"
+    # Format head-to-head
+    parts = [
+        f"Head-to-Head: {h2h['team1']['name']} vs {h2h['team2']['name']}\n\n",
+        f"Total Matches: {h2h['total_matches']}\n",
+        f"{h2h['team1']['name']} Wins: {h2h['team1']['wins']}\n",
+        f"{h2h['team2']['name']} Wins: {h2h['team2']['wins']}\n",
+        f"Draws: {h2h['draws']}\n",
+        f"Goals: {h2h['team1']['goals']} - {h2h['team2']['goals']}\n\n"
+    ]
 
-        return [TextContent(type="text", text=response)]
+    # Recent matches
+    if h2h["recent_matches"]:
+        parts.append("Recent Matches:\n")
+        match_row = MATCH_ROW_TEMPLATE.format_map
+        for match in h2h["recent_matches"]:
+            parts.append("• " + match_row(match))
 
-    except Exception as e:
-        logger.error(f"Error in get_head_to_head: {e}")
-        return [TextContent(type="text", text=f"Error getting head-to-head: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
-@server.call_tool()
+@tool(match_tools.get_match_scorers)
 async def get_match_scorers(match_id: str) -> List[TextContent]:
     """
     Get all goal scorers in a specific match.
@@ -623,31 +809,29 @@ async def get_match_scorers(match_id: str) -> List[TextContent]:
     Returns:
         List of goal scorers with details
     """
-    try:
-        scorers = await match_tools.get_match_scorers(match_id)
+    scorers = await match_tools.get_match_scorers(match_id)
 
-        if not scorers:
-            return [TextContent(type="text", text="No goals scored in this match")]
+    if "error" in scorers:
+        return [TextContent(type="text", text=scorers["error"])]
 
-        # Format scorers
-        response = f"Goal Scorers ({len(scorers)} goals):\n\n"
-        for scorer in scorers:
-            response += f"• {scorer['minute']}' {scorer['player_name']} ({scorer['team_name']})\n"
-            if scorer.get('goal_type'):
-                response += f"  Type: {scorer['goal_type']}\n"
+    if not scorers:
+        return [TextContent(type="text", text="No goals scored in this match")]
 
-        return [TextContent(type="text", text=response)]
+    # Format scorers
+    parts = [f"Goal Scorers ({len(scorers)} goals):\n\n"]
+    for scorer in scorers:
+        parts.append(f"• {scorer['minute']}' {scorer['player_name']} ({scorer['team_name']})\n")
+        if scorer.get('goal_type'):
+            parts.append(f"  Type: {scorer['goal_type']}\n")
 
-    except Exception as e:
-        logger.error(f"Error in get_match_scorers: {e}")
-        return [TextContent(type="text", text=f"Error getting match scorers: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
 # ============================================================================
 # COMPETITION TOOLS
 # ============================================================================
 
-@server.call_tool()
+@tool(competition_tools.get_competition_standings)
 async def get_competition_standings(
     competition_id: str,
     season: str
@@ -662,38 +846,32 @@ async def get_competition_standings(
     Returns:
         Competition standings with points and statistics
     """
-    try:
-        standings = await competition_tools.get_competition_standings(competition_id, season)
-
-        if "error" in standings:
-            return [TextContent(type="text", text=standings["error"])]
-
-        # Format standings
-        comp = standings["competition"]
-        response = f"{comp['name']} {comp['season']} - Standings\n\n"
-        response += f"{'Pos':<4} {'Team':<25} {'P':<4} {'W':<4} {'D':<4} {'L':<4} {'GF':<4} {'GA':<4} {'GD':<5} {'Pts':<4}\n"
-        response += "-" * 80 + "\n"
-
-        for team in standings["standings"]:
-            response += f"{team['position']:<4} "
-            response += f"{team['team_name'][:24]:<25} "
-            response += f"{team['played']:<4} "
-            response += f"{team['wins']:<4} "
-            response += f"{team['draws']:<4} "
-            response += f"{team['losses']:<4} "
-            response += f"{team['goals_for']:<4} "
-            response += f"{team['goals_against']:<4} "
-            response += f"{team['goal_difference']:>4} "
-            response += f"{team['points']:<4}\n"
-
-        return [TextContent(type="text", text=response)]
+    standings = await competition_tools.get_competition_standings(competition_id, season)
 
-    except Exception as e:
-        logger.error(f"Error in get_competition_standings: {e}")
-        return [TextContent(type="text", text=f"Error getting standings: {str(e)}")]
+    if "error" in standings:
+        return [TextContent(type="text", text=standings["error"])]
 
+    # Format standings
+    comp = standings["competition"]
+    parts = [
+        f"{comp['name']} {comp['season']} - Standings\n\n",
+        STANDINGS_HEADER,
+        STANDINGS_SEPARATOR
+    ]
 
-@server.call_tool()
+    row = STANDINGS_ROW_TEMPLATE.format
+    for team in standings["standings"]:
+        parts.append(row(
+            team['position'], team['team_name_display'], team['played'],
+            team['wins'], team['draws'], team['losses'],
+            team['goals_for'], team['goals_against'],
+            team['goal_difference'], team['points']
+        ))
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+@tool(competition_tools.get_competition_top_scorers)
 async def get_competition_top_scorers(
     competition_id: str,
     season: str,
@@ -710,32 +888,29 @@ async def get_competition_top_scorers(
     Returns:
         List of top scorers with goal counts
     """
-    try:
-        top_scorers = await competition_tools.get_competition_top_scorers(competition_id, season, limit)
+    top_scorers = await competition_tools.get_competition_top_scorers(competition_id, season, limit)
 
-        if "error" in top_scorers:
-            return [TextContent(type="text", text=top_scorers["error"])]
+    if "error" in top_scorers:
+        return [TextContent(type="text", text=top_scorers["error"])]
 
-        # Format top scorers
-        comp = top_scorers["competition"]
-        response = f"{comp['name']} {comp['season']} - Top Scorers\n\n"
+    # Format top scorers
+    comp = top_scorers["competition"]
+    parts = [f"{comp['name']} {comp['season']} - Top Scorers\n\n"]
 
-        for scorer in top_scorers["top_scorers"]:
-            response += f"{scorer['rank']}. {scorer['player_name']} ({scorer['team_name']}) - {scorer['goals']} goals\n"
+    for scorer in top_scorers["top_scorers"]:
+        parts.append(f"{scorer['rank']}. {scorer['player_name']} ({scorer['team_name']}) - {scorer['goals']} goals\n")
 
-        return [TextContent(type="text", text=response)]
-
-    except Exception as e:
-        logger.error(f"Error in get_competition_top_scorers: {e}")
-        return [TextContent(type="text", text=f"Error getting top scorers: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
-@server.call_tool()
+@tool(competition_tools.get_competition_matches)
 async def get_competition_matches(
     competition_id: str,
     season: str,
     team: Optional[str] = None,
-    round: Optional[int] = None
+    round: Optional[int] = None,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1)] = 20
 ) -> List[TextContent]:
     """
     Get all matches in a competition.
@@ -745,38 +920,28 @@ async def get_competition_matches(
         season: Season year (format: "2023")
         team: Filter by specific team (optional)
         round: Filter by specific round/matchday (optional)
+        offset: Number of matches to skip, for paging (default: 0)
+        limit: Maximum number of matches to list (default: 20)
 
     Returns:
         List of matches in the competition
     """
-    try:
-        matches = await competition_tools.get_competition_matches(competition_id, season, team, round)
-
-        if "error" in matches:
-            return [TextContent(type="text", text=matches["error"])]
+    matches = await competition_tools.get_competition_matches(
+        competition_id, season, team, round, offset=offset, limit=limit
+    )
 
-        # Format matches
-        comp = matches["competition"]
-        response = f"{comp['name']} {comp['season']} - Matches ({matches['total_matches']} total)\n\n"
+    if "error" in matches:
+        return [TextContent(type="text", text=matches["error"])]
 
-        for match in matches["matches"][:20]:  # Show first 20
-            response += f"{match['date']}: {match['home_team']} {match['home_score']} - {match['away_score']} {match['away_team']}\n"
-
-        if matches['total_matches'] > 20:
-            response += f"\n... and {matches['total_matches'] - 20} more matches"
-
-        return [TextContent(type="text", text=response)]
-
-    except Exception as e:
-        logger.error(f"Error in get_competition_matches: {e}")
-        return [TextContent(type="text", text=f"Error getting competition matches: {str(e)}")]
+    # Format matches, one content block per page of rows
+    return [TextContent(type="text", text=page) for page in render_match_pages(matches)]
 
 
 # ============================================================================
 # ANALYSIS TOOLS
 # ============================================================================
 
-@server.call_tool()
+@tool(analysis_tools.find_common_teammates)
 async def find_common_teammates(
     player1_id: str,
     player2_id: str
@@ -791,38 +956,35 @@ async def find_common_teammates(
     Returns:
         List of common teammates
     """
-    try:
-        result = await analysis_tools.find_common_teammates(player1_id, player2_id)
-
-        if "error" in result:
-            return [TextContent(type="text", text=result["error"])]
+    result = await analysis_tools.find_common_teammates(player1_id, player2_id)
 
-        # Format results
-        response = f"Common teammates of {result['player1']['name']} and {result['player2']['name']}:\n\n"
-        response += f"Found {result['total_common_teammates']} common teammate(s)\n\n"
+    if "error" in result:
+        return [TextContent(type="text", text=result["error"])]
 
-        # Group by team
-        teams = {}
-        for teammate in result["common_teammates"]:
-            team = teammate["team_name"]
-            if team not in teams:
-                teams[team] = []
-            teams[team].append(teammate)
+    # Format results
+    parts = [
+        f"Common teammates of {result['player1']['name']} and {result['player2']['name']}:\n\n",
+        f"Found {result['total_common_teammates']} common teammate(s)\n\n"
+    ]
 
-        for team, teammates in teams.items():
-            response += f"{team}:\n"
-            for teammate in teammates:
-                response += f"  • {teammate['player_name']} ({teammate.get('position', 'N/A')})\n"
-            response += "\n"
+    # Group by team, listing a teammate once per team however many stints
+    # they had there; team names repeat across rows, so share one copy each
+    intern = sys.intern
+    teams = defaultdict(list)
+    for teammate in result["common_teammates"]:
+        for team_name in dict.fromkeys(stint["team_name"] for stint in teammate["stints"]):
+            teams[intern(team_name)].append(teammate)
 
-        return [TextContent(type="text", text=response)]
+    for team, teammates in sorted(teams.items()):
+        parts.append(f"{team}:\n")
+        for teammate in teammates:
+            parts.append(f"  • {teammate['player_name']} ({teammate.get('position', 'N/A')})\n")
+        parts.append("\n")
 
-    except Exception as e:
-        logger.error(f"Error in find_common_teammates: {e}")
-        return [TextContent(type="text", text=f"Error finding common teammates: {str(e)}")]
+    return [TextContent(type="text", text="".join(parts))]
 
 
-@server.call_tool()
+@tool(analysis_tools.get_rivalry_stats)
 async def get_rivalry_stats(
     team1_id: str,
     team2_id: str,
@@ -839,80 +1001,114 @@ async def get_rivalry_stats(
     Returns:
         Comprehensive rivalry statistics
     """
-    try:
-        rivalry = await analysis_tools.get_rivalry_stats(team1_id, team2_id, years)
-
-        if "error" in rivalry:
-            return [TextContent(type="text", text=rivalry["error"])]
-
-        # Format rivalry stats
-        team1 = rivalry["teams"]["team1"]
-        team2 = rivalry["teams"]["team2"]
-        overall = rivalry["overall"]
-
-        response = f"Rivalry: {team1['name']} vs {team2['name']}\n"
-        response += f"Time Period: {rivalry['time_period']}\n\n"
-
-        response += f"Overall Record:\n"
-        response += f"Total Matches: {overall['total_matches']}\n"
-        response += f"{team1['name']} Wins: {team1['wins']}\n"
-        response += f"{team2['name']} Wins: {team2['wins']}\n"
-        response += f"Draws: {overall['draws']}\n"
-        response += f"Goals: {team1['goals']} - {team2['goals']}\n"
-        response += f"Biggest Margin: {overall['biggest_margin']} goals\n\n"
-
-        # Biggest victories
-        if rivalry["biggest_victories"]:
-            response += "Biggest Victories:\n"
-            for match in rivalry["biggest_victories"][:3]:
-                response += f"• {match['date']}: {match['home_team']} {match['home_score']} - {match['away_score']} {match['away_team']}\n"
-            response += "\n"
-
-        # Top scorers
-        if rivalry["top_scorers"]:
-            response += "Top Scorers in Rivalry:\n"
-            for scorer in rivalry["top_scorers"][:5]:
-                response += f"• {scorer['player_name']} ({scorer['team_name']}) - {scorer['goals']} goals\n"
-
-        return [TextContent(type="text", text=response)]
-
-    except Exception as e:
-        logger.error(f"Error in get_rivalry_stats: {e}")
-        return [TextContent(type="text", text=f"Error getting rivalry stats: {str(e)}")]
-
-
-@server.call_tool()
-async def find_players_by_career_path(criteria: Dict[str, Any]) -> List[TextContent]:
+    rivalry = await analysis_tools.get_rivalry_stats(team1_id, team2_id, years)
+
+    if "error" in rivalry:
+        return [TextContent(type="text", text=rivalry["error"])]
+
+    # Format rivalry stats
+    team1 = rivalry["teams"]["team1"]
+    team2 = rivalry["teams"]["team2"]
+    overall = rivalry["overall"]
+
+    sections = [
+        f"Rivalry: {team1['name']} vs {team2['name']}\n"
+        f"Time Period: {rivalry['time_period']}\n",
+        "Overall Record:\n"
+        f"Total Matches: {overall['total_matches']}\n"
+        f"{team1['name']} Wins: {team1['wins']}\n"
+        f"{team2['name']} Wins: {team2['wins']}\n"
+        f"Draws: {overall['draws']}\n"
+        f"Goals: {team1['goals']} - {team2['goals']}\n"
+        f"Biggest Margin: {overall['biggest_margin']} goals\n",
+    ]
+
+    # Biggest victories
+    if rivalry["biggest_victories"]:
+        sections.append("Biggest Victories:\n" + "".join(
+            f"• {match['date']}: {match['home_team']} {match['home_score']} - {match['away_score']} {match['away_team']}\n"
+            for match in rivalry["biggest_victories"]
+        ))
+
+    # Top scorers
+    if rivalry["top_scorers"]:
+        sections.append("Top Scorers in Rivalry:\n" + "".join(
+            f"• {scorer['player_name']} ({scorer['team_name']}) - {scorer['goals']} goals\n"
+            for scorer in rivalry["top_scorers"]
+        ))
+
+    return [TextContent(type="text", text="\n".join(sections))]
+
+
+@tool(analysis_tools.find_players_by_career_path)
+async def find_players_by_career_path(
+    criteria: Dict[str, Any],
+    limit: int = 50
+) -> List[TextContent]:
     """
     Find players matching complex career path criteria.
 
     Args:
         criteria: Dictionary with search criteria (teams, min_teams, positions, min_goals, etc.)
+        limit: Maximum number of results (default: 50)
 
     Returns:
         List of players matching the career path criteria
     """
-    try:
-        results = await analysis_tools.find_players_by_career_path(criteria)
+    results = await analysis_tools.find_players_by_career_path(criteria, limit)
 
-        if not results:
-            return [TextContent(type="text", text="No players found matching criteria")]
+    if not results:
+        return [TextContent(type="text", text="No players found matching criteria")]
 
-        # Format results
-        response = f"Found {len(results)} player(s) matching career criteria:\n\n"
+    # Format results
+    parts = [f"Found {len(results)} player(s) matching career criteria:\n\n"]
 
-        for player in results:
-            response += f"• {player['name']} ({player.get('position', 'N/A')})\n"
-            response += f"  Teams ({player['num_teams']}): {', '.join(player['teams'][:5])}\n"
-            if len(player['teams']) > 5:
-                response += f"  ... and {len(player['teams']) - 5} more\n"
-            response += "\n"
+    for player in results:
+        parts.append(f"• {player['name']} ({player.get('position', 'N/A')})\n")
+        parts.append(f"  Teams ({player['num_teams']}): {', '.join(player['teams'][:5])}\n")
+        if len(player['teams']) > 5:
+            parts.append(f"  ... and {len(player['teams']) - 5} more\n")
+        parts.append("\n")
 
-        return [TextContent(type="text", text=response)]
+    return [TextContent(type="text", text="".join(parts))]
 
-    except Exception as e:
-        logger.error(f"Error in find_players_by_career_path: {e}")
-        return [TextContent(type="text", text=f"Error finding players: {str(e)}")]
+
+# ============================================================================
+# TOOL DISPATCH
+# ============================================================================
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List all registered tools with their input schemas."""
+    return TOOL_DEFINITIONS
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Optional[Dict[str, Any]]) -> List[TextContent]:
+    """Validate arguments with the tool's cached model and dispatch the call."""
+    if name not in TOOLS:
+        raise ValueError(f"Unknown tool: {name}")
+
+    handler, source, arguments_model = TOOLS[name]
+    validated = dict(arguments_model.model_validate(arguments or {}))
+    json_output = validated.pop("format") == "json"
+
+    # Failures are logged with their traceback here, once for every tool;
+    # the client only gets a fixed message
+    try:
+        if json_output:
+            return [TextContent(type="text", text=dumps_json(await source(**validated)))]
+        return await handler(**validated)
+    except Neo4jError:
+        logger.exception("Database error in %s", name)
+        message = DATABASE_ERROR_TEXT
+    except Exception:
+        logger.exception("Error in %s", name)
+        message = INTERNAL_ERROR_TEXT
+
+    if json_output:
+        return [TextContent(type="text", text=dumps_json({"error": message}))]
+    return [TextContent(type="text", text=message)]
 
 
 # ============================================================================
@@ -921,20 +1117,21 @@ async def find_players_by_career_path(criteria: Dict[str, Any]) -> List[TextCont
 
 async def main():
     """Main entry point for the MCP server."""
-    try:
-        await startup()
+    settings.configure_logging()
 
-        # Run the server
-        async with server:
-            await server.run()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
 
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         raise
-    finally:
-        await shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,200 @@
+"""
+Brazilian Soccer MCP Server - Statistics Snapshots
+
+CONTEXT:
+This module maintains pre-aggregated statistics nodes in the graph so the
+stats tools can answer with a single indexed lookup instead of re-running
+multi-hop aggregations on every call:
+- (:PlayerStatsSnapshot) per player and season (plus season "ALL")
+- (:TeamStatsSnapshot) per team and season (plus season "ALL")
+- (:StandingsSnapshot) per competition, season and team
+- Player.total_goals, the player's SCORED_IN count (also kept up to date
+  by the importer)
+
+Each snapshot carries a `definition` property: a hash of the aggregation
+query that produced it. Readers only accept snapshots built by the current
+definition, so changing an aggregation never serves stale-shaped data and
+older definitions can coexist until they are cleaned up.
+
+Snapshots are refreshed out of band (e.g. nightly via
+scripts/refresh_stats.py). Tools fall back to live aggregation when no
+snapshot exists for the requested key.
+
+DEPENDENCIES:
+- src.database: Database connection management
+
+USAGE:
+    from src.snapshots import refresh_stats_snapshots
+
+    counts = await refresh_stats_snapshots(db)
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from src.database import Neo4jConnection
+
+# Season key used for all-time snapshots
+ALL_SEASONS = "ALL"
+
+PLAYER_STATS_REFRESH = """
+MATCH (p:Player)
+OPTIONAL MATCH (p)-[r:SCORED_IN|ASSISTED_IN|RECEIVED_CARD|PLAYED_IN]->(m:Match)
+WITH p, r, m,
+     CASE WHEN m IS NULL THEN [] ELSE [(m)-[:PART_OF]->(c:Competition) | c.season] END
+       + [$all_seasons] AS seasons
+UNWIND seasons AS season
+WITH p, season,
+     count(CASE WHEN type(r) = 'SCORED_IN' THEN r END) AS total_goals,
+     count(CASE WHEN type(r) = 'ASSISTED_IN' THEN r END) AS total_assists,
+     count(DISTINCT CASE WHEN type(r) = 'PLAYED_IN' THEN m END) AS total_matches,
+     count(CASE WHEN type(r) = 'RECEIVED_CARD' AND r.card_type = 'Yellow' THEN r END) AS yellow_cards,
+     count(CASE WHEN type(r) = 'RECEIVED_CARD' AND r.card_type = 'Red' THEN r END) AS red_cards
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[pf:PLAYS_FOR]->(t:Team)
+    WITH t, pf ORDER BY pf.from_date DESC
+    RETURN collect(t.name) AS teams
+}
+MERGE (s:PlayerStatsSnapshot {player_id: p.player_id, season: season, definition: $definition})
+SET s.total_goals = total_goals,
+    s.total_assists = total_assists,
+    s.total_matches = total_matches,
+    s.yellow_cards = yellow_cards,
+    s.red_cards = red_cards,
+    s.teams = teams,
+    s.refreshed_at = datetime()
+"""
+
+TEAM_STATS_REFRESH = """
+MATCH (t:Team)
+OPTIONAL MATCH (m:Match)
+WHERE m.home_team_id = t.team_id OR m.away_team_id = t.team_id
+WITH t, m,
+     CASE WHEN m IS NULL THEN [] ELSE [(m)-[:PART_OF]->(c:Competition) | c.season] END
+       + [$all_seasons] AS seasons
+UNWIND seasons AS season
+WITH t, m, season,
+     CASE WHEN m.home_team_id = t.team_id THEN m.home_score ELSE m.away_score END AS goals_for,
+     CASE WHEN m.home_team_id = t.team_id THEN m.away_score ELSE m.home_score END AS goals_against,
+     CASE WHEN m.home_team_id = t.team_id THEN 'home' ELSE 'away' END AS venue,
+     CASE
+       WHEN m IS NULL THEN null
+       WHEN m.home_team_id = t.team_id AND m.home_score > m.away_score THEN 'win'
+       WHEN m.away_team_id = t.team_id AND m.away_score > m.home_score THEN 'win'
+       WHEN m.home_score = m.away_score THEN 'draw'
+       ELSE 'loss'
+     END AS result
+WITH t, season,
+     count(m) AS total_matches,
+     sum(CASE WHEN result = 'win' THEN 1 ELSE 0 END) AS wins,
+     sum(CASE WHEN result = 'draw' THEN 1 ELSE 0 END) AS draws,
+     sum(CASE WHEN result = 'loss' THEN 1 ELSE 0 END) AS losses,
+     coalesce(sum(goals_for), 0) AS goals_scored,
+     coalesce(sum(goals_against), 0) AS goals_conceded,
+     sum(CASE WHEN m IS NOT NULL AND venue = 'home' THEN 1 ELSE 0 END) AS home_matches,
+     sum(CASE WHEN venue = 'home' AND result = 'win' THEN 1 ELSE 0 END) AS home_wins,
+     sum(CASE WHEN m IS NOT NULL AND venue = 'away' THEN 1 ELSE 0 END) AS away_matches,
+     sum(CASE WHEN venue = 'away' AND result = 'win' THEN 1 ELSE 0 END) AS away_wins
+MERGE (s:TeamStatsSnapshot {team_id: t.team_id, season: season, definition: $definition})
+SET s.total_matches = total_matches,
+    s.wins = wins,
+    s.draws = draws,
+    s.losses = losses,
+    s.goals_scored = goals_scored,
+    s.goals_conceded = goals_conceded,
+    s.home_matches = home_matches,
+    s.home_wins = home_wins,
+    s.away_matches = away_matches,
+    s.away_wins = away_wins,
+    s.refreshed_at = datetime()
+"""
+
+
+STANDINGS_REFRESH = """
+MATCH (c:Competition)<-[:PART_OF]-(m:Match)
+UNWIND [
+    {team_id: m.home_team_id, goals_for: m.home_score, goals_against: m.away_score},
+    {team_id: m.away_team_id, goals_for: m.away_score, goals_against: m.home_score}
+] AS side
+WITH c, side.team_id AS team_id,
+     count(*) AS played,
+     sum(CASE WHEN side.goals_for > side.goals_against THEN 1 ELSE 0 END) AS wins,
+     sum(CASE WHEN side.goals_for = side.goals_against THEN 1 ELSE 0 END) AS draws,
+     sum(CASE WHEN side.goals_for < side.goals_against THEN 1 ELSE 0 END) AS losses,
+     sum(side.goals_for) AS goals_for,
+     sum(side.goals_against) AS goals_against
+MATCH (t:Team {team_id: team_id})
+MERGE (s:StandingsSnapshot {
+    competition_id: c.competition_id, season: c.season, team_id: team_id, definition: $definition
+})
+SET s.team_name = t.name,
+    s.played = played,
+    s.wins = wins,
+    s.draws = draws,
+    s.losses = losses,
+    s.goals_for = goals_for,
+    s.goals_against = goals_against,
+    s.points = wins * 3 + draws,
+    s.refreshed_at = datetime()
+"""
+
+
+PLAYER_GOAL_TOTALS_REFRESH = """
+MATCH (p:Player)
+SET p.total_goals = COUNT { (p)-[:SCORED_IN]->(:Match) }
+"""
+
+
+def _definition(query: str) -> str:
+    """Short, stable hash identifying an aggregation query."""
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+
+
+PLAYER_STATS_DEFINITION = _definition(PLAYER_STATS_REFRESH)
+TEAM_STATS_DEFINITION = _definition(TEAM_STATS_REFRESH)
+STANDINGS_DEFINITION = _definition(STANDINGS_REFRESH)
+
+SNAPSHOT_INDEXES = [
+    "CREATE INDEX player_stats_snapshot_key IF NOT EXISTS "
+    "FOR (s:PlayerStatsSnapshot) ON (s.player_id, s.season, s.definition)",
+    "CREATE INDEX team_stats_snapshot_key IF NOT EXISTS "
+    "FOR (s:TeamStatsSnapshot) ON (s.team_id, s.season, s.definition)",
+    "CREATE INDEX standings_snapshot_key IF NOT EXISTS "
+    "FOR (s:StandingsSnapshot) ON (s.competition_id, s.season, s.definition)",
+]
+
+
+def snapshot_season(season: Optional[str]) -> str:
+    """Map a tool's optional season argument to a snapshot season key."""
+    return season or ALL_SEASONS
+
+
+async def refresh_stats_snapshots(db: Neo4jConnection) -> Dict[str, Any]:
+    """
+    Rebuild all player, team and standings snapshots and player goal
+    totals.
+
+    Args:
+        db: Connected database instance
+
+    Returns:
+        Write counters for each snapshot type
+    """
+    for index in SNAPSHOT_INDEXES:
+        await db.execute_write(index)
+
+    players = await db.execute_write(PLAYER_STATS_REFRESH, {
+        "definition": PLAYER_STATS_DEFINITION,
+        "all_seasons": ALL_SEASONS
+    })
+    teams = await db.execute_write(TEAM_STATS_REFRESH, {
+        "definition": TEAM_STATS_DEFINITION,
+        "all_seasons": ALL_SEASONS
+    })
+    standings = await db.execute_write(STANDINGS_REFRESH, {
+        "definition": STANDINGS_DEFINITION
+    })
+    await db.execute_write(PLAYER_GOAL_TOTALS_REFRESH)
+
+    return {"players": players, "teams": teams, "standings": standings}
@@ -32,12 +32,16 @@ USAGE:
 """
 
 from typing import List, Optional, Dict, Any
+import functools
+import json
 import logging
+from src.cache import async_ttl_cache
 from src.database import get_db
 
 logger = logging.getLogger(__name__)
 
 
+@async_ttl_cache()
 async def find_common_teammates(
     player1_id: str,
     player2_id: str
@@ -55,7 +59,8 @@ async def find_common_teammates(
     Returns:
         Dictionary with:
         - Player information for both players
-        - List of common teammates with teams and dates
+        - List of common teammates, each with the overlapping stints
+          (team and dates) they played
         - Total count of common teammates
 
     Example:
@@ -65,73 +70,85 @@ async def find_common_teammates(
         ... )
     """
     db = get_db()
-    logger.info(f"Finding common teammates: {player1_id} and {player2_id}")
-
-    # Get player names
-    players_query = """
+    logger.info("Finding common teammates: %s and %s", player1_id, player2_id)
+
+    # Both players and their common teammates in one round-trip.
+    # Common teammates played for the same team as both players during
+    # overlapping time periods. Overlapping both stints means starting
+    # before the earlier end and ending after the later start, so the window
+    # is computed once per pair of stints and each candidate stint is checked
+    # with two comparisons. Dates are ISO strings; open ends are replaced by
+    # sentinels that sort before/after any date.
+    teammates_query = """
     MATCH (p1:Player {player_id: $player1_id})
     MATCH (p2:Player {player_id: $player2_id})
-    RETURN p1.name AS player1_name, p2.name AS player2_name
-    """
-
-    # Find common teammates
-    # This query finds players who played for the same team as both players
-    # during overlapping time periods
-    teammates_query = """
-    MATCH (p1:Player {player_id: $player1_id})-[pf1:PLAYS_FOR]->(t:Team)
-    MATCH (p2:Player {player_id: $player2_id})-[pf2:PLAYS_FOR]->(t)
-    MATCH (common:Player)-[pfc:PLAYS_FOR]->(t)
-    WHERE common.player_id <> $player1_id
-      AND common.player_id <> $player2_id
-      AND (
-        (pf1.from_date IS NULL OR pfc.to_date IS NULL OR pf1.from_date <= pfc.to_date)
-        AND (pf1.to_date IS NULL OR pfc.from_date IS NULL OR pf1.to_date >= pfc.from_date)
-      )
-      AND (
-        (pf2.from_date IS NULL OR pfc.to_date IS NULL OR pf2.from_date <= pfc.to_date)
-        AND (pf2.to_date IS NULL OR pfc.from_date IS NULL OR pf2.to_date >= pfc.from_date)
-      )
-    RETURN DISTINCT
-           common.player_id AS player_id,
-           common.name AS player_name,
-           common.position AS position,
-           t.name AS team_name,
-           pfc.from_date AS from_date,
-           pfc.to_date AS to_date
-    ORDER BY t.name, pfc.from_date DESC
+    CALL {
+        WITH p1, p2
+        MATCH (p1)-[pf1:PLAYS_FOR]->(t:Team)<-[pf2:PLAYS_FOR]-(p2)
+        WITH t,
+             coalesce(pf1.from_date, '') AS from1, coalesce(pf2.from_date, '') AS from2,
+             coalesce(pf1.to_date, '9999-12-31') AS to1, coalesce(pf2.to_date, '9999-12-31') AS to2
+        WITH t,
+             CASE WHEN from1 > from2 THEN from1 ELSE from2 END AS window_from,
+             CASE WHEN to1 < to2 THEN to1 ELSE to2 END AS window_to
+        MATCH (common:Player)-[pfc:PLAYS_FOR]->(t)
+        WHERE common.player_id <> $player1_id
+          AND common.player_id <> $player2_id
+          AND coalesce(pfc.from_date, '') <= window_to
+          AND coalesce(pfc.to_date, '9999-12-31') >= window_from
+        WITH DISTINCT common, t, pfc
+        ORDER BY t.name, pfc.from_date DESC
+        WITH common, collect({
+            team_name: t.name,
+            from_date: pfc.from_date,
+            to_date: pfc.to_date
+        }) AS stints
+        ORDER BY common.name
+        RETURN collect({
+            player_id: common.player_id,
+            player_name: common.name,
+            position: common.position,
+            stints: stints
+        }) AS common_teammates
+    }
+    RETURN p1.name AS player1_name,
+           p2.name AS player2_name,
+           common_teammates
     """
 
     try:
         params = {"player1_id": player1_id, "player2_id": player2_id}
 
-        players_result = await db.execute_query(players_query, params)
-        if not players_result:
-            logger.warning(f"One or both players not found: {player1_id}, {player2_id}")
+        teammates_result = await db.execute_query(teammates_query, params)
+        if not teammates_result:
+            logger.warning("One or both players not found: %s, %s", player1_id, player2_id)
             return {"error": "One or both players not found"}
 
-        teammates_result = await db.execute_query(teammates_query, params)
+        players = teammates_result[0]
+        common_teammates = players["common_teammates"]
 
         result = {
             "player1": {
                 "player_id": player1_id,
-                "name": players_result[0]["player1_name"]
+                "name": players["player1_name"]
             },
             "player2": {
                 "player_id": player2_id,
-                "name": players_result[0]["player2_name"]
+                "name": players["player2_name"]
             },
-            "common_teammates": teammates_result,
-            "total_common_teammates": len(teammates_result)
+            "common_teammates": common_teammates,
+            "total_common_teammates": len(common_teammates)
         }
 
-        logger.info(f"Found {len(teammates_result)} common teammates")
+        logger.info("Found %s common teammates", len(common_teammates))
         return result
 
     except Exception as e:
-        logger.error(f"Error finding common teammates: {e}")
+        logger.error("Error finding common teammates: %s", e)
         raise
 
 
+@async_ttl_cache()
 async def get_rivalry_stats(
     team1_id: str,
     team2_id: str,
@@ -161,143 +178,220 @@ async def get_rivalry_stats(
         ... )
     """
     db = get_db()
-    logger.info(f"Getting rivalry stats: {team1_id} vs {team2_id}, years: {years}")
-
-    # Teams info
-    teams_query = """
+    logger.info("Getting rivalry stats: %s vs %s, years: %s", team1_id, team2_id, years)
+
+    # Both teams and every rivalry match, optionally limited to the last
+    # $years years, matched once and shared by the statistics, biggest wins
+    # and top scorers subqueries. Matches are looked up once per home/away
+    # order, so each lookup is an index seek rather than an OR over all
+    # matches. Values are always passed as parameters so the query text
+    # (and its cached plan) is the same for every call.
+    rivalry_query = """
     MATCH (t1:Team {team_id: $team1_id})
     MATCH (t2:Team {team_id: $team2_id})
-    RETURN t1.name AS team1_name, t2.name AS team2_name
+    UNWIND [[$team1_id, $team2_id], [$team2_id, $team1_id]] AS sides
+    OPTIONAL MATCH (m:Match {home_team_id: sides[0], away_team_id: sides[1]})
+    WHERE $years IS NULL OR date(m.date).year >= date().year - $years
+    WITH t1, t2, collect(m) AS rivalry_matches
+    CALL {
+        WITH rivalry_matches
+        UNWIND rivalry_matches AS m
+        WITH m,
+             CASE
+               WHEN m.home_team_id = $team1_id AND m.home_score > m.away_score THEN 'team1'
+               WHEN m.away_team_id = $team1_id AND m.away_score > m.home_score THEN 'team1'
+               WHEN m.home_score = m.away_score THEN 'draw'
+               ELSE 'team2'
+             END AS winner,
+             CASE WHEN m.home_team_id = $team1_id THEN m.home_score ELSE m.away_score END AS team1_score,
+             CASE WHEN m.home_team_id = $team2_id THEN m.home_score ELSE m.away_score END AS team2_score,
+             abs(m.home_score - m.away_score) AS goal_margin
+        RETURN
+             count(m) AS total_matches,
+             sum(CASE WHEN winner = 'team1' THEN 1 ELSE 0 END) AS team1_wins,
+             sum(CASE WHEN winner = 'team2' THEN 1 ELSE 0 END) AS team2_wins,
+             sum(CASE WHEN winner = 'draw' THEN 1 ELSE 0 END) AS draws,
+             sum(team1_score) AS team1_goals,
+             sum(team2_score) AS team2_goals,
+             max(goal_margin) AS biggest_margin
+    }
+    CALL {
+        WITH rivalry_matches
+        UNWIND rivalry_matches AS m
+        WITH m,
+             CASE
+               WHEN m.home_team_id = $team1_id THEN m.home_score - m.away_score
+               ELSE m.away_score - m.home_score
+             END AS margin
+        WHERE margin > 0
+        MATCH (home:Team {team_id: m.home_team_id})
+        MATCH (away:Team {team_id: m.away_team_id})
+        WITH m, home, away, margin
+        ORDER BY margin DESC, m.date DESC
+        LIMIT 3
+        RETURN collect({
+            match_id: m.match_id,
+            date: m.date,
+            home_team: home.name,
+            away_team: away.name,
+            home_score: m.home_score,
+            away_score: m.away_score,
+            margin: margin
+        }) AS biggest_victories
+    }
+    CALL {
+        WITH rivalry_matches
+        UNWIND rivalry_matches AS m
+        MATCH (p:Player)-[s:SCORED_IN]->(m)
+        WHERE s.team_id = $team1_id OR s.team_id = $team2_id
+        MATCH (t:Team {team_id: s.team_id})
+        WITH p, t, count(s) AS goals
+        ORDER BY goals DESC
+        LIMIT 5
+        RETURN collect({
+            player_id: p.player_id,
+            player_name: p.name,
+            team_name: t.name,
+            goals: goals
+        }) AS top_scorers
+    }
+    RETURN {
+        teams: {
+            team1: {team_id: t1.team_id, name: t1.name, wins: team1_wins, goals: team1_goals},
+            team2: {team_id: t2.team_id, name: t2.name, wins: team2_wins, goals: team2_goals}
+        },
+        overall: {
+            total_matches: total_matches,
+            draws: draws,
+            biggest_margin: biggest_margin
+        },
+        biggest_victories: biggest_victories,
+        top_scorers: top_scorers,
+        time_period: $time_period
+    } AS rivalry
     """
 
-    # Overall statistics with date filter
-    base_where = """
-    WHERE (m.home_team_id = $team1_id AND m.away_team_id = $team2_id)
-       OR (m.home_team_id = $team2_id AND m.away_team_id = $team1_id)
-    """
+    try:
+        params = {
+            "team1_id": team1_id,
+            "team2_id": team2_id,
+            "years": years,
+            "time_period": f"Last {years} years" if years else "All time"
+        }
 
-    if years:
-        base_where += f" AND date(m.date).year >= date().year - {years}"
-
-    stats_query = f"""
-    MATCH (m:Match)
-    {base_where}
-    WITH m,
-         CASE
-           WHEN m.home_team_id = $team1_id AND m.home_score > m.away_score THEN 'team1'
-           WHEN m.away_team_id = $team1_id AND m.away_score > m.home_score THEN 'team1'
-           WHEN m.home_score = m.away_score THEN 'draw'
-           ELSE 'team2'
-         END AS winner,
-         CASE WHEN m.home_team_id = $team1_id THEN m.home_score ELSE m.away_score END AS team1_score,
-         CASE WHEN m.home_team_id = $team2_id THEN m.home_score ELSE m.away_score END AS team2_score,
-         abs(m.home_score - m.away_score) AS goal_margin
-    RETURN
-         count(m) AS total_matches,
-         sum(CASE WHEN winner = 'team1' THEN 1 ELSE 0 END) AS team1_wins,
-         sum(CASE WHEN winner = 'team2' THEN 1 ELSE 0 END) AS team2_wins,
-         sum(CASE WHEN winner = 'draw' THEN 1 ELSE 0 END) AS draws,
-         sum(team1_score) AS team1_goals,
-         sum(team2_score) AS team2_goals,
-         max(goal_margin) AS biggest_margin
-    """
+        rivalry_result = await db.execute_query(rivalry_query, params)
+        if not rivalry_result:
+            logger.warning("One or both teams not found: %s, %s", team1_id, team2_id)
+            return {"error": "One or both teams not found"}
 
-    # Biggest victories for team1
-    biggest_wins_query = f"""
-    MATCH (m:Match)
-    {base_where}
-    MATCH (home:Team {{team_id: m.home_team_id}})
-    MATCH (away:Team {{team_id: m.away_team_id}})
-    WITH m, home, away,
-         CASE
-           WHEN m.home_team_id = $team1_id THEN m.home_score - m.away_score
-           ELSE m.away_score - m.home_score
-         END AS margin
-    WHERE margin > 0
-    RETURN m.match_id AS match_id,
-           m.date AS date,
-           home.name AS home_team,
-           away.name AS away_team,
-           m.home_score AS home_score,
-           m.away_score AS away_score,
-           margin
-    ORDER BY margin DESC, m.date DESC
-    LIMIT 5
-    """
+        # The query returns the response shape directly
+        rivalry = rivalry_result[0]["rivalry"]
 
-    # Top scorers in rivalry
-    top_scorers_query = f"""
-    MATCH (m:Match)
-    {base_where}
-    MATCH (p:Player)-[s:SCORED_IN]->(m)
-    MATCH (t:Team {{team_id: s.team_id}})
-    WHERE t.team_id = $team1_id OR t.team_id = $team2_id
-    WITH p, t, count(s) AS goals
-    RETURN p.player_id AS player_id,
-           p.name AS player_name,
-           t.name AS team_name,
-           goals
-    ORDER BY goals DESC
-    LIMIT 10
+        logger.info("Retrieved rivalry stats: %s matches", rivalry["overall"]["total_matches"])
+        return rivalry
+
+    except Exception as e:
+        logger.error("Error getting rivalry stats: %s", e)
+        raise
+
+
+def _criteria_key(criteria: Dict[str, Any], limit: int) -> tuple:
     """
+    Canonical cache key for career path criteria.
 
-    try:
-        params = {"team1_id": team1_id, "team2_id": team2_id}
+    Unset (None or empty) criteria are dropped and list criteria are
+    order-insensitive (teams must all match; positions are a set), so
+    equivalent requests share one cache entry. Values are frozen to
+    canonical JSON, so any JSON-shaped value (dicts, mixed-type lists)
+    gives a hashable, sortable key.
+    """
+    def canonical(value: Any) -> str:
+        return json.dumps(value, sort_keys=True, default=str)
+
+    return limit, tuple(sorted(
+        (name, canonical(sorted(value, key=canonical) if isinstance(value, list) else value))
+        for name, value in criteria.items()
+        if value is not None and value != []
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def _career_path_query(
+    teams: bool,
+    positions: bool,
+    min_teams: bool,
+    min_goals: bool
+) -> str:
+    """
+    Build the career path Cypher for the given set of criteria.
 
-        teams_result = await db.execute_query(teams_query, params)
-        if not teams_result:
-            logger.warning(f"One or both teams not found: {team1_id}, {team2_id}")
-            return {"error": "One or both teams not found"}
+    The text only depends on which criteria are present (values are
+    parameters), so each of the 16 shapes is built once.
+    """
+    query_parts = ["MATCH (p:Player)"]
+    where_clauses = []
 
-        stats_result = await db.execute_query(stats_query, params)
-        biggest_wins_result = await db.execute_query(biggest_wins_query, params)
-        top_scorers_result = await db.execute_query(top_scorers_query, params)
-
-        stats = stats_result[0] if stats_result else {
-            "total_matches": 0,
-            "team1_wins": 0,
-            "team2_wins": 0,
-            "draws": 0,
-            "team1_goals": 0,
-            "team2_goals": 0,
-            "biggest_margin": 0
-        }
+    # Teams criteria - must have played for all specified teams. Candidates
+    # come from the first team's players (Team.name text index); each of
+    # the other teams is an existence check that stops at the first miss
+    if teams:
+        query_parts = [
+            "MATCH (p:Player)-[:PLAYS_FOR]->(t:Team)",
+            "WHERE t.name CONTAINS $teams[0]",
+            "WITH DISTINCT p"
+        ]
+        where_clauses.append(
+            "all(team_name IN $teams[1..] WHERE exists {"
+            " MATCH (p)-[:PLAYS_FOR]->(other:Team) WHERE other.name CONTAINS team_name })"
+        )
 
-        rivalry = {
-            "teams": {
-                "team1": {
-                    "team_id": team1_id,
-                    "name": teams_result[0]["team1_name"],
-                    "wins": stats["team1_wins"],
-                    "goals": stats["team1_goals"]
-                },
-                "team2": {
-                    "team_id": team2_id,
-                    "name": teams_result[0]["team2_name"],
-                    "wins": stats["team2_wins"],
-                    "goals": stats["team2_goals"]
-                }
-            },
-            "overall": {
-                "total_matches": stats["total_matches"],
-                "draws": stats["draws"],
-                "biggest_margin": stats["biggest_margin"]
-            },
-            "biggest_victories": biggest_wins_result,
-            "top_scorers": top_scorers_result,
-            "time_period": f"Last {years} years" if years else "All time"
-        }
+    # Position filter
+    if positions:
+        where_clauses.append("p.position IN $positions")
 
-        logger.info(f"Retrieved rivalry stats: {stats['total_matches']} matches")
-        return rivalry
+    # Minimum teams played for
+    if min_teams:
+        query_parts.append("WITH p, COUNT { (p)-[:PLAYS_FOR]->(:Team) } AS num_teams")
+        where_clauses.append("num_teams >= $min_teams")
+
+    # Goals filter, applied before any player's teams are collected; reads
+    # the maintained Player.total_goals, counting SCORED_IN live for players
+    # that have no total yet (loaded outside the importer, not refreshed)
+    if min_goals:
+        where_clauses.append(
+            "coalesce(p.total_goals, COUNT { (p)-[:SCORED_IN]->(:Match) }) >= $min_goals"
+        )
 
-    except Exception as e:
-        logger.error(f"Error getting rivalry stats: {e}")
-        raise
+    # Build WHERE clause
+    query = "\n".join(query_parts)
+    if where_clauses:
+        query += "\nWHERE " + " AND ".join(where_clauses)
+
+    # Get player info with career details; each player's teams are
+    # deduplicated once and counted from the list
+    return query + """
+    CALL {
+        WITH p
+        MATCH (p)-[:PLAYS_FOR]->(t:Team)
+        WITH DISTINCT t
+        RETURN collect(t.name) AS teams
+    }
+    WITH p, teams, size(teams) AS num_teams
+    RETURN p.player_id AS player_id,
+           p.name AS name,
+           p.position AS position,
+           p.nationality AS nationality,
+           teams,
+           num_teams
+    ORDER BY num_teams DESC, p.name
+    LIMIT $limit
+    """
 
 
+@async_ttl_cache(maxsize=512, key=_criteria_key)
 async def find_players_by_career_path(
-    criteria: Dict[str, Any]
+    criteria: Dict[str, Any],
+    limit: int = 50
 ) -> List[Dict[str, Any]]:
     """
     Find players matching complex career path criteria.
@@ -314,6 +408,7 @@ async def find_players_by_career_path(
             - positions: List of positions
             - transferred_abroad: Boolean
             - min_goals: Minimum career goals
+        limit: Maximum number of results (default: 50)
 
     Returns:
         List of player dictionaries matching criteria
@@ -325,67 +420,26 @@ async def find_players_by_career_path(
         ... })
     """
     db = get_db()
-    logger.info(f"Finding players by career path: {criteria}")
+    logger.info("Finding players by career path: %s", criteria)
 
-    # Build dynamic query based on criteria
-    query_parts = ["MATCH (p:Player)"]
-    where_clauses = []
-    params = {}
-
-    # Teams criteria - must have played for all specified teams
+    params = {"limit": limit}
     if "teams" in criteria and criteria["teams"]:
-        teams = criteria["teams"]
-        for idx, team in enumerate(teams):
-            query_parts.append(f"MATCH (p)-[:PLAYS_FOR]->(t{idx}:Team)")
-            where_clauses.append(f"t{idx}.name CONTAINS ${f'team{idx}'}")
-            params[f"team{idx}"] = team
-
-    # Position filter
+        params["teams"] = list(dict.fromkeys(criteria["teams"]))
     if "positions" in criteria and criteria["positions"]:
-        positions_str = ", ".join([f"'{p}'" for p in criteria["positions"]])
-        where_clauses.append(f"p.position IN [{positions_str}]")
-
-    # Minimum teams played for
-    if "min_teams" in criteria:
-        query_parts.append("WITH p, size((p)-[:PLAYS_FOR]->(:Team)) AS num_teams")
-        where_clauses.append(f"num_teams >= {criteria['min_teams']}")
-
-    # Build WHERE clause
-    base_query = "\n".join(query_parts)
-    if where_clauses:
-        base_query += "\nWHERE " + " AND ".join(where_clauses)
-
-    # Get player info with career details
-    query = base_query + """
-    OPTIONAL MATCH (p)-[pf:PLAYS_FOR]->(t:Team)
-    WITH p,
-         collect(DISTINCT t.name) AS teams,
-         count(DISTINCT t) AS num_teams
-    """
-
-    # Goals filter
-    if "min_goals" in criteria:
-        query += f"""
-        OPTIONAL MATCH (p)-[s:SCORED_IN]->(:Match)
-        WITH p, teams, num_teams, count(s) AS total_goals
-        WHERE total_goals >= {criteria['min_goals']}
-        """
-
-    query += """
-    RETURN p.player_id AS player_id,
-           p.name AS name,
-           p.position AS position,
-           p.nationality AS nationality,
-           teams,
-           num_teams
-    ORDER BY num_teams DESC, p.name
-    LIMIT 50
-    """
+        params["positions"] = list(criteria["positions"])
+    if criteria.get("min_teams") is not None:
+        params["min_teams"] = criteria["min_teams"]
+    if criteria.get("min_goals") is not None:
+        params["min_goals"] = criteria["min_goals"]
+
+    query = _career_path_query(
+        "teams" in params, "positions" in params, "min_teams" in params, "min_goals" in params
+    )
 
     try:
         results = await db.execute_query(query, params)
-        logger.info(f"Found {len(results)} players matching career path criteria")
+        logger.info("Found %s players matching career path criteria", len(results))
         return results
     except Exception as e:
-        logger.error(f"Error finding players by career path: {e}")
+        logger.error("Error finding players by career path: %s", e)
         raise
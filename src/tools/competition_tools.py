@@ -12,6 +12,7 @@ CYPHER PATTERNS:
 - MATCH (m:Match)-[:PART_OF]->(c) for competition matches
 - MATCH (p:Player)-[:SCORED_IN]->(m)-[:PART_OF]->(c) for scorers
 - Aggregation for standings calculation
+- MATCH (s:StandingsSnapshot) for pre-aggregated standings (src.snapshots)
 
 DEPENDENCIES:
 - src.database: Database connection management
@@ -28,12 +29,17 @@ USAGE:
 """
 
 from typing import List, Optional, Dict, Any
+import asyncio
+import functools
 import logging
+from src.cache import async_ttl_cache
 from src.database import get_db
+from src.snapshots import STANDINGS_DEFINITION
 
 logger = logging.getLogger(__name__)
 
 
+@async_ttl_cache()
 async def get_competition_standings(
     competition_id: str,
     season: str
@@ -50,6 +56,7 @@ async def get_competition_standings(
         - Competition information
         - Standings table with points, wins, draws, losses
         - Goal statistics for each team
+        - team_name_display: team name cut to the table's 24-character column
 
     Example:
         >>> standings = await get_competition_standings(
@@ -58,7 +65,7 @@ async def get_competition_standings(
         ... )
     """
     db = get_db()
-    logger.info(f"Getting standings for competition: {competition_id}, season: {season}")
+    logger.info("Getting standings for competition: %s, season: %s", competition_id, season)
 
     # Competition info
     comp_query = """
@@ -69,67 +76,89 @@ async def get_competition_standings(
            c.type AS type
     """
 
-    # Calculate standings
-    standings_query = """
-    MATCH (c:Competition {competition_id: $competition_id, season: $season})
-    MATCH (m:Match)-[:PART_OF]->(c)
-    MATCH (t:Team)
-    WHERE t.team_id = m.home_team_id OR t.team_id = m.away_team_id
-    WITH t, m,
-         CASE WHEN m.home_team_id = t.team_id THEN m.home_score ELSE m.away_score END AS goals_for,
-         CASE WHEN m.home_team_id = t.team_id THEN m.away_score ELSE m.home_score END AS goals_against,
-         CASE
-           WHEN m.home_team_id = t.team_id AND m.home_score > m.away_score THEN 3
-           WHEN m.away_team_id = t.team_id AND m.away_score > m.home_score THEN 3
-           WHEN m.home_score = m.away_score THEN 1
-           ELSE 0
-         END AS points,
-         CASE
-           WHEN m.home_team_id = t.team_id AND m.home_score > m.away_score THEN 1
-           WHEN m.away_team_id = t.team_id AND m.away_score > m.home_score THEN 1
-           ELSE 0
-         END AS wins,
-         CASE WHEN m.home_score = m.away_score THEN 1 ELSE 0 END AS draws,
-         CASE
-           WHEN m.home_team_id = t.team_id AND m.home_score < m.away_score THEN 1
-           WHEN m.away_team_id = t.team_id AND m.away_score < m.home_score THEN 1
-           ELSE 0
-         END AS losses
-    WITH t.team_id AS team_id,
-         t.name AS team_name,
-         count(m) AS played,
-         sum(wins) AS wins,
-         sum(draws) AS draws,
-         sum(losses) AS losses,
-         sum(goals_for) AS goals_for,
-         sum(goals_against) AS goals_against,
-         sum(points) AS points
-    RETURN team_id,
-           team_name,
-           played,
-           wins,
-           draws,
-           losses,
-           goals_for,
-           goals_against,
-           goals_for - goals_against AS goal_difference,
-           points
+    # Order the table and number positions in the database, shared by the
+    # snapshot and live queries
+    ranked_standings = """
+    WITH team_id, team_name, played, wins, draws, losses, goals_for, goals_against,
+         goals_for - goals_against AS goal_difference, points
     ORDER BY points DESC, goal_difference DESC, goals_for DESC
+    WITH collect({
+        team_id: team_id, team_name: team_name, played: played,
+        wins: wins, draws: draws, losses: losses,
+        goals_for: goals_for, goals_against: goals_against,
+        goal_difference: goal_difference, points: points
+    }) AS rows
+    UNWIND range(0, size(rows) - 1) AS i
+    WITH i + 1 AS position, rows[i] AS row
+    RETURN position,
+           row.team_id AS team_id,
+           row.team_name AS team_name,
+           left(row.team_name, 24) AS team_name_display,
+           row.played AS played,
+           row.wins AS wins,
+           row.draws AS draws,
+           row.losses AS losses,
+           row.goals_for AS goals_for,
+           row.goals_against AS goals_against,
+           row.goal_difference AS goal_difference,
+           row.points AS points
     """
 
+    # Pre-aggregated standings, when a snapshot exists
+    snapshot_query = """
+    MATCH (s:StandingsSnapshot {
+        competition_id: $competition_id, season: $season, definition: $definition
+    })
+    WITH s.team_id AS team_id,
+         s.team_name AS team_name,
+         s.played AS played,
+         s.wins AS wins,
+         s.draws AS draws,
+         s.losses AS losses,
+         s.goals_for AS goals_for,
+         s.goals_against AS goals_against,
+         s.points AS points
+    """ + ranked_standings
+
+    # Calculate standings: each match contributes one row per side, so
+    # results need no home/away branching, and teams are looked up by id
+    # once per team rather than once per match
+    standings_query = """
+    MATCH (:Competition {competition_id: $competition_id, season: $season})<-[:PART_OF]-(m:Match)
+    UNWIND [
+        {team_id: m.home_team_id, goals_for: m.home_score, goals_against: m.away_score},
+        {team_id: m.away_team_id, goals_for: m.away_score, goals_against: m.home_score}
+    ] AS side
+    WITH side.team_id AS team_id,
+         count(*) AS played,
+         sum(CASE WHEN side.goals_for > side.goals_against THEN 1 ELSE 0 END) AS wins,
+         sum(CASE WHEN side.goals_for = side.goals_against THEN 1 ELSE 0 END) AS draws,
+         sum(CASE WHEN side.goals_for < side.goals_against THEN 1 ELSE 0 END) AS losses,
+         sum(side.goals_for) AS goals_for,
+         sum(side.goals_against) AS goals_against
+    MATCH (t:Team {team_id: team_id})
+    WITH team_id,
+         t.name AS team_name,
+         played, wins, draws, losses, goals_for, goals_against,
+         wins * 3 + draws AS points
+    """ + ranked_standings
+
     try:
         params = {"competition_id": competition_id, "season": season}
 
-        comp_result = await db.execute_query(comp_query, params)
+        # Independent reads, run concurrently
+        comp_result, standings_result = await asyncio.gather(
+            db.execute_query(comp_query, params),
+            db.execute_query(snapshot_query, {**params, "definition": STANDINGS_DEFINITION})
+        )
         if not comp_result:
-            logger.warning(f"Competition not found: {competition_id} season {season}")
+            logger.warning("Competition not found: %s season %s", competition_id, season)
             return {"error": f"Competition {competition_id} season {season} not found"}
 
-        standings_result = await db.execute_query(standings_query, params)
-
-        # Add position numbers
-        for idx, team in enumerate(standings_result, start=1):
-            team["position"] = idx
+        if standings_result:
+            logger.info("Using standings snapshot for %s %s", competition_id, season)
+        else:
+            standings_result = await db.execute_query(standings_query, params)
 
         standings = {
             "competition": comp_result[0],
@@ -137,14 +166,15 @@ async def get_competition_standings(
             "total_teams": len(standings_result)
         }
 
-        logger.info(f"Retrieved standings for {competition_id} {season}: {len(standings_result)} teams")
+        logger.info("Retrieved standings for %s %s: %s teams", competition_id, season, len(standings_result))
         return standings
 
     except Exception as e:
-        logger.error(f"Error getting competition standings: {e}")
+        logger.error("Error getting competition standings: %s", e)
         raise
 
 
+@async_ttl_cache()
 async def get_competition_top_scorers(
     competition_id: str,
     season: str,
@@ -171,7 +201,7 @@ async def get_competition_top_scorers(
         ... )
     """
     db = get_db()
-    logger.info(f"Getting top scorers for competition: {competition_id}, season: {season}")
+    logger.info("Getting top scorers for competition: %s, season: %s", competition_id, season)
 
     # Competition info
     comp_query = """
@@ -188,48 +218,111 @@ async def get_competition_top_scorers(
     MATCH (p:Player)-[s:SCORED_IN]->(m)
     MATCH (t:Team {team_id: s.team_id})
     WITH p, t, count(s) AS goals
-    RETURN p.player_id AS player_id,
-           p.name AS player_name,
-           p.position AS position,
-           t.name AS team_name,
-           goals
     ORDER BY goals DESC, p.name
     LIMIT $limit
+    WITH collect({
+        player_id: p.player_id,
+        player_name: p.name,
+        position: p.position,
+        team_name: t.name,
+        goals: goals
+    }) AS rows
+    UNWIND range(0, size(rows) - 1) AS i
+    RETURN i + 1 AS rank,
+           rows[i].player_id AS player_id,
+           rows[i].player_name AS player_name,
+           rows[i].position AS position,
+           rows[i].team_name AS team_name,
+           rows[i].goals AS goals
     """
 
     try:
         params = {"competition_id": competition_id, "season": season, "limit": limit}
 
-        comp_result = await db.execute_query(comp_query, params)
+        # Independent reads, run concurrently
+        comp_result, scorers_result = await asyncio.gather(
+            db.execute_query(comp_query, params),
+            db.execute_query(scorers_query, params)
+        )
         if not comp_result:
-            logger.warning(f"Competition not found: {competition_id} season {season}")
+            logger.warning("Competition not found: %s season %s", competition_id, season)
             return {"error": f"Competition {competition_id} season {season} not found"}
 
-        scorers_result = await db.execute_query(scorers_query, params)
-
-        # Add rank numbers
-        for idx, scorer in enumerate(scorers_result, start=1):
-            scorer["rank"] = idx
-
         top_scorers = {
             "competition": comp_result[0],
             "top_scorers": scorers_result,
             "total_scorers": len(scorers_result)
         }
 
-        logger.info(f"Retrieved top scorers for {competition_id} {season}: {len(scorers_result)} players")
+        logger.info("Retrieved top scorers for %s %s: %s players", competition_id, season, len(scorers_result))
         return top_scorers
 
     except Exception as e:
-        logger.error(f"Error getting competition top scorers: {e}")
+        logger.error("Error getting competition top scorers: %s", e)
         raise
 
 
-async def get_competition_matches(
+@functools.lru_cache(maxsize=None)
+def _competition_matches_filter(team: bool, round: bool) -> str:
+    """
+    Build the Cypher binding m to each of a competition's matches that pass
+    the given set of filters.
+
+    A team name is resolved to team ids first, so matches are filtered on
+    their own properties and only the returned page is joined to its teams.
+    """
+    query_parts = []
+    where_clauses = []
+
+    if team:
+        query_parts.append("MATCH (t:Team) WHERE t.name CONTAINS $team")
+        query_parts.append("WITH collect(t.team_id) AS team_ids")
+        where_clauses.append("(m.home_team_id IN team_ids OR m.away_team_id IN team_ids)")
+
+    query_parts.append("MATCH (c:Competition {competition_id: $competition_id, season: $season})")
+    query_parts.append("MATCH (m:Match)-[:PART_OF]->(c)")
+
+    if round:
+        where_clauses.append("m.round = $round")
+
+    query = "\n".join(query_parts)
+    if where_clauses:
+        query += "\nWHERE " + " AND ".join(where_clauses)
+    return query
+
+
+@async_ttl_cache()
+async def _count_competition_matches(
     competition_id: str,
     season: str,
     team: Optional[str] = None,
     round: Optional[int] = None
+) -> int:
+    """Count a competition's matches passing the given filters."""
+    db = get_db()
+
+    params = {"competition_id": competition_id, "season": season}
+    if team:
+        params["team"] = team
+    if round is not None:
+        params["round"] = round
+
+    query = _competition_matches_filter("team" in params, "round" in params) + """
+    RETURN count(m) AS total_matches
+    """
+
+    result = await db.execute_query(query, params)
+    return result[0]["total_matches"]
+
+
+@async_ttl_cache()
+async def get_competition_matches(
+    competition_id: str,
+    season: str,
+    team: Optional[str] = None,
+    round: Optional[int] = None,
+    offset: int = 0,
+    limit: int = 20
 ) -> Dict[str, Any]:
     """
     Get all matches in a competition.
@@ -239,11 +332,15 @@ async def get_competition_matches(
         season: Season year (format: "2023")
         team: Filter by specific team (optional)
         round: Filter by specific round/matchday (optional)
+        offset: Number of matches to skip, for paging (default: 0)
+        limit: Maximum number of matches to list (default: 20)
 
     Returns:
         Dictionary with:
         - Competition information
-        - List of matches with results
+        - List of matches with results (most recent first, up to limit
+          starting at offset)
+        - Total number of matching matches and the offset used
 
     Example:
         >>> matches = await get_competition_matches(
@@ -257,7 +354,7 @@ async def get_competition_matches(
         ... )
     """
     db = get_db()
-    logger.info(f"Getting matches for competition: {competition_id}, season: {season}, team: {team}")
+    logger.info("Getting matches for competition: %s, season: %s, team: %s", competition_id, season, team)
 
     # Competition info
     comp_query = """
@@ -268,29 +365,21 @@ async def get_competition_matches(
            c.type AS type
     """
 
-    # Matches query
-    matches_query = """
-    MATCH (c:Competition {competition_id: $competition_id, season: $season})
-    MATCH (m:Match)-[:PART_OF]->(c)
-    MATCH (home:Team {team_id: m.home_team_id})
-    MATCH (away:Team {team_id: m.away_team_id})
-    """
-
-    params = {"competition_id": competition_id, "season": season}
-    where_clauses = []
-
+    params = {"competition_id": competition_id, "season": season, "offset": offset, "limit": limit}
     if team:
-        where_clauses.append("(home.name CONTAINS $team OR away.name CONTAINS $team)")
         params["team"] = team
-
     if round is not None:
-        where_clauses.append("m.round = $round")
         params["round"] = round
 
-    if where_clauses:
-        matches_query += "\nWHERE " + " AND ".join(where_clauses)
-
-    matches_query += """
+    # Only the requested page is ordered, joined to its teams and returned;
+    # the total comes from a separately cached count
+    matches_query = _competition_matches_filter("team" in params, "round" in params) + """
+    WITH m
+    ORDER BY m.date DESC, m.round
+    SKIP $offset
+    LIMIT $limit
+    MATCH (home:Team {team_id: m.home_team_id})
+    MATCH (away:Team {team_id: m.away_team_id})
     RETURN m.match_id AS match_id,
            m.date AS date,
            home.name AS home_team,
@@ -303,22 +392,26 @@ async def get_competition_matches(
     """
 
     try:
-        comp_result = await db.execute_query(comp_query, params)
+        # Independent reads, run concurrently
+        comp_result, matches_result, total_matches = await asyncio.gather(
+            db.execute_query(comp_query, params),
+            db.execute_query(matches_query, params),
+            _count_competition_matches(competition_id, season, team, round)
+        )
         if not comp_result:
-            logger.warning(f"Competition not found: {competition_id} season {season}")
+            logger.warning("Competition not found: %s season %s", competition_id, season)
             return {"error": f"Competition {competition_id} season {season} not found"}
 
-        matches_result = await db.execute_query(matches_query, params)
-
         competition_matches = {
             "competition": comp_result[0],
             "matches": matches_result,
-            "total_matches": len(matches_result)
+            "total_matches": total_matches,
+            "offset": offset
         }
 
-        logger.info(f"Retrieved matches for {competition_id} {season}: {len(matches_result)} matches")
+        logger.info("Retrieved matches for %s %s: %s of %s matches", competition_id, season, len(matches_result), total_matches)
         return competition_matches
 
     except Exception as e:
-        logger.error(f"Error getting competition matches: {e}")
+        logger.error("Error getting competition matches: %s", e)
         raise
@@ -4,6 +4,7 @@ Brazilian Soccer MCP Server - Match Tools
 CONTEXT:
 This module implements MCP tools for match-related queries:
 - get_match_details: Get detailed information about a specific match
+- get_matches_bulk: Get details for several matches in one query
 - search_matches: Search for matches by team, date range, or competition
 - get_head_to_head: Compare two teams' historical matchups
 - get_match_scorers: List all goal scorers in a match
@@ -11,7 +12,8 @@ This module implements MCP tools for match-related queries:
 CYPHER PATTERNS:
 - MATCH (m:Match) for match nodes
 - MATCH (m)-[:PART_OF]->(c:Competition) for competition context
-- MATCH (p:Player)-[:SCORED_IN]->(m) for goal scorers
+- MATCH (p:Player)-[:SCORED_IN]->(m) for goal scorers (collected into
+  the match details record, which get_match_scorers projects from)
 - MATCH (m)-[:PLAYED_AT]->(s:Stadium) for venue information
 
 DEPENDENCIES:
@@ -28,170 +30,253 @@ USAGE:
     h2h = await get_head_to_head(team1_id="T001", team2_id="T002")
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any, Union
 from datetime import datetime, date
+import functools
 import logging
+from src.cache import async_ttl_cache
 from src.database import get_db
 
 logger = logging.getLogger(__name__)
 
+# Teams, competition and stadium of a bound match m; all optional, so a
+# match missing one of these links is still returned with its events
+MATCH_JOINS = """
+OPTIONAL MATCH (home:Team {team_id: m.home_team_id})
+OPTIONAL MATCH (away:Team {team_id: m.away_team_id})
+OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
+OPTIONAL MATCH (m)-[:PLAYED_AT]->(s:Stadium)
+"""
+
+MATCH_RETURN = """
+RETURN m.match_id AS match_id,
+       m.date AS date,
+       m.home_score AS home_score,
+       m.away_score AS away_score,
+       m.attendance AS attendance,
+       m.referee AS referee,
+       home.team_id AS home_team_id,
+       home.name AS home_team_name,
+       away.team_id AS away_team_id,
+       away.name AS away_team_name,
+       c.name AS competition_name,
+       c.season AS season,
+       s.name AS stadium_name,
+       s.city AS stadium_city"""
+
+# Full record: the match plus its scorers and cards collected in
+# subqueries, so a whole record is one round-trip
+MATCH_DETAILS = MATCH_JOINS + """
+CALL {
+    WITH m
+    MATCH (p:Player)-[g:SCORED_IN]->(m)
+    MATCH (t:Team {team_id: g.team_id})
+    WITH p, g, t ORDER BY g.minute
+    RETURN collect({
+        player_name: p.name,
+        player_id: p.player_id,
+        position: p.position,
+        team_id: t.team_id,
+        team_name: t.name,
+        minute: g.minute,
+        goal_type: g.goal_type
+    }) AS scorers
+}
+CALL {
+    WITH m
+    MATCH (p:Player)-[rc:RECEIVED_CARD]->(m)
+    MATCH (p)-[:PLAYS_FOR]->(t:Team)
+    WITH p, rc, t ORDER BY rc.minute
+    RETURN collect({
+        player_name: p.name,
+        player_id: p.player_id,
+        team_name: t.name,
+        card_type: rc.card_type,
+        minute: rc.minute,
+        reason: rc.reason
+    }) AS cards
+}""" + MATCH_RETURN + """,
+       scorers,
+       cards
+"""
+
+# Summary record: the match with goal and card counts only, so no scorer
+# or card rows are built or sent
+MATCH_SUMMARY = MATCH_JOINS + """
+CALL {
+    WITH m
+    OPTIONAL MATCH (:Player)-[g:SCORED_IN]->(m)
+    RETURN count(g) AS total_goals
+}
+CALL {
+    WITH m
+    OPTIONAL MATCH (:Player)-[rc:RECEIVED_CARD]->(m)
+    RETURN count(rc) AS total_cards
+}""" + MATCH_RETURN + """,
+       total_goals,
+       total_cards
+"""
+
+DetailLevel = Literal["summary", "full"]
+
 
-async def get_match_details(match_id: str) -> Dict[str, Any]:
+def _match_details(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a MATCH_DETAILS or MATCH_SUMMARY record into a match details result."""
+    if "scorers" not in record:
+        return {
+            "match": record,
+            "total_goals": record.pop("total_goals"),
+            "total_cards": record.pop("total_cards")
+        }
+
+    scorers = record.pop("scorers")
+    cards = record.pop("cards")
+    return {
+        "match": record,
+        "scorers": scorers,
+        "cards": cards,
+        "total_goals": len(scorers),
+        "total_cards": len(cards)
+    }
+
+
+@async_ttl_cache()
+async def get_match_details(
+    match_id: str,
+    detail_level: DetailLevel = "full"
+) -> Dict[str, Any]:
     """
     Get detailed information about a specific match.
 
     Args:
         match_id: Unique match identifier
+        detail_level: "full" for scorer and card lists, "summary" for
+            their counts only (default: "full")
 
     Returns:
         Dictionary with:
         - Match basic info (teams, score, date)
-        - Goal scorers with timestamps
-        - Cards (yellow/red)
+        - Goal scorers with timestamps (full only)
+        - Cards (yellow/red) (full only)
+        - Goal and card totals
         - Stadium information
         - Competition context
 
     Example:
         >>> match = await get_match_details(match_id="M12345")
+        >>> match = await get_match_details(match_id="M12345", detail_level="summary")
     """
     db = get_db()
-    logger.info(f"Getting details for match: {match_id}")
+    logger.info("Getting details for match: %s, detail_level: %s", match_id, detail_level)
 
-    # Main match query with teams, competition, and stadium
     match_query = """
     MATCH (m:Match {match_id: $match_id})
-    MATCH (home:Team {team_id: m.home_team_id})
-    MATCH (away:Team {team_id: m.away_team_id})
-    MATCH (m)-[:PART_OF]->(c:Competition)
-    OPTIONAL MATCH (m)-[:PLAYED_AT]->(s:Stadium)
-    RETURN m.match_id AS match_id,
-           m.date AS date,
-           m.home_score AS home_score,
-           m.away_score AS away_score,
-           m.attendance AS attendance,
-           m.referee AS referee,
-           home.team_id AS home_team_id,
-           home.name AS home_team_name,
-           away.team_id AS away_team_id,
-           away.name AS away_team_name,
-           c.name AS competition_name,
-           c.season AS season,
-           s.name AS stadium_name,
-           s.city AS stadium_city
-    """
-
-    # Goal scorers query
-    scorers_query = """
-    MATCH (p:Player)-[s:SCORED_IN]->(m:Match {match_id: $match_id})
-    MATCH (t:Team {team_id: s.team_id})
-    RETURN p.name AS player_name,
-           p.player_id AS player_id,
-           t.name AS team_name,
-           s.minute AS minute,
-           s.goal_type AS goal_type
-    ORDER BY s.minute
-    """
-
-    # Cards query
-    cards_query = """
-    MATCH (p:Player)-[c:RECEIVED_CARD]->(m:Match {match_id: $match_id})
-    MATCH (p)-[:PLAYS_FOR]->(t:Team)
-    RETURN p.name AS player_name,
-           p.player_id AS player_id,
-           t.name AS team_name,
-           c.card_type AS card_type,
-           c.minute AS minute,
-           c.reason AS reason
-    ORDER BY c.minute
-    """
+    """ + (MATCH_SUMMARY if detail_level == "summary" else MATCH_DETAILS)
 
     try:
-        params = {"match_id": match_id}
-
-        match_result = await db.execute_query(match_query, params)
+        match_result = await db.execute_query(match_query, {"match_id": match_id})
         if not match_result:
-            logger.warning(f"Match not found: {match_id}")
+            logger.warning("Match not found: %s", match_id)
             return {"error": f"Match {match_id} not found"}
 
-        scorers_result = await db.execute_query(scorers_query, params)
-        cards_result = await db.execute_query(cards_query, params)
-
-        match_details = {
-            "match": match_result[0],
-            "scorers": scorers_result,
-            "cards": cards_result,
-            "total_goals": len(scorers_result),
-            "total_cards": len(cards_result)
-        }
+        match_details = _match_details(match_result[0])
+        match = match_details["match"]
 
-        logger.info(f"Retrieved details for match {match_id}: {match_result[0]['home_team_name']} vs {match_result[0]['away_team_name']}")
+        logger.info("Retrieved details for match %s: %s vs %s", match_id, match['home_team_name'], match['away_team_name'])
         return match_details
 
     except Exception as e:
-        logger.error(f"Error getting match details: {e}")
+        logger.error("Error getting match details: %s", e)
         raise
 
 
-async def search_matches(
-    team: Optional[str] = None,
-    date_from: Optional[str] = None,
-    date_to: Optional[str] = None,
-    competition: Optional[str] = None,
-    limit: int = 20
-) -> List[Dict[str, Any]]:
+@async_ttl_cache()
+async def get_matches_bulk(match_ids: List[str]) -> Dict[str, Any]:
     """
-    Search for matches with various filters.
+    Get detailed information about several matches in one query.
 
     Args:
-        team: Team name (home or away)
-        date_from: Start date (format: "YYYY-MM-DD")
-        date_to: End date (format: "YYYY-MM-DD")
-        competition: Competition name
-        limit: Maximum number of results (default: 20)
+        match_ids: Unique match identifiers
 
     Returns:
-        List of match dictionaries
+        Dictionary with:
+        - matches: match_id -> details, shaped like get_match_details
+        - not_found: Requested ids with no matching match
 
     Example:
-        >>> matches = await search_matches(team="Flamengo", date_from="2023-01-01")
-        >>> matches = await search_matches(competition="Brasileirão", date_from="2023-01-01", date_to="2023-12-31")
+        >>> bulk = await get_matches_bulk(match_ids=["M12345", "M12346"])
     """
     db = get_db()
-    logger.info(f"Searching matches: team={team}, date_from={date_from}, date_to={date_to}, competition={competition}")
+    logger.info("Getting details for %s matches", len(match_ids))
+
+    query = """
+    UNWIND $match_ids AS match_id
+    MATCH (m:Match {match_id: match_id})
+    """ + MATCH_DETAILS
+
+    try:
+        results = await db.execute_query(query, {"match_ids": list(dict.fromkeys(match_ids))})
+        matches = {record["match_id"]: _match_details(record) for record in results}
+        not_found = [match_id for match_id in match_ids if match_id not in matches]
 
-    query_parts = ["MATCH (m:Match)"]
+        logger.info("Retrieved details for %s of %s matches", len(matches), len(match_ids))
+        return {"matches": matches, "not_found": not_found}
+
+    except Exception as e:
+        logger.error("Error getting match details in bulk: %s", e)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _search_matches_query(
+    team: bool,
+    competition: bool,
+    date_from: bool,
+    date_to: bool
+) -> str:
+    """
+    Build the match search Cypher for the given set of filters.
+
+    The text only depends on which filters are present (values are
+    parameters), so each of the 16 shapes is built once.
+    """
+    query_parts = []
     where_clauses = []
-    params = {"limit": limit}
 
+    # Resolve the team name to ids first, so matches are filtered on their
+    # own properties before any Team is joined for display
     if team:
-        query_parts.append("MATCH (home:Team {team_id: m.home_team_id})")
-        query_parts.append("MATCH (away:Team {team_id: m.away_team_id})")
-        where_clauses.append("(home.name CONTAINS $team OR away.name CONTAINS $team)")
-        params["team"] = team
-    else:
-        query_parts.append("MATCH (home:Team {team_id: m.home_team_id})")
-        query_parts.append("MATCH (away:Team {team_id: m.away_team_id})")
+        query_parts.append("MATCH (t:Team) WHERE t.name CONTAINS $team")
+        query_parts.append("WITH collect(t.team_id) AS team_ids")
+        where_clauses.append("(m.home_team_id IN team_ids OR m.away_team_id IN team_ids)")
+
+    query_parts.append("MATCH (m:Match)")
 
     if competition:
         query_parts.append("MATCH (m)-[:PART_OF]->(c:Competition)")
         where_clauses.append("c.name CONTAINS $competition")
-        params["competition"] = competition
-    else:
-        query_parts.append("OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)")
 
+    # Match dates are stored as ISO strings, which order like dates; comparing
+    # the bare property keeps the range on the Match.date index
     if date_from:
-        where_clauses.append("date(m.date) >= date($date_from)")
-        params["date_from"] = date_from
+        where_clauses.append("m.date >= $date_from")
 
     if date_to:
-        where_clauses.append("date(m.date) <= date($date_to)")
-        params["date_to"] = date_to
+        where_clauses.append("m.date <= $date_to")
 
     query = "\n".join(query_parts)
     if where_clauses:
         query += "\nWHERE " + " AND ".join(where_clauses)
 
+    # Display joins, only for matches that passed the filters
     query += """
+    MATCH (home:Team {team_id: m.home_team_id})
+    MATCH (away:Team {team_id: m.away_team_id})
+    """
+    if not competition:
+        query += "    OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)\n"
+
+    return query + """
     RETURN m.match_id AS match_id,
            m.date AS date,
            home.name AS home_team,
@@ -204,19 +289,63 @@ async def search_matches(
     LIMIT $limit
     """
 
+
+@async_ttl_cache()
+async def search_matches(
+    team: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    competition: Optional[str] = None,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Search for matches with various filters.
+
+    Args:
+        team: Team name (home or away)
+        date_from: Start date (format: "YYYY-MM-DD")
+        date_to: End date (format: "YYYY-MM-DD")
+        competition: Competition name
+        limit: Maximum number of results (default: 20)
+
+    Returns:
+        List of match dictionaries
+
+    Example:
+        >>> matches = await search_matches(team="Flamengo", date_from="2023-01-01")
+        >>> matches = await search_matches(competition="Brasileirão", date_from="2023-01-01", date_to="2023-12-31")
+    """
+    db = get_db()
+    logger.info("Searching matches: team=%s, date_from=%s, date_to=%s, competition=%s", team, date_from, date_to, competition)
+
+    params = {"limit": limit}
+    if team:
+        params["team"] = team
+    if competition:
+        params["competition"] = competition
+    if date_from:
+        params["date_from"] = date_from
+    if date_to:
+        params["date_to"] = date_to
+
+    query = _search_matches_query(
+        "team" in params, "competition" in params, "date_from" in params, "date_to" in params
+    )
+
     try:
         results = await db.execute_query(query, params)
-        logger.info(f"Found {len(results)} matches matching search criteria")
+        logger.info("Found %s matches matching search criteria", len(results))
         return results
     except Exception as e:
-        logger.error(f"Error searching matches: {e}")
+        logger.error("Error searching matches: %s", e)
         raise
 
 
+@async_ttl_cache()
 async def get_head_to_head(
     team1_id: str,
     team2_id: str,
-    limit: Optional[int] = None
+    limit: Optional[int] = 5
 ) -> Dict[str, Any]:
     """
     Get head-to-head statistics between two teams.
@@ -224,7 +353,7 @@ async def get_head_to_head(
     Args:
         team1_id: First team identifier
         team2_id: Second team identifier
-        limit: Limit number of recent matches (optional)
+        limit: Number of recent matches to return (default: 5, None for all)
 
     Returns:
         Dictionary with:
@@ -238,106 +367,92 @@ async def get_head_to_head(
         >>> h2h = await get_head_to_head(team1_id="T001", team2_id="T002", limit=10)
     """
     db = get_db()
-    logger.info(f"Getting head-to-head: {team1_id} vs {team2_id}")
+    logger.info("Getting head-to-head: %s vs %s", team1_id, team2_id)
 
-    # Teams info
-    teams_query = """
+    # Both teams, overall statistics and recent matches in one round-trip.
+    # Matches are looked up once per home/away order, so each lookup is an
+    # index seek rather than an OR over all matches.
+    h2h_query = """
     MATCH (t1:Team {team_id: $team1_id})
     MATCH (t2:Team {team_id: $team2_id})
-    RETURN t1.name AS team1_name, t2.name AS team2_name
+    CALL {
+        UNWIND [[$team1_id, $team2_id], [$team2_id, $team1_id]] AS sides
+        MATCH (m:Match {home_team_id: sides[0], away_team_id: sides[1]})
+        WITH CASE WHEN m.home_team_id = $team1_id THEN m.home_score ELSE m.away_score END AS team1_goals,
+             CASE WHEN m.home_team_id = $team1_id THEN m.away_score ELSE m.home_score END AS team2_goals
+        RETURN
+             count(*) AS total_matches,
+             sum(CASE WHEN team1_goals > team2_goals THEN 1 ELSE 0 END) AS team1_wins,
+             sum(CASE WHEN team2_goals > team1_goals THEN 1 ELSE 0 END) AS team2_wins,
+             sum(CASE WHEN team1_goals = team2_goals THEN 1 ELSE 0 END) AS draws,
+             sum(team1_goals) AS team1_total_goals,
+             sum(team2_goals) AS team2_total_goals
+    }
+    CALL {
+        UNWIND [[$team1_id, $team2_id], [$team2_id, $team1_id]] AS sides
+        MATCH (m:Match {home_team_id: sides[0], away_team_id: sides[1]})
+        MATCH (home:Team {team_id: m.home_team_id})
+        MATCH (away:Team {team_id: m.away_team_id})
+        OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
+        WITH m, home, away, c
+        ORDER BY m.date DESC
+        LIMIT coalesce($limit, 2147483647)
+        RETURN collect({
+            match_id: m.match_id,
+            date: m.date,
+            home_team: home.name,
+            away_team: away.name,
+            home_score: m.home_score,
+            away_score: m.away_score,
+            competition: c.name
+        }) AS recent_matches
+    }
+    RETURN t1.name AS team1_name,
+           t2.name AS team2_name,
+           total_matches, team1_wins, team2_wins, draws,
+           team1_total_goals, team2_total_goals,
+           recent_matches
     """
 
-    # Overall statistics
-    stats_query = """
-    MATCH (m:Match)
-    WHERE (m.home_team_id = $team1_id AND m.away_team_id = $team2_id)
-       OR (m.home_team_id = $team2_id AND m.away_team_id = $team1_id)
-    WITH m,
-         CASE
-           WHEN m.home_team_id = $team1_id AND m.home_score > m.away_score THEN 'team1_win'
-           WHEN m.away_team_id = $team1_id AND m.away_score > m.home_score THEN 'team1_win'
-           WHEN m.home_score = m.away_score THEN 'draw'
-           ELSE 'team2_win'
-         END AS result,
-         CASE WHEN m.home_team_id = $team1_id THEN m.home_score ELSE m.away_score END AS team1_goals,
-         CASE WHEN m.home_team_id = $team2_id THEN m.home_score ELSE m.away_score END AS team2_goals
-    RETURN
-         count(m) AS total_matches,
-         sum(CASE WHEN result = 'team1_win' THEN 1 ELSE 0 END) AS team1_wins,
-         sum(CASE WHEN result = 'team2_win' THEN 1 ELSE 0 END) AS team2_wins,
-         sum(CASE WHEN result = 'draw' THEN 1 ELSE 0 END) AS draws,
-         sum(team1_goals) AS team1_total_goals,
-         sum(team2_goals) AS team2_total_goals
-    """
-
-    # Recent matches
-    recent_query = """
-    MATCH (m:Match)
-    WHERE (m.home_team_id = $team1_id AND m.away_team_id = $team2_id)
-       OR (m.home_team_id = $team2_id AND m.away_team_id = $team1_id)
-    MATCH (home:Team {team_id: m.home_team_id})
-    MATCH (away:Team {team_id: m.away_team_id})
-    OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
-    RETURN m.match_id AS match_id,
-           m.date AS date,
-           home.name AS home_team,
-           away.name AS away_team,
-           m.home_score AS home_score,
-           m.away_score AS away_score,
-           c.name AS competition
-    ORDER BY m.date DESC
-    """
-
-    if limit:
-        recent_query += f" LIMIT {limit}"
+    # No limit is a null parameter rather than a different query text, so
+    # every call shares one cached plan
+    params = {"team1_id": team1_id, "team2_id": team2_id, "limit": limit or None}
 
     try:
-        params = {"team1_id": team1_id, "team2_id": team2_id}
-
-        teams_result = await db.execute_query(teams_query, params)
-        if not teams_result:
-            logger.warning(f"One or both teams not found: {team1_id}, {team2_id}")
+        h2h_result = await db.execute_query(h2h_query, params)
+        if not h2h_result:
+            logger.warning("One or both teams not found: %s, %s", team1_id, team2_id)
             return {"error": "One or both teams not found"}
 
-        stats_result = await db.execute_query(stats_query, params)
-        recent_result = await db.execute_query(recent_query, params)
-
-        stats = stats_result[0] if stats_result else {
-            "total_matches": 0,
-            "team1_wins": 0,
-            "team2_wins": 0,
-            "draws": 0,
-            "team1_total_goals": 0,
-            "team2_total_goals": 0
-        }
+        stats = h2h_result[0]
 
         h2h = {
             "team1": {
                 "team_id": team1_id,
-                "name": teams_result[0]["team1_name"],
+                "name": stats["team1_name"],
                 "wins": stats["team1_wins"],
                 "goals": stats["team1_total_goals"]
             },
             "team2": {
                 "team_id": team2_id,
-                "name": teams_result[0]["team2_name"],
+                "name": stats["team2_name"],
                 "wins": stats["team2_wins"],
                 "goals": stats["team2_total_goals"]
             },
             "total_matches": stats["total_matches"],
             "draws": stats["draws"],
-            "recent_matches": recent_result
+            "recent_matches": stats["recent_matches"]
         }
 
-        logger.info(f"Retrieved head-to-head: {stats['total_matches']} matches between teams")
+        logger.info("Retrieved head-to-head: %s matches between teams", stats['total_matches'])
         return h2h
 
     except Exception as e:
-        logger.error(f"Error getting head-to-head: {e}")
+        logger.error("Error getting head-to-head: %s", e)
         raise
 
 
-async def get_match_scorers(match_id: str) -> List[Dict[str, Any]]:
+async def get_match_scorers(match_id: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Get all goal scorers in a specific match.
 
@@ -350,30 +465,19 @@ async def get_match_scorers(match_id: str) -> List[Dict[str, Any]]:
         - Team name
         - Minute scored
         - Goal type
+        or an error dictionary if the match does not exist
 
     Example:
         >>> scorers = await get_match_scorers(match_id="M12345")
     """
-    db = get_db()
-    logger.info(f"Getting scorers for match: {match_id}")
+    logger.info("Getting scorers for match: %s", match_id)
 
-    query = """
-    MATCH (p:Player)-[s:SCORED_IN]->(m:Match {match_id: $match_id})
-    MATCH (t:Team {team_id: s.team_id})
-    RETURN p.player_id AS player_id,
-           p.name AS player_name,
-           p.position AS position,
-           t.team_id AS team_id,
-           t.name AS team_name,
-           s.minute AS minute,
-           s.goal_type AS goal_type
-    ORDER BY s.minute
-    """
+    # Projected from the (cached) match details record, which already
+    # collects the scorers, instead of a separate scorers query
+    details = await get_match_details(match_id)
+    if "error" in details:
+        return details
+    scorers = details["scorers"]
 
-    try:
-        results = await db.execute_query(query, {"match_id": match_id})
-        logger.info(f"Found {len(results)} goal scorers in match {match_id}")
-        return results
-    except Exception as e:
-        logger.error(f"Error getting match scorers: {e}")
-        raise
+    logger.info("Found %s goal scorers in match %s", len(scorers), match_id)
+    return scorers
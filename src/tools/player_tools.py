@@ -13,6 +13,7 @@ CYPHER PATTERNS:
 - MATCH (p)-[:PLAYS_FOR]->(t:Team) for team relationships
 - MATCH (p)-[:SCORED_IN]->(m:Match) for goals
 - MATCH (p)-[:TRANSFERRED_FROM|TRANSFERRED_TO] for transfers
+- MATCH (s:PlayerStatsSnapshot) for pre-aggregated stats (src.snapshots)
 
 DEPENDENCIES:
 - src.database: Database connection management
@@ -30,14 +31,52 @@ USAGE:
 """
 
 from typing import List, Optional, Dict, Any
+import asyncio
+import functools
 import logging
+from src.cache import async_ttl_cache
 from src.database import get_db
+from src.dataloader import player_loader
 from src.models import Player, PlayerStats, PlayerCareer, PlaysFor, Transfer
 from src.config import settings
+from src.snapshots import PLAYER_STATS_DEFINITION, snapshot_season
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _search_player_query(team: bool, position: bool) -> str:
+    """
+    Build the player search Cypher for the given set of filters.
+
+    The text only depends on which filters are present (values are
+    parameters), so each of the 4 shapes is built once.
+    """
+    query_parts = ["MATCH (p:Player)"]
+    where_clauses = ["p.name CONTAINS $name"]
+
+    if team:
+        query_parts.append("MATCH (p)-[:PLAYS_FOR]->(t:Team)")
+        where_clauses.append("t.name CONTAINS $team")
+
+    if position:
+        where_clauses.append("p.position = $position")
+
+    query = "\n".join(query_parts)
+    query += "\nWHERE " + " AND ".join(where_clauses)
+
+    return query + """
+    RETURN p.player_id AS player_id,
+           p.name AS name,
+           p.birth_date AS birth_date,
+           p.nationality AS nationality,
+           p.position AS position,
+           p.jersey_number AS jersey_number
+    LIMIT $limit
+    """
+
+
+@async_ttl_cache(maxsize=2048)
 async def search_player(
     name: str,
     team: Optional[str] = None,
@@ -61,42 +100,22 @@ async def search_player(
         >>> players = await search_player(name="Silva", team="Flamengo")
     """
     db = get_db()
-    logger.info(f"Searching for player: name={name}, team={team}, position={position}")
+    logger.info("Searching for player: name=%s, team=%s, position=%s", name, team, position)
 
-    # Build dynamic query based on filters
-    query_parts = ["MATCH (p:Player)"]
-    where_clauses = ["p.name CONTAINS $name"]
     params = {"name": name, "limit": limit}
-
     if team:
-        query_parts.append("MATCH (p)-[:PLAYS_FOR]->(t:Team)")
-        where_clauses.append("t.name CONTAINS $team")
         params["team"] = team
-
     if position:
-        where_clauses.append("p.position = $position")
         params["position"] = position
 
-    query = "\n".join(query_parts)
-    if where_clauses:
-        query += "\nWHERE " + " AND ".join(where_clauses)
-
-    query += """
-    RETURN p.player_id AS player_id,
-           p.name AS name,
-           p.birth_date AS birth_date,
-           p.nationality AS nationality,
-           p.position AS position,
-           p.jersey_number AS jersey_number
-    LIMIT $limit
-    """
+    query = _search_player_query("team" in params, "position" in params)
 
     try:
         results = await db.execute_query(query, params)
-        logger.info(f"Found {len(results)} players matching search criteria")
+        logger.info("Found %s players matching search criteria", len(results))
         return results
     except Exception as e:
-        logger.error(f"Error searching for players: {e}")
+        logger.error("Error searching for players: %s", e)
         raise
 
 
@@ -122,113 +141,101 @@ async def get_player_stats(
         >>> stats = await get_player_stats(player_id="P12345", season="2023")
     """
     db = get_db()
-    logger.info(f"Getting stats for player: {player_id}, season: {season}")
-
-    # Base player info query
-    player_query = """
-    MATCH (p:Player {player_id: $player_id})
-    RETURN p.player_id AS player_id,
-           p.name AS name,
-           p.position AS position
-    """
-
-    # Goals query
-    goals_query = """
-    MATCH (p:Player {player_id: $player_id})-[s:SCORED_IN]->(m:Match)
-    """
-    if season:
-        goals_query += """-[:PART_OF]->(c:Competition {season: $season})"""
-    goals_query += """
-    RETURN count(s) AS total_goals
-    """
-
-    # Assists query
-    assists_query = """
-    MATCH (p:Player {player_id: $player_id})-[a:ASSISTED_IN]->(m:Match)
-    """
-    if season:
-        assists_query += """-[:PART_OF]->(c:Competition {season: $season})"""
-    assists_query += """
-    RETURN count(a) AS total_assists
-    """
-
-    # Matches played query
-    matches_query = """
-    MATCH (p:Player {player_id: $player_id})-[:PLAYED_IN]->(m:Match)
-    """
-    if season:
-        matches_query += """-[:PART_OF]->(c:Competition {season: $season})"""
-    matches_query += """
-    RETURN count(DISTINCT m) AS total_matches
+    logger.info("Getting stats for player: %s, season: %s", player_id, season)
+
+    # Pre-aggregated snapshot, when one exists
+    snapshot_query = """
+    MATCH (s:PlayerStatsSnapshot {
+        player_id: $player_id, season: $snapshot_season, definition: $definition
+    })
+    RETURN s {.total_goals, .total_assists, .total_matches,
+              .yellow_cards, .red_cards, .teams} AS snapshot
     """
 
-    # Cards query
-    cards_query = """
-    MATCH (p:Player {player_id: $player_id})-[c:RECEIVED_CARD]->(m:Match)
-    """
-    if season:
-        cards_query += """-[:PART_OF]->(comp:Competition {season: $season})"""
-    cards_query += """
-    RETURN c.card_type AS card_type, count(c) AS count
-    """
-
-    # Teams query
-    teams_query = """
-    MATCH (p:Player {player_id: $player_id})-[pf:PLAYS_FOR]->(t:Team)
-    RETURN t.name AS team_name,
-           pf.from_date AS from_date,
-           pf.to_date AS to_date
-    ORDER BY pf.from_date DESC
+    # Live aggregation: every statistic in one round-trip, each from its
+    # own subquery so the relationship expansions don't multiply
+    stats_query = """
+    MATCH (p:Player {player_id: $player_id})
+    CALL {
+        WITH p
+        OPTIONAL MATCH (p)-[s:SCORED_IN]->(m:Match)
+        WHERE $season IS NULL OR (m)-[:PART_OF]->(:Competition {season: $season})
+        RETURN count(s) AS total_goals
+    }
+    CALL {
+        WITH p
+        OPTIONAL MATCH (p)-[a:ASSISTED_IN]->(m:Match)
+        WHERE $season IS NULL OR (m)-[:PART_OF]->(:Competition {season: $season})
+        RETURN count(a) AS total_assists
+    }
+    CALL {
+        WITH p
+        OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)
+        WHERE $season IS NULL OR (m)-[:PART_OF]->(:Competition {season: $season})
+        RETURN count(DISTINCT m) AS total_matches
+    }
+    CALL {
+        WITH p
+        OPTIONAL MATCH (p)-[c:RECEIVED_CARD]->(m:Match)
+        WHERE $season IS NULL OR (m)-[:PART_OF]->(:Competition {season: $season})
+        RETURN count(CASE WHEN c.card_type = 'Yellow' THEN c END) AS yellow_cards,
+               count(CASE WHEN c.card_type = 'Red' THEN c END) AS red_cards
+    }
+    CALL {
+        WITH p
+        OPTIONAL MATCH (p)-[pf:PLAYS_FOR]->(t:Team)
+        WITH t, pf ORDER BY pf.from_date DESC
+        RETURN collect(t.name) AS teams
+    }
+    RETURN total_goals, total_assists, total_matches, yellow_cards, red_cards, teams
     """
 
     try:
-        params = {"player_id": player_id}
-        if season:
-            params["season"] = season
-
-        # Execute all queries
-        player_result = await db.execute_query(player_query, params)
-        if not player_result:
-            logger.warning(f"Player not found: {player_id}")
+        params = {"player_id": player_id, "season": season}
+
+        # Execute all queries; the player lookup is batched with concurrent calls
+        player, snapshot_result = await asyncio.gather(
+            player_loader.load(player_id),
+            db.execute_query(snapshot_query, {
+                "player_id": player_id,
+                "snapshot_season": snapshot_season(season),
+                "definition": PLAYER_STATS_DEFINITION
+            })
+        )
+        if player is None:
+            logger.warning("Player not found: %s", player_id)
             return {"error": f"Player {player_id} not found"}
 
-        goals_result = await db.execute_query(goals_query, params)
-        assists_result = await db.execute_query(assists_query, params)
-        matches_result = await db.execute_query(matches_query, params)
-        cards_result = await db.execute_query(cards_query, params)
-        teams_result = await db.execute_query(teams_query, params)
-
-        # Process cards
-        yellow_cards = 0
-        red_cards = 0
-        for card in cards_result:
-            if card.get("card_type") == "Yellow":
-                yellow_cards = card.get("count", 0)
-            elif card.get("card_type") == "Red":
-                red_cards = card.get("count", 0)
+        if snapshot_result:
+            logger.info("Using stats snapshot for player %s", player_id)
+            return {
+                "player_id": player["player_id"],
+                "player_name": player["name"],
+                "position": player.get("position"),
+                "season": season,
+                **snapshot_result[0]["snapshot"]
+            }
+
+        stats_result = await db.execute_query(stats_query, params)
 
         # Build stats response
         stats = {
-            "player_id": player_result[0]["player_id"],
-            "player_name": player_result[0]["name"],
-            "position": player_result[0].get("position"),
+            "player_id": player["player_id"],
+            "player_name": player["name"],
+            "position": player.get("position"),
             "season": season,
-            "total_goals": goals_result[0].get("total_goals", 0) if goals_result else 0,
-            "total_assists": assists_result[0].get("total_assists", 0) if assists_result else 0,
-            "total_matches": matches_result[0].get("total_matches", 0) if matches_result else 0,
-            "yellow_cards": yellow_cards,
-            "red_cards": red_cards,
-            "teams": [t["team_name"] for t in teams_result]
+            **stats_result[0]
         }
 
-        logger.info(f"Retrieved stats for player {player_id}: {stats['total_goals']} goals, {stats['total_matches']} matches")
+        logger.info("Retrieved stats for player %s: %s goals, %s matches", player_id, stats['total_goals'], stats['total_matches'])
         return stats
 
     except Exception as e:
-        logger.error(f"Error getting player stats: {e}")
+        logger.error("Error getting player stats: %s", e)
         raise
 
 
+@async_ttl_cache()
 async def get_player_career(player_id: str) -> Dict[str, Any]:
     """
     Get complete career history for a player.
@@ -247,59 +254,75 @@ async def get_player_career(player_id: str) -> Dict[str, Any]:
         >>> career = await get_player_career(player_id="P12345")
     """
     db = get_db()
-    logger.info(f"Getting career history for player: {player_id}")
+    logger.info("Getting career history for player: %s", player_id)
 
-    # Get player info with teams
-    query = """
+    # Teams played for and transfers (matching FROM/TO legs by date) in one
+    # round-trip
+    career_query = """
     MATCH (p:Player {player_id: $player_id})
-    OPTIONAL MATCH (p)-[pf:PLAYS_FOR]->(t:Team)
-    OPTIONAL MATCH (p)-[tf:TRANSFERRED_FROM]->(from_team:Team)
-    OPTIONAL MATCH (p)-[tt:TRANSFERRED_TO]->(to_team:Team)
-    WHERE tf.transfer_date = tt.transfer_date
-    RETURN p,
-           collect(DISTINCT {
-               team_id: t.team_id,
-               team_name: t.name,
-               from_date: pf.from_date,
-               to_date: pf.to_date,
-               jersey_number: pf.jersey_number
-           }) AS teams,
-           collect(DISTINCT {
-               from_team: from_team.name,
-               to_team: to_team.name,
-               transfer_date: tf.transfer_date,
-               fee: tf.fee,
-               loan: tf.loan
-           }) AS transfers
+    CALL {
+        WITH p
+        MATCH (p)-[pf:PLAYS_FOR]->(t:Team)
+        WITH DISTINCT t, pf
+        RETURN collect({
+            team_id: t.team_id,
+            team_name: t.name,
+            from_date: pf.from_date,
+            to_date: pf.to_date,
+            jersey_number: pf.jersey_number
+        }) AS teams
+    }
+    CALL {
+        WITH p
+        MATCH (p)-[tf:TRANSFERRED_FROM]->(from_team:Team)
+        MATCH (p)-[tt:TRANSFERRED_TO]->(to_team:Team)
+        WHERE tf.transfer_date = tt.transfer_date
+        WITH DISTINCT from_team, to_team, tf
+        RETURN collect({
+            from_team: from_team.name,
+            to_team: to_team.name,
+            transfer_date: tf.transfer_date,
+            fee: tf.fee,
+            loan: tf.loan
+        }) AS transfers
+    }
+    RETURN teams, transfers
     """
 
     try:
-        result = await db.execute_query(query, {"player_id": player_id})
+        params = {"player_id": player_id}
 
-        if not result:
-            logger.warning(f"Player not found: {player_id}")
-            return {"error": f"Player {player_id} not found"}
+        # Independent reads, run concurrently; stats are all-time and come
+        # from get_player_stats so its snapshot is used when there is one
+        player, career_result, stats = await asyncio.gather(
+            player_loader.load(player_id),
+            db.execute_query(career_query, params),
+            get_player_stats(player_id)
+        )
 
-        player_data = result[0]
+        if player is None:
+            logger.warning("Player not found: %s", player_id)
+            return {"error": f"Player {player_id} not found"}
 
-        # Get career stats (all-time)
-        stats = await get_player_stats(player_id)
+        teams = career_result[0]["teams"] if career_result else []
+        transfers = career_result[0]["transfers"] if career_result else []
 
         career = {
-            "player": player_data["p"],
-            "teams": [t for t in player_data["teams"] if t.get("team_name")],
-            "transfers": [t for t in player_data["transfers"] if t.get("from_team")],
+            "player": player,
+            "teams": [t for t in teams if t.get("team_name")],
+            "transfers": [t for t in transfers if t.get("from_team")],
             "career_stats": stats
         }
 
-        logger.info(f"Retrieved career for player {player_id}: {len(career['teams'])} teams")
+        logger.info("Retrieved career for player %s: %s teams", player_id, len(career['teams']))
         return career
 
     except Exception as e:
-        logger.error(f"Error getting player career: {e}")
+        logger.error("Error getting player career: %s", e)
         raise
 
 
+@async_ttl_cache()
 async def get_player_transfers(
     player_id: str,
     year: Optional[int] = None
@@ -321,7 +344,7 @@ async def get_player_transfers(
         >>> transfers = await get_player_transfers(player_id="P12345", year=2023)
     """
     db = get_db()
-    logger.info(f"Getting transfers for player: {player_id}, year: {year}")
+    logger.info("Getting transfers for player: %s, year: %s", player_id, year)
 
     query = """
     MATCH (p:Player {player_id: $player_id})-[tf:TRANSFERRED_FROM]->(from_team:Team)
@@ -345,8 +368,8 @@ async def get_player_transfers(
 
     try:
         results = await db.execute_query(query, params)
-        logger.info(f"Found {len(results)} transfers for player {player_id}")
+        logger.info("Found %s transfers for player %s", len(results), player_id)
         return results
     except Exception as e:
-        logger.error(f"Error getting player transfers: {e}")
+        logger.error("Error getting player transfers: %s", e)
         raise
@@ -13,6 +13,7 @@ CYPHER PATTERNS:
 - MATCH (p:Player)-[:PLAYS_FOR]->(t) for roster
 - MATCH (t)-[:COMPETED_IN]->(m:Match) for matches
 - MATCH (m)-[:PART_OF]->(c:Competition) for competitions
+- MATCH (s:TeamStatsSnapshot) for pre-aggregated stats (src.snapshots)
 
 DEPENDENCIES:
 - src.database: Database connection management
@@ -29,13 +30,18 @@ USAGE:
 """
 
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
+from src.cache import async_ttl_cache
 from src.database import get_db
+from src.dataloader import team_loader
 from src.config import settings
+from src.snapshots import TEAM_STATS_DEFINITION, snapshot_season
 
 logger = logging.getLogger(__name__)
 
 
+@async_ttl_cache(maxsize=2048)
 async def search_team(
     name: str,
     city: Optional[str] = None,
@@ -57,7 +63,7 @@ async def search_team(
         >>> teams = await search_team(name="FC", city="São Paulo")
     """
     db = get_db()
-    logger.info(f"Searching for team: name={name}, city={city}")
+    logger.info("Searching for team: name=%s, city=%s", name, city)
 
     query = """
     MATCH (t:Team)
@@ -83,10 +89,10 @@ async def search_team(
 
     try:
         results = await db.execute_query(query, params)
-        logger.info(f"Found {len(results)} teams matching search criteria")
+        logger.info("Found %s teams matching search criteria", len(results))
         return results
     except Exception as e:
-        logger.error(f"Error searching for teams: {e}")
+        logger.error("Error searching for teams: %s", e)
         raise
 
 
@@ -102,23 +108,15 @@ async def get_team_roster(
         season: Specific season to filter (optional, format: "2023")
 
     Returns:
-        Dictionary with team info and list of players
+        Dictionary with team info and players grouped by position
+        (positions sorted by name, players by jersey number)
 
     Example:
         >>> roster = await get_team_roster(team_id="T001")
         >>> roster = await get_team_roster(team_id="T001", season="2023")
     """
     db = get_db()
-    logger.info(f"Getting roster for team: {team_id}, season: {season}")
-
-    # Get team info
-    team_query = """
-    MATCH (t:Team {team_id: $team_id})
-    RETURN t.team_id AS team_id,
-           t.name AS name,
-           t.city AS city,
-           t.stadium AS stadium
-    """
+    logger.info("Getting roster for team: %s, season: %s", team_id, season)
 
     # Get players
     players_query = """
@@ -135,36 +133,45 @@ async def get_team_roster(
         """
         params["year"] = int(season)
 
+    # Group and sort in the database so callers just iterate
     players_query += """
-    RETURN p.player_id AS player_id,
-           p.name AS name,
-           p.position AS position,
-           pf.jersey_number AS jersey_number,
-           pf.from_date AS from_date,
-           pf.to_date AS to_date
-    ORDER BY p.position, pf.jersey_number
+    WITH coalesce(p.position, 'Unknown') AS position, p, pf
+    ORDER BY pf.jersey_number
+    RETURN position,
+           collect({
+               player_id: p.player_id,
+               name: p.name,
+               jersey_number: pf.jersey_number,
+               from_date: pf.from_date,
+               to_date: pf.to_date
+           }) AS players
+    ORDER BY position
     """
 
     try:
-        team_result = await db.execute_query(team_query, params)
-        if not team_result:
-            logger.warning(f"Team not found: {team_id}")
+        # Team lookup is batched with concurrent calls; players run alongside
+        team, positions_result = await asyncio.gather(
+            team_loader.load(team_id),
+            db.execute_query(players_query, params)
+        )
+        if team is None:
+            logger.warning("Team not found: %s", team_id)
             return {"error": f"Team {team_id} not found"}
 
-        players_result = await db.execute_query(players_query, params)
+        total_players = sum(len(group["players"]) for group in positions_result)
 
         roster = {
-            "team": team_result[0],
+            "team": team,
             "season": season,
-            "players": players_result,
-            "total_players": len(players_result)
+            "positions": positions_result,
+            "total_players": total_players
         }
 
-        logger.info(f"Retrieved roster for team {team_id}: {len(players_result)} players")
+        logger.info("Retrieved roster for team %s: %s players", team_id, total_players)
         return roster
 
     except Exception as e:
-        logger.error(f"Error getting team roster: {e}")
+        logger.error("Error getting team roster: %s", e)
         raise
 
 
@@ -190,12 +197,16 @@ async def get_team_stats(
         >>> stats = await get_team_stats(team_id="T001", season="2023")
     """
     db = get_db()
-    logger.info(f"Getting stats for team: {team_id}, season: {season}")
-
-    # Team info
-    team_query = """
-    MATCH (t:Team {team_id: $team_id})
-    RETURN t.team_id AS team_id, t.name AS name
+    logger.info("Getting stats for team: %s, season: %s", team_id, season)
+
+    # Pre-aggregated snapshot, when one exists
+    snapshot_query = """
+    MATCH (s:TeamStatsSnapshot {
+        team_id: $team_id, season: $snapshot_season, definition: $definition
+    })
+    RETURN s {.total_matches, .wins, .draws, .losses, .goals_scored,
+              .goals_conceded, .home_matches, .home_wins,
+              .away_matches, .away_wins} AS snapshot
     """
 
     # Matches statistics query
@@ -238,12 +249,24 @@ async def get_team_stats(
     """
 
     try:
-        team_result = await db.execute_query(team_query, params)
-        if not team_result:
-            logger.warning(f"Team not found: {team_id}")
+        # Team lookup is batched with concurrent calls
+        team, snapshot_result = await asyncio.gather(
+            team_loader.load(team_id),
+            db.execute_query(snapshot_query, {
+                "team_id": team_id,
+                "snapshot_season": snapshot_season(season),
+                "definition": TEAM_STATS_DEFINITION
+            })
+        )
+        if team is None:
+            logger.warning("Team not found: %s", team_id)
             return {"error": f"Team {team_id} not found"}
 
-        stats_result = await db.execute_query(stats_query, params)
+        if snapshot_result:
+            logger.info("Using stats snapshot for team %s", team_id)
+            stats_result = [snapshot_result[0]["snapshot"]]
+        else:
+            stats_result = await db.execute_query(stats_query, params)
 
         if not stats_result or stats_result[0]["total_matches"] == 0:
             stats_data = {
@@ -269,8 +292,8 @@ async def get_team_stats(
         goals_conceded = stats_data["goals_conceded"]
 
         stats = {
-            "team_id": team_result[0]["team_id"],
-            "team_name": team_result[0]["name"],
+            "team_id": team["team_id"],
+            "team_name": team["name"],
             "season": season,
             "total_matches": total_matches,
             "wins": wins,
@@ -291,11 +314,11 @@ async def get_team_stats(
             }
         }
 
-        logger.info(f"Retrieved stats for team {team_id}: {wins}W {draws}D {stats_data['losses']}L")
+        logger.info("Retrieved stats for team %s: %sW %sD %sL", team_id, wins, draws, stats_data['losses'])
         return stats
 
     except Exception as e:
-        logger.error(f"Error getting team stats: {e}")
+        logger.error("Error getting team stats: %s", e)
         raise
 
 
@@ -321,7 +344,7 @@ async def get_team_history(
         >>> history = await get_team_history(team_id="T001")
     """
     db = get_db()
-    logger.info(f"Getting history for team: {team_id}")
+    logger.info("Getting history for team: %s", team_id)
 
     # Team info with stadium
     team_query = """
@@ -360,7 +383,7 @@ async def get_team_history(
 
         team_result = await db.execute_query(team_query, params)
         if not team_result:
-            logger.warning(f"Team not found: {team_id}")
+            logger.warning("Team not found: %s", team_id)
             return {"error": f"Team {team_id} not found"}
 
         competitions_result = await db.execute_query(competitions_query, params)
@@ -380,9 +403,9 @@ async def get_team_history(
         all_time_stats = await get_team_stats(team_id)
         history["all_time_stats"] = all_time_stats
 
-        logger.info(f"Retrieved history for team {team_id}: {len(competitions_result)} competitions")
+        logger.info("Retrieved history for team %s: %s competitions", team_id, len(competitions_result))
         return history
 
     except Exception as e:
-        logger.error(f"Error getting team history: {e}")
+        logger.error("Error getting team history: %s", e)
         raise
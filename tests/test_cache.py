@@ -0,0 +1,296 @@
+"""
+Unit Tests for the Tool Result Cache
+
+This module tests src.cache.async_ttl_cache with patched settings and a
+controllable clock, so no Neo4j connection is required.
+
+Context:
+- Hits within the TTL, misses after expiry, LRU eviction at maxsize
+- Single-flight: concurrent identical calls share one execution
+- Failures are not cached; one cancelled caller does not cancel others
+- cache_clear() / clear_caches() drop cached results, including the
+  results of calls still in flight when the cache is cleared
+- Callers get copies, so mutating a result does not change the cache
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src import cache
+from src.cache import async_ttl_cache, clear_caches
+
+
+class FakeClock:
+    """Stand-in for the time module as used by src.cache"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Enable caching with a 60s TTL and a clock the test can advance"""
+    fake_clock = FakeClock()
+    settings = SimpleNamespace(enable_cache=True, cache_ttl=60)
+    monkeypatch.setattr(cache, "get_settings", lambda: settings)
+    monkeypatch.setattr(cache, "time", fake_clock)
+    return fake_clock
+
+
+def counting(fn=None):
+    """Wrap an async function, counting how often it actually runs"""
+    calls = []
+
+    async def wrapped(*args, **kwargs):
+        calls.append((args, kwargs))
+        if fn is not None:
+            return await fn(*args, **kwargs)
+        return {"args": list(args), "kwargs": kwargs}
+
+    return wrapped, calls
+
+
+@pytest.mark.unit
+class TestAsyncTTLCache:
+    """Expiry, eviction, single-flight and invalidation of async_ttl_cache"""
+
+    async def test_hit_within_ttl_and_miss_after_expiry(self, clock):
+        """
+        GIVEN: A cached result
+        WHEN: The same call is repeated before and after the TTL
+        THEN: The first repeat is a hit and the second runs the function again
+        """
+        fn, calls = counting()
+
+        @async_ttl_cache()
+        async def lookup(key):
+            return await fn(key)
+
+        await lookup("a")
+        clock.now += 59
+        await lookup("a")
+        assert len(calls) == 1
+
+        clock.now += 2
+        await lookup("a")
+        assert len(calls) == 2
+
+    async def test_lru_eviction_at_maxsize(self, clock):
+        """
+        GIVEN: A cache of maxsize 2 holding "a" and "b", with "a" used last
+        WHEN: "c" is cached
+        THEN: "b", the least recently used entry, is evicted
+        """
+        fn, calls = counting()
+
+        @async_ttl_cache(maxsize=2)
+        async def lookup(key):
+            return await fn(key)
+
+        await lookup("a")
+        await lookup("b")
+        await lookup("a")
+        await lookup("c")
+        assert len(calls) == 3
+
+        await lookup("a")
+        assert len(calls) == 3
+        await lookup("b")
+        assert len(calls) == 4
+
+    async def test_concurrent_calls_run_once(self, clock):
+        """
+        GIVEN: Two concurrent calls with the same arguments
+        WHEN: The first is still running
+        THEN: The second awaits the same execution and gets its result
+        """
+        release = asyncio.Event()
+
+        async def slow(key):
+            await release.wait()
+            return key.upper()
+
+        fn, calls = counting(slow)
+
+        @async_ttl_cache()
+        async def lookup(key):
+            return await fn(key)
+
+        first = asyncio.ensure_future(lookup("a"))
+        second = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == ["A", "A"]
+        assert len(calls) == 1
+
+    async def test_exceptions_are_not_cached(self, clock):
+        """
+        GIVEN: A call that raises
+        WHEN: The same call is repeated
+        THEN: The function runs again instead of replaying the failure
+        """
+        attempts = []
+
+        @async_ttl_cache()
+        async def lookup(key):
+            attempts.append(key)
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return key
+
+        with pytest.raises(RuntimeError):
+            await lookup("a")
+        assert await lookup("a") == "a"
+        assert len(attempts) == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self, clock):
+        """
+        GIVEN: Two callers waiting on the same in-flight call
+        WHEN: One of them is cancelled
+        THEN: The other still receives the result, which is then cached
+        """
+        release = asyncio.Event()
+
+        async def slow(key):
+            await release.wait()
+            return key
+
+        fn, calls = counting(slow)
+
+        @async_ttl_cache()
+        async def lookup(key):
+            return await fn(key)
+
+        cancelled = asyncio.ensure_future(lookup("a"))
+        waiting = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        release.set()
+
+        assert await waiting == "a"
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        await lookup("a")
+        assert len(calls) == 1
+
+    async def test_cache_clear_and_clear_caches(self, clock):
+        """
+        GIVEN: Two cached functions with cached results
+        WHEN: cache_clear() is called on one, then clear_caches()
+        THEN: Only that function reruns first, then both rerun
+        """
+        first_fn, first_calls = counting()
+        second_fn, second_calls = counting()
+
+        @async_ttl_cache()
+        async def first(key):
+            return await first_fn(key)
+
+        @async_ttl_cache()
+        async def second(key):
+            return await second_fn(key)
+
+        await first("a")
+        await second("a")
+
+        first.cache_clear()
+        await first("a")
+        await second("a")
+        assert (len(first_calls), len(second_calls)) == (2, 1)
+
+        clear_caches()
+        await first("a")
+        await second("a")
+        assert (len(first_calls), len(second_calls)) == (3, 2)
+
+    async def test_positional_and_keyword_calls_share_a_key(self, clock):
+        """
+        GIVEN: A function with a defaulted argument
+        WHEN: It is called positionally, by keyword and relying on the default
+        THEN: All three calls share one cache entry
+        """
+        fn, calls = counting()
+
+        @async_ttl_cache()
+        async def lookup(name, limit=10):
+            return await fn(name, limit)
+
+        await lookup("Neymar", 10)
+        await lookup(name="Neymar", limit=10)
+        await lookup("Neymar")
+        assert len(calls) == 1
+
+    async def test_callers_get_independent_copies(self, clock):
+        """
+        GIVEN: A cached dict result and two concurrent callers
+        WHEN: Callers mutate the results they receive
+        THEN: Later hits and the other caller still see the original result
+        """
+        release = asyncio.Event()
+
+        async def slow(key):
+            await release.wait()
+            return {"key": key, "rows": [1, 2]}
+
+        fn, calls = counting(slow)
+
+        @async_ttl_cache()
+        async def lookup(key):
+            return await fn(key)
+
+        first = asyncio.ensure_future(lookup("a"))
+        second = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+        release.set()
+        first_result, second_result = await asyncio.gather(first, second)
+
+        first_result["rows"].append(3)
+        first_result.pop("key")
+        assert second_result == {"key": "a", "rows": [1, 2]}
+
+        hit = await lookup("a")
+        hit["rows"].clear()
+        assert await lookup("a") == {"key": "a", "rows": [1, 2]}
+        assert len(calls) == 1
+
+    async def test_clear_during_flight_does_not_store_stale_result(self, clock):
+        """
+        GIVEN: A call in flight when the cache is cleared
+        WHEN: It completes after the clear
+        THEN: Its caller gets the result, but it is not cached, so the next
+              call runs the function again and that result is cached
+        """
+        release = asyncio.Event()
+
+        async def versioned(key):
+            if not release.is_set():
+                await release.wait()
+                return "stale"
+            return "fresh"
+
+        fn, calls = counting(versioned)
+
+        @async_ttl_cache()
+        async def lookup(key):
+            return await fn(key)
+
+        in_flight = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+
+        lookup.cache_clear()
+        release.set()
+        assert await in_flight == "stale"
+
+        assert await lookup("a") == "fresh"
+        assert await lookup("a") == "fresh"
+        assert len(calls) == 2
@@ -0,0 +1,143 @@
+"""
+Unit Tests for the Request-Coalescing Loaders
+
+This module tests src.dataloader against a fake database, so no Neo4j
+connection is required.
+
+Context:
+- Concurrent load() calls in one tick must cost a single IN $ids query
+- Keys are deduplicated per batch; unknown ids resolve to None
+- A failed or wrong-length batch fails every waiting load() call
+"""
+
+import asyncio
+
+import pytest
+
+from src import dataloader
+from src.dataloader import DataLoader, NodeLoader
+
+
+class FakeDB:
+    """Records execute_query calls and answers them from a fixed node table"""
+
+    def __init__(self, nodes=None, error=None):
+        self.nodes = nodes or {}
+        self.error = error
+        self.calls = []
+
+    async def execute_query(self, query, parameters=None):
+        self.calls.append((query, parameters))
+        if self.error is not None:
+            raise self.error
+        return [
+            {"id": key, "node": self.nodes[key]}
+            for key in parameters["ids"] if key in self.nodes
+        ]
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Fake database returned by get_db() inside src.dataloader"""
+    db = FakeDB(nodes={
+        "P001": {"player_id": "P001", "name": "Gabriel Barbosa"},
+        "P002": {"player_id": "P002", "name": "Éverton Ribeiro"},
+    })
+    monkeypatch.setattr(dataloader, "get_db", lambda: db)
+    return db
+
+
+@pytest.mark.unit
+class TestDataLoader:
+    """Batching, deduplication and error propagation of NodeLoader"""
+
+    async def test_concurrent_loads_share_one_query(self, fake_db):
+        """
+        GIVEN: Several load() calls made in the same event-loop tick
+        WHEN: They are awaited together
+        THEN: One IN $ids query resolves all of them
+        """
+        loader = NodeLoader("Player", "player_id")
+
+        first, second = await asyncio.gather(loader.load("P001"), loader.load("P002"))
+
+        assert first["name"] == "Gabriel Barbosa"
+        assert second["name"] == "Éverton Ribeiro"
+        assert len(fake_db.calls) == 1
+        query, params = fake_db.calls[0]
+        assert "IN $ids" in query
+        assert params == {"ids": ["P001", "P002"]}
+
+    async def test_duplicate_keys_are_deduplicated(self, fake_db):
+        """
+        GIVEN: The same key loaded several times in one tick
+        WHEN: The batch runs
+        THEN: The key is queried once and every caller gets the node
+        """
+        loader = NodeLoader("Player", "player_id")
+
+        results = await asyncio.gather(*(loader.load("P001") for _ in range(3)))
+
+        assert [r["player_id"] for r in results] == ["P001"] * 3
+        assert fake_db.calls[0][1] == {"ids": ["P001"]}
+
+    async def test_missing_id_resolves_to_none(self, fake_db):
+        """
+        GIVEN: A key with no matching node
+        WHEN: It is loaded alongside an existing key
+        THEN: It resolves to None and the other key still resolves
+        """
+        loader = NodeLoader("Player", "player_id")
+
+        found, missing = await asyncio.gather(loader.load("P001"), loader.load("P999"))
+
+        assert found["player_id"] == "P001"
+        assert missing is None
+
+    async def test_batch_error_reaches_every_waiter(self, fake_db):
+        """
+        GIVEN: A batch query that fails
+        WHEN: Several load() calls wait on that batch
+        THEN: Each of them raises the batch's exception
+        """
+        fake_db.error = RuntimeError("database unavailable")
+        loader = NodeLoader("Player", "player_id")
+
+        results = await asyncio.gather(
+            loader.load("P001"), loader.load("P002"), return_exceptions=True
+        )
+
+        assert len(results) == 2
+        for result in results:
+            assert isinstance(result, RuntimeError)
+            assert str(result) == "database unavailable"
+
+    async def test_wrong_length_batch_fails_every_waiter(self):
+        """
+        GIVEN: A batch_load that returns fewer values than keys
+        WHEN: Several load() calls wait on that batch
+        THEN: Each of them raises ValueError instead of hanging
+        """
+        class ShortLoader(DataLoader):
+            async def batch_load(self, keys):
+                return keys[:-1]
+
+        loader = ShortLoader()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(loader.load("P001"), loader.load("P002"), return_exceptions=True),
+            timeout=1
+        )
+
+        assert len(results) == 2
+        for result in results:
+            assert isinstance(result, ValueError)
+
+    def test_batch_load_is_abstract(self):
+        """
+        GIVEN: The DataLoader base class
+        WHEN: It is instantiated without a batch_load implementation
+        THEN: TypeError is raised
+        """
+        with pytest.raises(TypeError):
+            DataLoader()